@@ -14,11 +14,16 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Collection, Sequence
+from collections.abc import Callable, Collection, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 import logging
+import multiprocessing
+from typing import Literal, overload, TYPE_CHECKING
 
 from .architecture_exporter import ArchitectureExporter
 from .architecture_loaded import NodeValuesLoaded
+from .architecture_snapshot import ArchitectureSnapshot
 from .combine_path import CombinePath
 
 from .reader_interface import ArchitectureReader, IGNORE_TOPICS
@@ -34,39 +39,98 @@ from ..value_objects import (CallbackGroupStructValue, CallbackStructValue,
                              PublisherStructValue, ServiceStructValue, SubscriptionStructValue)
 from ..value_objects.node import DiffNode
 
+if TYPE_CHECKING:
+    from .graph_search import NodePathSearcher
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_MAX_CALLBACK_CONSTRUCTION_ORDER_ON_PATH_SEARCHING = 10
 
+# Searcher inherited by the worker processes of Architecture.search_paths_many.
+_forked_path_searcher: NodePathSearcher | None = None
+
+
+def _search_paths_in_forked_process(
+    node_names: tuple[str, ...],
+    max_node_depth: int
+) -> list[PathStructValue]:
+    assert _forked_path_searcher is not None
+    return [v.to_value() for v in
+            _forked_path_searcher.search(*node_names, max_node_depth=max_node_depth)]
+
 
 class Architecture(Summarizable):
+
+    # When the depth is 15, the process takes only a few seconds.
+    _DEFAULT_MAX_NODE_DEPTH = 15
+    _MAX_CACHED_PATH_SEARCHERS = 8
+    _MSG_DETAIL_PAGE = (
+        'For details, '
+        'see https://tier4.github.io/caret_doc/latest/configuration/inter_node_data_path/.'
+    )
+
     def __init__(
         self,
         file_type: str,
         file_path: str,
-        max_callback_construction_order_on_path_searching: int =
-            DEFAULT_MAX_CALLBACK_CONSTRUCTION_ORDER_ON_PATH_SEARCHING
+        max_callback_construction_order_on_path_searching: int = (
+            DEFAULT_MAX_CALLBACK_CONSTRUCTION_ORDER_ON_PATH_SEARCHING),
+        use_cache: bool = False
     ) -> None:
-        from .architecture_reader_factory import ArchitectureReaderFactory
-        from .architecture_loaded import ArchitectureLoaded
-
-        self._max_callback_construction_order_on_path_searching = \
-            max_callback_construction_order_on_path_searching
+        """
+        Construct an instance.
 
-        # /parameter events and /rosout measurements are not yet supported.
-        ignore_topics: list[str] = IGNORE_TOPICS
+        Parameters
+        ----------
+        file_type : str
+            type of the file to load. [yaml/lttng/snapshot]
+        file_path : str
+            path to the file.
+        max_callback_construction_order_on_path_searching : int
+            maximum construction order of callbacks searched in node paths.
+        use_cache : bool
+            If True, the parsed yaml file is cached in a sidecar file next to it,
+            so that loading the same file again skips parsing. Only used for yaml.
 
-        reader = ArchitectureReaderFactory.create_instance(
-            file_type, file_path)
-        loaded = ArchitectureLoaded(reader,
-                                    ignore_topics,
-                                    max_callback_construction_order_on_path_searching)
+        """
+        from .architecture_reader_factory import ArchitectureReaderFactory
+        from .architecture_loaded import ArchitectureLoaded
 
-        self._nodes: list[NodeStruct] = loaded.nodes
-        self._communications: list[CommunicationStruct] = loaded.communications
-        self._executors: list[ExecutorStruct] = loaded.executors
-        self._paths = loaded.paths
-        self._verify(self._nodes)
+        self._nodes: list[NodeStruct]
+        self._communications: list[CommunicationStruct]
+        self._executors: list[ExecutorStruct]
+        self._paths: list[PathStruct]
+
+        if file_type == 'snapshot':
+            # Snapshots hold the resolved structs, so neither reading nor path search is needed.
+            snapshot = ArchitectureSnapshot.load(file_path)
+            self._max_callback_construction_order_on_path_searching = \
+                snapshot.max_callback_construction_order_on_path_searching
+            self._nodes = snapshot.nodes
+            self._communications = snapshot.communications
+            self._executors = snapshot.executors
+            self._paths = snapshot.paths
+        else:
+            self._max_callback_construction_order_on_path_searching = \
+                max_callback_construction_order_on_path_searching
+
+            # /parameter events and /rosout measurements are not yet supported.
+            ignore_topics: list[str] = IGNORE_TOPICS
+
+            reader = ArchitectureReaderFactory.create_instance(
+                file_type, file_path, use_cache)
+            loaded = ArchitectureLoaded(reader,
+                                        ignore_topics,
+                                        max_callback_construction_order_on_path_searching)
+
+            self._nodes = loaded.nodes
+            self._communications = loaded.communications
+            self._executors = loaded.executors
+            self._paths = loaded.paths
+            self._verify(self._nodes)
+        # Path searchers for the current nodes and communications, keyed by the filters.
+        self._path_searchers: dict[tuple[Callable | None, Callable | None],
+                                   NodePathSearcher] = {}
 
     def get_node(self, node_name: str) -> NodeStructValue:
         try:
@@ -183,6 +247,7 @@ class Architecture(Summarizable):
 
         named_path_info = PathStruct(path_name, child)
         self._paths.append(named_path_info)
+        self._invalidate_path_searchers()
 
     def remove_path(self, path_name: str) -> None:
         if path_name not in self.path_names:
@@ -195,6 +260,7 @@ class Architecture(Summarizable):
 
         if idx is not None:
             self._paths.pop(idx)
+        self._invalidate_path_searchers()
 
     def update_path(self, path_name: str, path: PathStructValue) -> None:
         if path.path_name is None:
@@ -257,6 +323,28 @@ class Architecture(Summarizable):
             self.nodes, self.executors, self.paths, force)
         exporter.execute(file_path)
 
+    def export_snapshot(self, file_path: str, force: bool = False) -> None:
+        """
+        Export the architecture as a binary snapshot.
+
+        The snapshot keeps searched node paths and named paths,
+        and is loaded by Architecture('snapshot', file_path) without re-searching.
+        It is intended as a cache, e.g. for jobs loading the same architecture repeatedly;
+        use export for a human-readable and editable file.
+
+        Parameters
+        ----------
+        file_path : str
+            destination path.
+        force : bool
+            If True, an existing file is overwritten.
+
+        """
+        snapshot = ArchitectureSnapshot(
+            self._nodes, self._communications, self._executors, self._paths,
+            self._max_callback_construction_order_on_path_searching, force)
+        snapshot.execute(file_path)
+
     def search_paths(
         self,
         *node_names: str,
@@ -264,19 +352,222 @@ class Architecture(Summarizable):
         node_filter: Callable[[str], bool] | None = None,
         communication_filter: Callable[[str], bool] | None = None,
     ) -> list[PathStructValue]:
+        max_node_depth = max_node_depth or self._DEFAULT_MAX_NODE_DEPTH
+        path_searcher = self._get_path_searcher(
+            node_names, max_node_depth, node_filter, communication_filter)
+
+        # Search
+        paths = [v.to_value() for v in
+                 path_searcher.search(*node_names, max_node_depth=max_node_depth)]
+
+        self._print_search_completed(max_node_depth)
+
+        return paths
+
+    def search_paths_many(
+        self,
+        queries: Sequence[Sequence[str]],
+        *,
+        max_node_depth: int | None = None,
+        node_filter: Callable[[str], bool] | None = None,
+        communication_filter: Callable[[str], bool] | None = None,
+        max_workers: int | None = None,
+    ) -> dict[tuple[str, ...], list[PathStructValue]]:
+        """
+        Search paths for multiple queries in parallel.
+
+        The queries are searched in worker processes forked from this process,
+        so that the graph is shared without being copied for each query.
+        They are searched one after another if fork is not available on the platform.
+
+        Parameters
+        ----------
+        queries : Sequence[Sequence[str]]
+            Node names of each search, given as for search_paths.
+        max_node_depth : int | None
+            Maximum depth of the search.
+        node_filter : Callable[[str], bool] | None
+            Condition on node names to be searched.
+        communication_filter : Callable[[str], bool] | None
+            Condition on topic names to be searched.
+        max_workers : int | None
+            Maximum number of worker processes. The number of CPUs is used if None.
+
+        Returns
+        -------
+        dict[tuple[str, ...], list[PathStructValue]]
+            Found paths for each query.
+
+        Raises
+        ------
+        ItemNotFoundError
+            Occurs when a given node is not found.
+        InvalidArgumentError
+            Occurs when a query has less than two nodes.
+
+        """
+        keys = list(dict.fromkeys(tuple(query) for query in queries))
+        for key in keys:
+            if len(key) < 2:
+                raise InvalidArgumentError(f'query must have at least 2 nodes. {key}')
+
+        max_node_depth = max_node_depth or self._DEFAULT_MAX_NODE_DEPTH
+        path_searcher = self._get_path_searcher(
+            tuple(Util.flatten(keys)), max_node_depth, node_filter, communication_filter)
+
+        results: list[list[PathStructValue]]
+        if len(keys) <= 1 or max_workers == 1 or \
+                'fork' not in multiprocessing.get_all_start_methods():
+            results = [
+                [v.to_value() for v in path_searcher.search(*key, max_node_depth=max_node_depth)]
+                for key in keys
+            ]
+        else:
+            global _forked_path_searcher
+            _forked_path_searcher = path_searcher
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    mp_context=multiprocessing.get_context('fork')
+                ) as executor:
+                    results = list(executor.map(
+                        _search_paths_in_forked_process, keys, [max_node_depth] * len(keys)))
+            finally:
+                _forked_path_searcher = None
+
+        self._print_search_completed(max_node_depth)
+
+        return dict(zip(keys, results))
+
+    def _print_search_completed(self, max_node_depth: int) -> None:
+        msg = f'A search up to depth {max_node_depth} has been completed. '
+        msg += (
+            'If the paths you want to measure cannot be found, '
+            'consider specifying intermediate nodes. '
+        )
+        msg += 'Also, if the number of paths is too large, consider filtering node/topic names. '
+        msg += self._MSG_DETAIL_PAGE
+        print(msg)
+
+    @overload
+    def iter_search_paths(
+        self,
+        *node_names: str,
+        max_node_depth: int | None = None,
+        node_filter: Callable[[str], bool] | None = None,
+        communication_filter: Callable[[str], bool] | None = None,
+        predicate: Callable[[PathStructValue], bool] | None = None,
+        limit: int | None = None,
+        count_only: Literal[False] = False,
+    ) -> Iterator[PathStructValue]: ...
+
+    @overload
+    def iter_search_paths(
+        self,
+        *node_names: str,
+        max_node_depth: int | None = None,
+        node_filter: Callable[[str], bool] | None = None,
+        communication_filter: Callable[[str], bool] | None = None,
+        predicate: Callable[[PathStructValue], bool] | None = None,
+        limit: int | None = None,
+        count_only: Literal[True],
+    ) -> int: ...
+
+    @overload
+    def iter_search_paths(
+        self,
+        *node_names: str,
+        max_node_depth: int | None = None,
+        node_filter: Callable[[str], bool] | None = None,
+        communication_filter: Callable[[str], bool] | None = None,
+        predicate: Callable[[PathStructValue], bool] | None = None,
+        limit: int | None = None,
+        count_only: bool = False,
+    ) -> Iterator[PathStructValue] | int: ...
+
+    def iter_search_paths(
+        self,
+        *node_names: str,
+        max_node_depth: int | None = None,
+        node_filter: Callable[[str], bool] | None = None,
+        communication_filter: Callable[[str], bool] | None = None,
+        predicate: Callable[[PathStructValue], bool] | None = None,
+        limit: int | None = None,
+        count_only: bool = False,
+    ) -> Iterator[PathStructValue] | int:
+        """
+        Search paths lazily.
+
+        Paths are yielded as they are found, so that the search stops
+        as soon as the caller stops iterating.
+
+        Parameters
+        ----------
+        *node_names : str
+            Node names that the paths pass through, in order.
+        max_node_depth : int | None
+            Maximum depth of the search.
+        node_filter : Callable[[str], bool] | None
+            Condition on node names to be searched.
+        communication_filter : Callable[[str], bool] | None
+            Condition on topic names to be searched.
+        predicate : Callable[[PathStructValue], bool] | None
+            Condition on each found path. Paths that do not satisfy it are skipped.
+        limit : int | None
+            Maximum number of paths. Unlimited if None.
+        count_only : bool
+            If True, return the number of paths instead of the paths.
+            Found paths are not converted unless predicate is given.
+
+        Returns
+        -------
+        Iterator[PathStructValue] | int
+            Found paths, or the number of paths if count_only is True.
+
+        Raises
+        ------
+        ItemNotFoundError
+            Occurs when a given node is not found.
+        InvalidArgumentError
+            Occurs when limit is negative.
+
+        """
+        if limit is not None and limit < 0:
+            raise InvalidArgumentError(f'limit must be non-negative. limit: {limit}')
+
+        max_node_depth = max_node_depth or self._DEFAULT_MAX_NODE_DEPTH
+        path_searcher = self._get_path_searcher(
+            node_names, max_node_depth, node_filter, communication_filter)
+
+        if count_only and predicate is None:
+            return path_searcher.count(*node_names, max_node_depth=max_node_depth, limit=limit)
+
+        paths: Iterator[PathStructValue] = (
+            v.to_value() for v in
+            path_searcher.iter_search(*node_names, max_node_depth=max_node_depth))
+        if predicate is not None:
+            paths = filter(predicate, paths)
+        if limit is not None:
+            paths = islice(paths, limit)
+
+        if count_only:
+            return sum(1 for _ in paths)
+        return paths
+
+    def _get_path_searcher(
+        self,
+        node_names: tuple[str, ...],
+        max_node_depth: int,
+        node_filter: Callable[[str], bool] | None,
+        communication_filter: Callable[[str], bool] | None,
+    ) -> NodePathSearcher:
         from .graph_search import NodePathSearcher
         for node_name in node_names:
             if node_name not in self.node_names:
                 raise ItemNotFoundError(f'Failed to find node. {node_name}')
 
-        default_depth = 15  # When the depth is 15, the process takes only a few seconds.
-        max_node_depth = max_node_depth or default_depth
-
         # Print message before search
-        msg_detail_page = (
-            'For details, '
-            'see https://tier4.github.io/caret_doc/latest/configuration/inter_node_data_path/.'
-        )
+        default_depth = self._DEFAULT_MAX_NODE_DEPTH
         if max_node_depth > default_depth:
             msg = (
                 f"Argument 'max_node_depth' greater than {default_depth} is not recommended "
@@ -287,26 +578,21 @@ class Architecture(Summarizable):
                 f'If you are searching for paths that exceeds the depth {default_depth}, '
                 'consider specifying an intermediate node. '
             )
-            msg += msg_detail_page
+            msg += self._MSG_DETAIL_PAGE
             print(msg)
 
-        # Search
-        path_searcher = NodePathSearcher(
-            tuple(self._nodes), tuple(self._communications), node_filter, communication_filter)
-        paths = [v.to_value() for v in
-                 path_searcher.search(*node_names, max_node_depth=max_node_depth)]
+        key = (node_filter, communication_filter)
+        if key not in self._path_searchers:
+            if len(self._path_searchers) >= self._MAX_CACHED_PATH_SEARCHERS:
+                # Drop the oldest one, since filters are often created per call.
+                del self._path_searchers[next(iter(self._path_searchers))]
+            self._path_searchers[key] = NodePathSearcher(
+                tuple(self._nodes), tuple(self._communications),
+                node_filter, communication_filter)
+        return self._path_searchers[key]
 
-        # Print message after search
-        msg = f'A search up to depth {max_node_depth} has been completed. '
-        msg += (
-            'If the paths you want to measure cannot be found, '
-            'consider specifying intermediate nodes. '
-        )
-        msg += 'Also, if the number of paths is too large, consider filtering node/topic names. '
-        msg += msg_detail_page
-        print(msg)
-
-        return paths
+    def _invalidate_path_searchers(self) -> None:
+        self._path_searchers.clear()
 
     @type_check_decorator
     def combine_path(
@@ -398,6 +684,7 @@ class Architecture(Summarizable):
                                 context_reader,
                                 self._max_callback_construction_order_on_path_searching)
                             )
+        self._invalidate_path_searchers()
 
     def insert_publisher_callback(self, node_name: str,
                                   publish_topic_name: str, callback_name: str) -> None:
@@ -424,6 +711,7 @@ class Architecture(Summarizable):
                                 AssignContextReader(node),
                                 self._max_callback_construction_order_on_path_searching)
                             )
+        self._invalidate_path_searchers()
 
     def insert_variable_passing(self, node_name: str,
                                 callback_name_write: str, callback_name_read: str) -> None:
@@ -450,6 +738,7 @@ class Architecture(Summarizable):
                                 AssignContextReader(node),
                                 self._max_callback_construction_order_on_path_searching)
                             )
+        self._invalidate_path_searchers()
 
     def remove_publisher_callback(self, node_name: str,
                                   publish_topic_name: str, callback_name: str) -> None:
@@ -476,6 +765,7 @@ class Architecture(Summarizable):
                                 AssignContextReader(node),
                                 self._max_callback_construction_order_on_path_searching)
                             )
+        self._invalidate_path_searchers()
 
     def remove_variable_passing(self, node_name: str,
                                 callback_name_write: str, callback_name_read: str) -> None:
@@ -514,6 +804,7 @@ class Architecture(Summarizable):
                                     context_reader,
                                     self._max_callback_construction_order_on_path_searching)
                                 )
+            self._invalidate_path_searchers()
 
     def rename_callback(self, src: str, dst: str) -> None:
         """
@@ -532,6 +823,7 @@ class Architecture(Summarizable):
                          Util.flatten([e.callback_groups for e in self._executors]))
         c: CallbackStruct = Util.find_similar_one(src, cb_s, lambda x: x.callback_name)
         c.callback_name = dst
+        self._invalidate_path_searchers()
 
     def rename_node(self, src: str, dst: str) -> None:
         """
@@ -554,6 +846,8 @@ class Architecture(Summarizable):
         for c in self._communications:
             c.rename_node(src, dst)
 
+        self._invalidate_path_searchers()
+
     def rename_path(self, src: str, dst: str) -> None:
         """
         Update path name from "src" to "dst" in architecture.
@@ -568,6 +862,7 @@ class Architecture(Summarizable):
         """
         p: PathStruct = Util.find_similar_one(src, self._paths, lambda x: x.path_name)
         p.path_name = dst
+        self._invalidate_path_searchers()
 
     def rename_executor(self, src: str, dst: str) -> None:
         """
@@ -605,6 +900,8 @@ class Architecture(Summarizable):
         for c in self._communications:
             c.rename_topic(src, dst)
 
+        self._invalidate_path_searchers()
+
     @staticmethod
     def diff_node_names(
         left_arch: Architecture,
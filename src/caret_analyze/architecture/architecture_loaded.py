@@ -524,13 +524,13 @@ class NodeValuesLoaded():
         pubs = node.publishers
         subs = node.subscriptions
         node_path_pub_sub_pairs = NodePathCreated(subs, pubs).data
+        added_pub_sub_construction_order_pairs = {(
+            n.publish_topic_name,
+            n.publisher_construction_order,
+            n.subscribe_topic_name,
+            n.subscription_construction_order,
+        ) for n in node_paths}
         for node_path in node_path_pub_sub_pairs:
-            added_pub_sub_construction_order_pairs = [(
-                n.publish_topic_name,
-                n.publisher_construction_order,
-                n.subscribe_topic_name,
-                n.subscription_construction_order,
-            ) for n in node_paths]
             pub_sub_construction_order_pair = (node_path.publish_topic_name,
                                                node_path.publisher_construction_order,
                                                node_path.subscribe_topic_name,
@@ -538,6 +538,7 @@ class NodeValuesLoaded():
 
             if pub_sub_construction_order_pair not in added_pub_sub_construction_order_pairs:
                 node_paths.append(node_path)
+                added_pub_sub_construction_order_pairs.add(pub_sub_construction_order_pair)
 
                 logger.info(
                     'Path Added: '
@@ -549,9 +550,9 @@ class NodeValuesLoaded():
 
         # add dummy node paths
         logger.info('\n[dummy paths]')
+        added_pub_sub_pairs = {(n.publish_topic_name, n.subscribe_topic_name)
+                               for n in node_paths}
         for pub in node.publishers:
-            added_pub_sub_pairs = [(n.publish_topic_name, n.subscribe_topic_name)
-                                   for n in node_paths]
             node_path = NodePathStruct(
                 node.node_name,
                 None,
@@ -563,6 +564,7 @@ class NodeValuesLoaded():
                             node_path.subscribe_topic_name)
             if pub_sub_pair not in added_pub_sub_pairs:
                 node_paths.append(node_path)
+                added_pub_sub_pairs.add(pub_sub_pair)
                 logger.info(
                     'Path Added: '
                     f'subscribe: {node_path.subscribe_topic_name}, '
@@ -570,8 +572,6 @@ class NodeValuesLoaded():
                 )
 
         for sub in node.subscriptions:
-            added_pub_sub_pairs = [(n.publish_topic_name, n.subscribe_topic_name)
-                                   for n in node_paths]
             node_path = NodePathStruct(
                 node.node_name,
                 sub,
@@ -583,6 +583,7 @@ class NodeValuesLoaded():
                             node_path.subscribe_topic_name)
             if pub_sub_pair not in added_pub_sub_pairs:
                 node_paths.append(node_path)
+                added_pub_sub_pairs.add(pub_sub_pair)
                 logger.info(
                     'Path Added: '
                     f'subscribe: {node_path.subscribe_topic_name}, '
@@ -1615,24 +1616,31 @@ class CallbackPathSearched():
         if callbacks is not None:
             skip_count = 0
             max_ignored_construction_order = 0
-            for write_callback, read_callback in product(callbacks, callbacks):
-                if max_callback_construction_order != 0:
-                    if write_callback.construction_order > max_callback_construction_order or \
-                       read_callback.construction_order > max_callback_construction_order:
-                        skip_count += 1
-                        max_ignored_construction_order = max(
-                            max_ignored_construction_order,
-                            write_callback.construction_order
-                        )
-                        continue
-                searched_paths = searcher.search(write_callback, read_callback, node)
-                for path in searched_paths:
-                    msg = 'Path Added: '
-                    msg += f'subscribe: {path.subscribe_topic_name}, '
-                    msg += f'publish: {path.publish_topic_name}, '
-                    msg += f'callbacks: {path.callback_names}'
-                    logger.info(msg)
-                paths += searched_paths
+            for write_callback in callbacks:
+                read_callbacks = []
+                for read_callback in callbacks:
+                    if max_callback_construction_order != 0:
+                        if max_callback_construction_order < write_callback.construction_order or \
+                           max_callback_construction_order < read_callback.construction_order:
+                            skip_count += 1
+                            max_ignored_construction_order = max(
+                                max_ignored_construction_order,
+                                write_callback.construction_order
+                            )
+                            continue
+                    read_callbacks.append(read_callback)
+                if len(read_callbacks) == 0:
+                    continue
+
+                # All paths from the write callback are searched at once.
+                for searched_paths in searcher.search_from(write_callback, read_callbacks, node):
+                    for path in searched_paths:
+                        msg = 'Path Added: '
+                        msg += f'subscribe: {path.subscribe_topic_name}, '
+                        msg += f'publish: {path.publish_topic_name}, '
+                        msg += f'callbacks: {path.callback_names}'
+                        logger.info(msg)
+                    paths += searched_paths
 
             if skip_count:
                 logger.warn(
@@ -19,9 +19,9 @@ from ..infra.yaml.architecture_reader_yaml import ArchitectureReaderYaml
 class ArchitectureReaderFactory:
 
     @staticmethod
-    def create_instance(file_type: str, file_path: str):
+    def create_instance(file_type: str, file_path: str, use_cache: bool = False):
         if file_type in ['yaml', 'yml']:
-            return ArchitectureReaderYaml(file_path)
+            return ArchitectureReaderYaml(file_path, use_cache)
         elif file_type in ['lttng', 'ctf']:
             return ArchitectureReaderLttng(file_path)
 
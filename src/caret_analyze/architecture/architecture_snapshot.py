@@ -0,0 +1,119 @@
+# Copyright 2021 TIER IV, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import pickle
+
+from .struct import CommunicationStruct, ExecutorStruct, NodeStruct, PathStruct
+from ..exceptions import InvalidArgumentError
+
+
+class ArchitectureSnapshot:
+    """
+    Binary snapshot of resolved architecture structs.
+
+    Unlike the yaml export, the snapshot keeps the searched node paths,
+    message contexts and named paths as they are,
+    so loading it skips the reader and the path search entirely.
+    Snapshots are only readable by the same SCHEMA_VERSION.
+    Snapshots are pickled, so load only snapshots from trusted sources.
+    """
+
+    FORMAT = 'caret_architecture_snapshot'
+    SCHEMA_VERSION = 1
+    PICKLE_PROTOCOL = 5
+
+    def __init__(
+        self,
+        nodes: list[NodeStruct],
+        communications: list[CommunicationStruct],
+        executors: list[ExecutorStruct],
+        paths: list[PathStruct],
+        max_callback_construction_order_on_path_searching: int,
+        force: bool = False
+    ) -> None:
+        self.nodes = nodes
+        self.communications = communications
+        self.executors = executors
+        self.paths = paths
+        self.max_callback_construction_order_on_path_searching = \
+            max_callback_construction_order_on_path_searching
+        self._force = force
+
+    def execute(self, file_path: str) -> None:
+        """
+        Write the snapshot.
+
+        Parameters
+        ----------
+        file_path : str
+            destination path. Existing files are overwritten only if force is True.
+
+        """
+        mode = 'wb' if self._force else 'xb'
+        data = {
+            'format': self.FORMAT,
+            'schema_version': self.SCHEMA_VERSION,
+            'max_callback_construction_order_on_path_searching':
+                self.max_callback_construction_order_on_path_searching,
+            # Pickled together so that structs shared between nodes,
+            # communications and paths stay shared after loading.
+            'structs': (self.nodes, self.communications, self.executors, self.paths),
+        }
+        with open(file_path, mode=mode) as f:
+            pickle.dump(data, f, protocol=self.PICKLE_PROTOCOL)
+
+    @classmethod
+    def load(cls, file_path: str) -> ArchitectureSnapshot:
+        """
+        Read a snapshot.
+
+        Parameters
+        ----------
+        file_path : str
+            path to the snapshot written by execute.
+
+        Returns
+        -------
+        ArchitectureSnapshot
+            loaded snapshot.
+
+        Raises
+        ------
+        InvalidArgumentError
+            The file is not a snapshot or its schema version is not supported.
+
+        """
+        with open(file_path, 'rb') as f:
+            try:
+                data = pickle.load(f)
+            except (pickle.UnpicklingError, EOFError) as e:
+                raise InvalidArgumentError(
+                    f'Failed to load architecture snapshot. {file_path}') from e
+
+        if not isinstance(data, dict) or data.get('format') != cls.FORMAT:
+            raise InvalidArgumentError(f'Not an architecture snapshot. {file_path}')
+
+        schema_version = data.get('schema_version')
+        if schema_version != cls.SCHEMA_VERSION:
+            msg = (
+                'Unsupported architecture snapshot version. '
+                f'version: {schema_version}, supported: {cls.SCHEMA_VERSION}. '
+                'Export the snapshot again.')
+            raise InvalidArgumentError(msg)
+
+        nodes, communications, executors, paths = data['structs']
+        return cls(nodes, communications, executors, paths,
+                   data['max_callback_construction_order_on_path_searching'])
@@ -14,9 +14,8 @@
 
 from __future__ import annotations
 
-from collections import defaultdict, UserList
-from collections.abc import Callable
-from copy import deepcopy
+from collections import defaultdict, deque, UserList
+from collections.abc import Callable, Collection, Iterator, Sequence
 from itertools import product
 from logging import getLogger
 
@@ -73,94 +72,160 @@ class GraphCore:
         # default dictionary to store graph
         self._graph: defaultdict[int, list[GraphEdgeCore]]
         self._graph = defaultdict(list)
+        # Search indices. Built on first search and discarded on each edit.
+        self._adjacency: list[tuple[GraphEdgeCore, ...]] | None = None
+        self._distances: dict[int, list[int | None]] = {}
 
     def add_edge(self, u: int, v: int, label: str | None = None):
         self._v = max(self._v, u + 1, v + 1)
         self._graph[u].append(GraphEdgeCore(u, v, label))
+        self._adjacency = None
+        self._distances.clear()
+
+    def _get_adjacency(self) -> list[tuple[GraphEdgeCore, ...]]:
+        if self._adjacency is None:
+            self._adjacency = [tuple(self._graph.get(u, ())) for u in range(self._v)]
+        return self._adjacency
+
+    def _get_distances(self, goal: int) -> list[int | None]:
+        """
+        Get the minimum number of edges from each node to the goal.
+
+        Parameters
+        ----------
+        goal : int
+            Index of the goal node.
+
+        Returns
+        -------
+        list[int | None]
+            Distance for each node index. None if the goal is unreachable.
+
+        """
+        if goal in self._distances:
+            return self._distances[goal]
+
+        reverse: list[list[int]] = [[] for _ in range(self._v)]
+        for edges in self._get_adjacency():
+            for edge in edges:
+                reverse[edge.i_to].append(edge.i_from)
+
+        distances: list[int | None] = [None] * self._v
+        distances[goal] = 0
+        queue = deque([goal])
+        while queue:
+            v = queue.popleft()
+            d = distances[v] + 1  # type: ignore
+            for u in reverse[v]:
+                if distances[u] is None:
+                    distances[u] = d
+                    queue.append(u)
+
+        self._distances[goal] = distances
+        return distances
+
+    def distance(self, start: int, goal: int) -> int | None:
+        """
+        Get the minimum number of edges from start to goal.
+
+        Parameters
+        ----------
+        start : int
+            Index of the start node.
+        goal : int
+            Index of the goal node.
+
+        Returns
+        -------
+        int | None
+            Minimum number of edges. None if the goal is unreachable.
+
+        """
+        if start >= self._v or goal >= self._v:
+            return None
+        return self._get_distances(goal)[start]
 
-    def _search_paths_recursion(
-        self,
-        u: int,
-        d: int,
-        edge: GraphEdgeCore | None,
-        visited: dict[tuple[int, int], bool],
-        path: GraphPathCore,
-        paths: list[GraphPathCore],
-    ) -> None:
-
-        if edge is not None:
-            path.append(edge)
-
-        if u == d:
-            paths.append(deepcopy(path))
-        else:
-            for edge in self._graph[u]:
-                i = edge.i_to
-
-                if visited[u, i] is False:
-                    visited[u, i] = True
-                    self._search_paths_recursion(
-                        i, d, edge, visited, path, paths)
-                    visited[u, i] = False
-
-        if len(path) > 0:
-            path.pop()
-
-    def _search_paths(
+    def iter_search_paths(
         self,
-        u: int,
-        d: int,
-        edge: GraphEdgeCore | None,
-        visited: dict[tuple[int, int], bool],
-        path: GraphPathCore,
-        paths: list[GraphPathCore],
+        start: int,
+        goal: int,
         max_depth: int = 0
-    ) -> None:
-
-        edges_cache = []
-        forward = True
-
-        def get_next_edge(u, edges_cache) -> GraphEdgeCore | None:
-            last_cache = edges_cache[-1]
-            if 0 < max_depth and max_depth < len(path):
-                return None
-            while len(last_cache) > 0:
-                edge = last_cache.pop()
-                i = edge.i_to
-                if visited[u, i] is False:
-                    return edge
-            return None
+    ) -> Iterator[GraphPathCore]:
+        """
+        Search paths from start to goal.
+
+        Each pair of adjacent nodes is passed at most once in a path.
+        Edges whose target cannot reach the goal within the remaining depth are skipped.
+
+        Parameters
+        ----------
+        start : int
+            Index of the start node.
+        goal : int
+            Index of the goal node.
+        max_depth : int
+            Maximum depth of the search. Unlimited if 0.
+
+        Yields
+        ------
+        GraphPathCore
+            Path found, in the same order as the depth-first search.
+
+        """
+        if start >= self._v or goal >= self._v:
+            return
 
-        u_start = u
+        adjacency = self._get_adjacency()
+        distances = self._get_distances(goal)
+        max_edges = max_depth + 1 if 0 < max_depth else None
 
-        edges_cache.append(deepcopy(self._graph[u]))
-        while True:
-            if u == d and forward and len(path) > 0:
-                paths.append(deepcopy(path))
+        # Reject unreachable pairs without searching.
+        distance_start = distances[start]
+        if distance_start is None or \
+                (max_edges is not None and max_edges < distance_start):
+            return
 
-            if u != d or u == u_start:
-                edge = get_next_edge(u, edges_cache)
-            else:
-                edge = None
-
-            if edge is not None:
-                i = edge.i_to
-                visited[u, i] = True
-                u = i
-                path.append(edge)
-                edges_cache.append(deepcopy(self._graph[u]))
-                forward = True
-            else:
-                forward = False
-                edges_cache.pop()
+        # visited[u] has bit i set while the edge from u to i is in the path.
+        visited = [0] * self._v
+        path: list[GraphEdgeCore] = []
+        # Each frame holds a node and the number of its edges not yet tried.
+        # Edges are tried from the last one added.
+        stack = [[start, len(adjacency[start])]]
+        while stack:
+            frame = stack[-1]
+            u = frame[0]
+            edge = None
+            if (u != goal or u == start) and \
+                    (max_edges is None or len(path) < max_edges):
+                edges = adjacency[u]
+                k = frame[1]
+                while 0 < k:
+                    k -= 1
+                    i = edges[k].i_to
+                    if visited[u] >> i & 1:
+                        continue
+                    distance = distances[i]
+                    if distance is None:
+                        continue
+                    if max_edges is not None and max_edges < len(path) + 1 + distance:
+                        continue
+                    edge = edges[k]
+                    break
+                frame[1] = k
+
+            if edge is None:
+                stack.pop()
                 if len(path) > 0:
                     last_edge = path.pop()
-                    u = last_edge.i_from
-                    i = last_edge.i_to
-                    visited[u, i] = False
+                    visited[last_edge.i_from] &= ~(1 << last_edge.i_to)
+                continue
 
-                if edges_cache == []:
-                    return
+            i = edge.i_to
+            visited[u] |= 1 << i
+            path.append(edge)
+            if i == goal:
+                yield GraphPathCore(path)
+            stack.append([i, len(adjacency[i])])
 
     def search_paths(
         self,
@@ -168,16 +233,93 @@ class GraphCore:
         goal: int,
         max_depth: int = 0
     ) -> list[GraphPathCore]:
+        return list(self.iter_search_paths(start, goal, max_depth))
 
-        visited: dict[tuple[int, int], bool] = {}
-        for i, j in product(range(self._v), range(self._v)):
-            visited[i, j] = False
-
-        path: GraphPathCore = GraphPathCore()
-        paths: list[GraphPathCore] = []
+    def search_paths_from(
+        self,
+        start: int,
+        goals: Collection[int],
+    ) -> dict[int, list[GraphPathCore]]:
+        """
+        Search paths from start to each of goals at once.
+
+        The result for each goal is the same as search_paths(start, goal),
+        but the graph is traversed only once.
+
+        Parameters
+        ----------
+        start : int
+            Index of the start node.
+        goals : Collection[int]
+            Indices of the goal nodes.
+
+        Returns
+        -------
+        dict[int, list[GraphPathCore]]
+            Paths for each goal.
+
+        """
+        paths: dict[int, list[GraphPathCore]] = {goal: [] for goal in goals}
+        goal_set = {goal for goal in goals if goal < self._v}
+        if start >= self._v or len(goal_set) == 0:
+            return paths
+
+        adjacency = self._get_adjacency()
+
+        # Nodes from which any goal is reachable.
+        reverse: list[list[int]] = [[] for _ in range(self._v)]
+        for edges in adjacency:
+            for e in edges:
+                reverse[e.i_to].append(e.i_from)
+        reachable = [False] * self._v
+        queue = deque(goal_set)
+        for goal in goal_set:
+            reachable[goal] = True
+        while queue:
+            v = queue.popleft()
+            for u in reverse[v]:
+                if not reachable[u]:
+                    reachable[u] = True
+                    queue.append(u)
+        if not reachable[start]:
+            return paths
+
+        # The search for a single goal stops at the goal,
+        # so a path is found for a goal only when the goal is reached for the first time.
+        arrivals = [0] * self._v
+        visited = [0] * self._v
+        path: list[GraphEdgeCore] = []
+        stack = [[start, len(adjacency[start])]]
+        while stack:
+            frame = stack[-1]
+            u = frame[0]
+            edge: GraphEdgeCore | None = None
+            edges = adjacency[u]
+            k = frame[1]
+            while 0 < k:
+                k -= 1
+                i = edges[k].i_to
+                if visited[u] >> i & 1 or not reachable[i]:
+                    continue
+                edge = edges[k]
+                break
+            frame[1] = k
+
+            if edge is None:
+                stack.pop()
+                if len(path) > 0:
+                    last_edge = path.pop()
+                    visited[last_edge.i_from] &= ~(1 << last_edge.i_to)
+                    arrivals[last_edge.i_to] -= 1
+                continue
 
-        # self._search_paths_recursion(start, goal, None, visited, path, paths)
-        self._search_paths(start, goal, None, visited, path, paths, max_depth)
+            i = edge.i_to
+            visited[u] |= 1 << i
+            arrivals[i] += 1
+            path.append(edge)
+            if i in goal_set and (i == start or arrivals[i] == 1):
+                paths[i].append(GraphPathCore(path))
+            stack.append([i, len(adjacency[i])])
 
         return paths
 
@@ -291,33 +433,104 @@ class Graph:
         *nodes: GraphNode,
         max_depth: int | None = None
     ) -> list[GraphPath]:
+        return list(self.iter_search_paths(*nodes, max_depth=max_depth))
+
+    def iter_search_paths(
+        self,
+        *nodes: GraphNode,
+        max_depth: int | None = None
+    ) -> Iterator[GraphPath]:
         if len(nodes) < 2:
             raise InvalidArgumentError('nodes must be at least 2')
 
         self._validate(*nodes)
 
-        path_cores: list[list[GraphPathCore]] = []
-        for start, goal in zip(nodes[:-1], nodes[1:]):
-            path_cores.append(
-                self._graph.search_paths(
-                    self._node_to_idx[start],
-                    self._node_to_idx[goal],
-                    max_depth or 0
-                )
-            )
+        return self._iter_search_paths(nodes, max_depth or 0)
 
-        paths: list[GraphPath] = []
-        for path_cores_ in product(*path_cores):
-            path = GraphPath()
+    def _iter_search_paths(
+        self,
+        nodes: tuple[GraphNode, ...],
+        max_depth: int
+    ) -> Iterator[GraphPath]:
+        indices = [self._node_to_idx[node] for node in nodes]
+
+        # Paths of the first section are yielded as they are found.
+        # The following sections are combined with each of them, so they are searched once.
+        head = self._graph.iter_search_paths(indices[0], indices[1], max_depth)
+        tail: list[list[GraphPathCore]] | None = None
+        for head_core in head:
+            if tail is None:
+                tail = [
+                    self._graph.search_paths(start, goal, max_depth)
+                    for start, goal in zip(indices[1:-1], indices[2:])
+                ]
+            for path_cores_ in product([head_core], *tail):
+                path = GraphPath()
+
+                for path_core in path_cores_:
+                    for edge_core in path_core:
+                        node_from = self._idx_to_node[edge_core.i_from]
+                        node_to = self._idx_to_node[edge_core.i_to]
+                        path.append(GraphEdge(node_from, node_to, edge_core.label))
+                yield path
+
+    def distance(self, node_from: GraphNode, node_to: GraphNode) -> int | None:
+        self._validate(node_from, node_to)
+        return self._graph.distance(
+            self._node_to_idx[node_from], self._node_to_idx[node_to])
+
+    def search_paths_from(
+        self,
+        start: GraphNode,
+        goals: Collection[GraphNode],
+    ) -> dict[GraphNode, list[GraphPath]]:
+        self._validate(start, *goals)
+
+        path_cores = self._graph.search_paths_from(
+            self._node_to_idx[start],
+            [self._node_to_idx[goal] for goal in goals])
+
+        paths: dict[GraphNode, list[GraphPath]] = {}
+        for goal in goals:
+            paths[goal] = [
+                GraphPath([
+                    GraphEdge(
+                        self._idx_to_node[edge_core.i_from],
+                        self._idx_to_node[edge_core.i_to],
+                        edge_core.label)
+                    for edge_core in path_core
+                ])
+                for path_core in path_cores[self._node_to_idx[goal]]
+            ]
+        return paths
 
-            for path_core in path_cores_:
-                for edge_core in path_core:
-                    node_from = self._idx_to_node[edge_core.i_from]
-                    node_to = self._idx_to_node[edge_core.i_to]
-                    path.append(GraphEdge(node_from, node_to, edge_core.label))
-            paths.append(path)
+    def count_paths(
+        self,
+        *nodes: GraphNode,
+        max_depth: int | None = None,
+        limit: int | None = None
+    ) -> int:
+        if len(nodes) < 2:
+            raise InvalidArgumentError('nodes must be at least 2')
 
-        return paths
+        self._validate(*nodes)
+
+        indices = [self._node_to_idx[node] for node in nodes]
+        head = self._graph.iter_search_paths(indices[0], indices[1], max_depth or 0)
+        tail_count: int | None = None
+        count = 0
+        for _ in head:
+            if tail_count is None:
+                tail_count = 1
+                for start, goal in zip(indices[1:-1], indices[2:]):
+                    tail_count *= sum(
+                        1 for _ in self._graph.iter_search_paths(start, goal, max_depth or 0))
+                if tail_count == 0:
+                    break
+            count += tail_count
+            if limit is not None and limit <= count:
+                return limit
+        return count
 
 
 class CallbackPathSearcher:
@@ -386,6 +599,55 @@ class CallbackPathSearcher:
 
         return tuple(paths)
 
+    def search_from(
+        self,
+        start_callback: CallbackStruct,
+        end_callbacks: Sequence[CallbackStruct],
+        node: NodeStruct
+    ) -> list[tuple[NodePathStruct, ...]]:
+        """
+        Search paths from a callback to each of end callbacks at once.
+
+        Parameters
+        ----------
+        start_callback : CallbackStruct
+            Callback to start from.
+        end_callbacks : Sequence[CallbackStruct]
+            Callbacks to end with.
+        node : NodeStruct
+            Node which the callbacks belong to.
+
+        Returns
+        -------
+        list[tuple[NodePathStruct, ...]]
+            Paths for each end callback, in the order of end_callbacks.
+            Each item is the same as search(start_callback, end_callback, node).
+
+        """
+        start_node = GraphNode(self._to_node_point_name(start_callback.callback_name, 'read'))
+        end_nodes = [
+            GraphNode(self._to_node_point_name(end_callback.callback_name, 'write'))
+            for end_callback in end_callbacks
+        ]
+        graph_paths = self._graph.search_paths_from(start_node, end_nodes)
+
+        subscription = node.get_subscription_from_callback(start_callback.callback_name)
+        paths: list[tuple[NodePathStruct, ...]] = []
+        for end_callback, end_node in zip(end_callbacks, end_nodes):
+            paths_: list[NodePathStruct] = []
+            if len(graph_paths[end_node]) > 0:
+                publisher = node.get_publisher_from_callback(end_callback.callback_name)
+                for graph_path in graph_paths[end_node]:
+                    paths_ += self._to_paths(
+                        graph_path,
+                        start_callback,
+                        end_callback,
+                        subscription,
+                        publisher
+                    )
+            paths.append(tuple(paths_))
+        return paths
+
     def _to_paths(
         self,
         callback_graph_path: GraphPath,
@@ -660,6 +922,51 @@ class NodePathSearcher:
 
         return paths
 
+    def iter_search(
+        self,
+        *node_names: str,
+        max_node_depth: int | None = None
+    ) -> Iterator[PathStruct]:
+        max_search_depth = max_node_depth or 0
+
+        graph_nodes: list[GraphNode] = [GraphNode(node) for node in node_names]
+        graph_paths = self._graph.iter_search_paths(
+            *graph_nodes,
+            max_depth=max_search_depth)
+
+        return (self._to_path(graph_path) for graph_path in graph_paths)
+
+    def distance(self, src_node_name: str, dst_node_name: str) -> int | None:
+        """
+        Get the minimum number of communications from src node to dst node.
+
+        Parameters
+        ----------
+        src_node_name : str
+            Node name to start from.
+        dst_node_name : str
+            Node name to reach.
+
+        Returns
+        -------
+        int | None
+            Minimum number of communications. None if dst node is unreachable.
+
+        """
+        return self._graph.distance(GraphNode(src_node_name), GraphNode(dst_node_name))
+
+    def count(
+        self,
+        *node_names: str,
+        max_node_depth: int | None = None,
+        limit: int | None = None
+    ) -> int:
+        graph_nodes: list[GraphNode] = [GraphNode(node) for node in node_names]
+        return self._graph.count_paths(
+            *graph_nodes,
+            max_depth=max_node_depth or 0,
+            limit=limit)
+
     def _find_node(self, node_name: str) -> NodeStruct:
         try:
             return Util.find_one(lambda x: x.node_name == node_name, self._nodes)
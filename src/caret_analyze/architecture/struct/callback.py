@@ -192,7 +192,7 @@ class TimerCallbackStruct(CallbackStruct):
         return TimerCallbackStructValue(
             self.node_name, self.symbol, self.period_ns,
             None if self.publish_topic_names is None else tuple(self.publish_topic_names),
-            self.construction_order, self.callback_name)
+            self.construction_order, self.callback_name).intern()
 
 
 class SubscriptionCallbackStruct(CallbackStruct):
@@ -230,7 +230,7 @@ class SubscriptionCallbackStruct(CallbackStruct):
             self.node_name, self.symbol,
             self.subscribe_topic_name,
             None if self.publish_topic_names is None else tuple(self.publish_topic_names),
-            self.construction_order, self.callback_name)
+            self.construction_order, self.callback_name).intern()
 
     def rename_topic(self, src: str, dst: str) -> None:
         if self._publish_topic_names is not None:
@@ -279,4 +279,4 @@ class ServiceCallbackStruct(CallbackStruct):
             self.symbol,
             self.service_name,
             None if self.publish_topic_names is None else tuple(self.publish_topic_names),
-            self.construction_order, self.callback_name)
+            self.construction_order, self.callback_name).intern()
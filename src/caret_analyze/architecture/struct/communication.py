@@ -120,7 +120,7 @@ class CommunicationStruct():
             None if self.publish_callbacks is None
             else tuple(v.to_value() for v in self.publish_callbacks),
             None if self.subscribe_callback is None
-            else self.subscribe_callback.to_value())
+            else self.subscribe_callback.to_value()).intern()
 
     def rename_node(self, src: str, dst: str) -> None:
         self._node_pub.rename_node(src, dst)
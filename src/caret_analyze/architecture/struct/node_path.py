@@ -144,7 +144,7 @@ class NodePathStruct():
             None if self.subscription is None else self.subscription.to_value(),
             None if self.publisher is None else self.publisher.to_value(),
             None if self.child is None else tuple(v.to_value() for v in self.child),
-            None if self.message_context is None else self.message_context.to_value())
+            None if self.message_context is None else self.message_context.to_value()).intern()
 
     def rename_node(self, src: str, dst: str) -> None:
         if self.node_name == src:
@@ -68,7 +68,7 @@ class PublisherStruct():
             callback_values=(
                 None if self.callbacks is None
                 else tuple(v.to_value() for v in self.callbacks)),
-            construction_order=self.construction_order)
+            construction_order=self.construction_order).intern()
 
     def insert_callback(self, callback: CallbackStruct) -> None:
         if self._callbacks is None:
@@ -17,6 +17,8 @@ from __future__ import annotations
 
 from collections.abc import Sequence
 
+import numpy as np
+
 from ..exceptions import InvalidArgumentError
 
 
@@ -46,6 +48,14 @@ class ClockConverter():
         self._a = a
         self._b = b
 
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ClockConverter):
+            return NotImplemented
+        return (self._a, self._b) == (other._a, other._b)
+
+    def __hash__(self) -> int:
+        return hash((self._a, self._b))
+
     @staticmethod
     def create_from_series(
         times_from: Sequence[float],
@@ -72,7 +82,6 @@ class ClockConverter():
             Occurs when calculation failed by the least-squares method.
 
         """
-        import numpy as np
         if len(times_from) < 2:
             raise InvalidArgumentError('Failed to construct ClockConverter. len(times_from) < 2')
 
@@ -108,3 +117,24 @@ class ClockConverter():
         """
         converted = self._a * time + self._b
         return converted
+
+    def convert_many(
+        self,
+        times: Sequence[float] | np.ndarray
+    ) -> np.ndarray:
+        """
+        Convert input times at once.
+
+        Parameters
+        ----------
+        times : Sequence[float] | np.ndarray
+            Times to convert.
+
+        Returns
+        -------
+        np.ndarray
+            Times after conversion as float64.
+            Each element equals convert() of the corresponding input.
+
+        """
+        return self._a * np.asarray(times, dtype=np.float64) + self._b
@@ -14,7 +14,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Collection, Iterable
+from collections.abc import Callable, Collection, Hashable, Iterable
 
 import difflib
 
@@ -74,6 +74,32 @@ class Util:
             return []
         return list(filter(f, x))
 
+    @staticmethod
+    def group_items(
+        key: Callable[[Any], Hashable],
+        x: Iterable[Any] | None
+    ) -> dict[Any, list[Any]]:
+        """
+        Group iterable by key.
+
+        Parameters
+        ----------
+        key : Callable[[Any], Hashable]
+            Function to get the key of an item.
+        x : Iterable[Any] | None
+            Grouping target.
+
+        Returns
+        -------
+        dict[Any, list[Any]]
+            Items for each key. The order of the items is kept.
+
+        """
+        groups: dict[Any, list[Any]] = {}
+        for item in x or []:
+            groups.setdefault(key(item), []).append(item)
+        return groups
+
     @staticmethod
     def num_digit(i: int) -> int:
         """
@@ -15,6 +15,9 @@
 from __future__ import annotations
 
 from abc import ABCMeta, abstractmethod
+from collections.abc import Sequence
+
+import pandas as pd
 
 from ..common import ClockConverter
 from ..record.interface import RecordsInterface
@@ -144,6 +147,35 @@ class RecordsProvider(metaclass=ABCMeta):
     ) -> RecordsInterface:
         pass
 
+    def with_time_range(
+        self,
+        min_ns: int | None,
+        max_ns: int | None
+    ) -> RecordsProvider:
+        """
+        Get a provider whose records are restricted to a time range.
+
+        Records out of the range can be excluded before they are merged,
+        so that analysing a short window of a long trace does not
+        compose records of the whole trace.
+        Callers must still clip the merged records by themselves.
+
+        Parameters
+        ----------
+        min_ns : int | None
+            lower bound of the range (inclusive). Unbounded if None.
+        max_ns : int | None
+            upper bound of the range (inclusive). Unbounded if None.
+
+        Returns
+        -------
+        RecordsProvider
+            provider restricted to the range.
+            Providers which do not support the restriction return themselves.
+
+        """
+        return self
+
 
 class RuntimeDataProvider(RecordsProvider):
 
@@ -166,3 +198,11 @@ class RuntimeDataProvider(RecordsProvider):
         info: PublisherStructValue | SubscriptionStructValue
     ) -> Qos | None:
         pass
+
+    @abstractmethod
+    def callback_latency_summary(
+        self,
+        callbacks: Sequence[CallbackStructValue],
+        percentiles: Sequence[float] = (50, 90, 99),
+    ) -> pd.DataFrame:
+        pass
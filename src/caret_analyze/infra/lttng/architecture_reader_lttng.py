@@ -43,9 +43,10 @@ class ArchitectureReaderLttng(ArchitectureReader):
         trace_dir: str
     ) -> None:
         from .lttng import Lttng
+        # Only the initialization events are needed to build an architecture.
         self._lttng = Lttng(
             trace_dir, event_filters=[LttngEventFilter.init_pass_filter()],
-            validate=False)
+            validate=False, init_only=True)
 
     def get_node_names_and_cb_symbols(
         self,
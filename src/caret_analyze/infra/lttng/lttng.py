@@ -87,7 +87,8 @@ class EventCollection(Iterable, Sized):
     def time_range(self) -> tuple[int, int]:
         return self._iterable_events.time_range()
 
-    def _cache_path(self, events_path: str) -> str:
+    @staticmethod
+    def _cache_path(events_path: str) -> str:
         return os.path.join(events_path, 'caret_converted')
 
     @staticmethod
@@ -245,18 +246,201 @@ class CtfEventCollection(IterableEvents):
             if msg.event.name not in acceptable_tracepoints:
                 continue
 
-            event = CtfEventCollection._to_event(msg)
-            event[LttngEventFilter.TIMESTAMP] = event.pop('timestamp')
-            event[LttngEventFilter.VTID] = event.pop('vtid')
-            event[LttngEventFilter.VPID] = event.pop('vpid')
-            event[LttngEventFilter.PROCNAME] = event.pop('procname')
-            event_dict = {
-                k: get_field(event, k) for k in event
-            }
-            events.append(event_dict)
+            events.append(CtfEventCollection._to_event_dict(msg))
 
         return events
 
+    @staticmethod
+    def _to_event_dict(msg: Any) -> dict[str, Any]:
+        event = CtfEventCollection._to_event(msg)
+        event[LttngEventFilter.TIMESTAMP] = event.pop('timestamp')
+        event[LttngEventFilter.VTID] = event.pop('vtid')
+        event[LttngEventFilter.VPID] = event.pop('vpid')
+        event[LttngEventFilter.PROCNAME] = event.pop('procname')
+        return {
+            k: get_field(event, k) for k in event
+        }
+
+
+class InitEventCollection(IterableEvents):
+    """
+    Collection of the initialization trace events only.
+
+    Only the events needed to build an architecture are converted,
+    so the runtime events are skipped without being decoded into dicts.
+    The converted events are stored in a small sidecar file,
+    which is reused while the trace files are unchanged.
+    Without the sidecar file, the init events are taken from the full converted file
+    if it is newer than the trace files, instead of reading the trace again.
+
+    """
+
+    CACHE_VERSION = 1
+
+    def __init__(
+        self,
+        events_path: str,
+        force_conversion: bool = False,
+        *,
+        store_cache: bool = True
+    ) -> None:
+        if not EventCollection._trace_dir_exists(events_path):
+            raise FileNotFoundError(f'Failed to found {events_path}')
+
+        cache_path = self._cache_path(events_path)
+        signature = self._signature(events_path)
+
+        cache = None
+        if not force_conversion:
+            cache = self._load_cache(cache_path, signature)
+
+        if cache is not None:
+            logger.info('Found converted init events file.')
+        else:
+            if not force_conversion:
+                cache = self._load_full_cache(events_path, signature)
+            if cache is None:
+                cache = self._convert(events_path, signature)
+            if store_cache:
+                self._store_cache(cache, cache_path)
+                logger.info(f'Converted to {cache_path}')
+
+        self._events: list[dict] = cache['events']
+        self._begin_time: int = cache['begin']
+        self._end_time: int = cache['end']
+
+    def __iter__(self) -> Iterator[dict]:
+        return iter(self._events)
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    @property
+    def events(self) -> list[dict]:
+        return self._events
+
+    def time_range(self) -> tuple[int, int]:
+        return self._begin_time, self._end_time
+
+    @staticmethod
+    def _cache_path(events_path: str) -> str:
+        return os.path.join(events_path, 'caret_converted_init')
+
+    @staticmethod
+    def _signature(events_path: str) -> list[tuple[str, int, int]]:
+        # Size and mtime of every trace file. Converted caches are not part of the trace.
+        signature = []
+        for root, _, files in os.walk(events_path):
+            for file in files:
+                if file.startswith('caret_converted'):
+                    continue
+                path = os.path.join(root, file)
+                stat = os.stat(path)
+                signature.append(
+                    (os.path.relpath(path, events_path), stat.st_size, stat.st_mtime_ns))
+        return sorted(signature)
+
+    @staticmethod
+    def _load_cache(
+        cache_path: str,
+        signature: list[tuple[str, int, int]]
+    ) -> dict[str, Any] | None:
+        if not EventCollection._cache_exists(cache_path):
+            return None
+        try:
+            with open(cache_path, mode='rb') as f:
+                cache = pickle.load(f)
+        except Exception as e:
+            logger.warning(f'Failed to load {cache_path}: {e}')
+            return None
+        if not isinstance(cache, dict) or \
+                cache.get('version') != InitEventCollection.CACHE_VERSION or \
+                cache.get('signature') != signature:
+            return None
+        return cache
+
+    @staticmethod
+    def _load_full_cache(
+        events_path: str,
+        signature: list[tuple[str, int, int]]
+    ) -> dict[str, Any] | None:
+        full_cache_path = EventCollection._cache_path(events_path)
+        if not EventCollection._cache_exists(full_cache_path):
+            return None
+        # The full cache is stale if a trace file was modified after it was written.
+        trace_mtime = max((mtime for _, _, mtime in signature), default=0)
+        if os.stat(full_cache_path).st_mtime_ns < trace_mtime:
+            return None
+        try:
+            full_events = PickleEventCollection(full_cache_path)
+        except Exception as e:
+            logger.warning(f'Failed to load {full_cache_path}: {e}')
+            return None
+        if len(full_events) == 0:
+            return None
+
+        from .lttng_event_filter import InitEventPassFilter
+        init_events = InitEventPassFilter.INIT_EVENTS
+        begin, end = full_events.time_range()
+        return {
+            'version': InitEventCollection.CACHE_VERSION,
+            'signature': signature,
+            'begin': begin,
+            'end': end,
+            'events': [event for event in full_events
+                       if event[LttngEventFilter.NAME] in init_events],
+        }
+
+    @staticmethod
+    def _store_cache(cache: dict[str, Any], cache_path: str) -> None:
+        try:
+            with open(cache_path, mode='wb') as f:
+                pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError as e:
+            logger.warning(f'Failed to store {cache_path}: {e}')
+
+    @staticmethod
+    def _convert(
+        events_path: str,
+        signature: list[tuple[str, int, int]]
+    ) -> dict[str, Any]:
+        from .lttng_event_filter import InitEventPassFilter
+        init_events = InitEventPassFilter.INIT_EVENTS
+
+        events = []
+        begin_msg: Any = None
+        end_msg: Any = None
+        for msg in bt2.TraceCollectionMessageIterator(events_path):
+            if type(msg) is bt2._DiscardedEventsMessageConst:
+                logger.warning(
+                    'Tracer discarded '
+                    f'{msg.count} events between '
+                    f'{msg.beginning_default_clock_snapshot.ns_from_origin} and '
+                    f'{msg.end_default_clock_snapshot.ns_from_origin}.')
+                continue
+            if type(msg) is not bt2._EventMessageConst:
+                continue
+
+            if begin_msg is None:
+                begin_msg = msg
+            end_msg = msg
+
+            if msg.event.name not in init_events:
+                continue
+            events.append(CtfEventCollection._to_event_dict(msg))
+
+        # Ensure that trace data includes one at least.
+        assert begin_msg is not None
+        assert end_msg is not None
+
+        return {
+            'version': InitEventCollection.CACHE_VERSION,
+            'signature': signature,
+            'begin': begin_msg.default_clock_snapshot.ns_from_origin,
+            'end': end_msg.default_clock_snapshot.ns_from_origin,
+            'events': events,
+        }
+
 
 class Lttng(InfraBase):
     """
@@ -323,7 +507,8 @@ class Lttng(InfraBase):
         event_filters: list[LttngEventFilter] | None = None,
         store_events: bool = False,
         # TODO(hsgwa): change validate function to public "verify".
-        validate: bool = True
+        validate: bool = True,
+        init_only: bool = False
     ) -> None:
         from .lttng_info import LttngInfo
         from .records_source import RecordsSource
@@ -341,7 +526,8 @@ class Lttng(InfraBase):
             trace_dir_or_events,
             force_conversion,
             modified_event_filters,
-            store_events
+            store_events,
+            init_only
         )
         self.data = data
         self._info = LttngInfo(data)
@@ -357,7 +543,7 @@ class Lttng(InfraBase):
         force_conversion: bool,
         event_filters: list[LttngEventFilter],
         store_events: bool,
-
+        init_only: bool = False
     ) -> tuple[Ros2DataModel, list[dict] | None, int, int]:
 
         data = Ros2DataModel()
@@ -389,7 +575,11 @@ class Lttng(InfraBase):
 
             for trace_dir in traceInst:
                 print('Processing trace folder : {}'.format(trace_dir))
-                event_collection = EventCollection(trace_dir.strip(), force_conversion)
+                event_collection: EventCollection | InitEventCollection
+                if init_only:
+                    event_collection = InitEventCollection(trace_dir.strip(), force_conversion)
+                else:
+                    event_collection = EventCollection(trace_dir.strip(), force_conversion)
                 print('{} events found.'.format(len(event_collection)))
                 tempBegin, tempEnd = event_collection.time_range()
                 if begin == 0 or end == 0:
@@ -89,54 +89,54 @@ class SameAddressFilter(LttngEventFilter):
 
 class InitEventPassFilter(LttngEventFilter):
 
+    # TODO(hsgwa): Definitions on tracepoint types are scattered. Refactor required.
+    INIT_EVENTS = frozenset({
+        'ros2:rcl_init',
+        'ros2_caret:rcl_init',
+        'ros2:rcl_node_init',
+        'ros2_caret:rcl_node_init',
+        'ros2:rcl_publisher_init',
+        'ros2_caret:rcl_publisher_init',
+        'ros2:rcl_subscription_init',
+        'ros2_caret:rcl_subscription_init',
+        'ros2:rclcpp_subscription_init',
+        'ros2_caret:rclcpp_subscription_init',
+        'ros2:rclcpp_subscription_callback_added',
+        'ros2_caret:rclcpp_subscription_callback_added',
+        'ros2:rcl_service_init',
+        'ros2_caret:rcl_service_init',
+        'ros2:rclcpp_service_callback_added',
+        'ros2_caret:rclcpp_service_callback_added',
+        'ros2:rcl_client_init',
+        'ros2_caret:rcl_client_init',
+        'ros2:rcl_timer_init',
+        'ros2_caret:rcl_timer_init',
+        'ros2:rclcpp_timer_callback_added',
+        'ros2_caret:rclcpp_timer_callback_added',
+        'ros2:rclcpp_timer_link_node',
+        'ros2_caret:rclcpp_timer_link_node',
+        'ros2:rclcpp_callback_register',
+        'ros2_caret:rclcpp_callback_register',
+        'ros2:rcl_lifecycle_state_machine_init',
+        'ros2_caret:rcl_lifecycle_state_machine_init',
+        'ros2:rcl_lifecycle_transition',
+        'ros2_caret:caret_init',
+        'ros2_caret:rmw_implementation',
+        'ros2_caret:add_callback_group',
+        'ros2_caret:add_callback_group_static_executor',
+        'ros2_caret:construct_executor',
+        'ros2_caret:construct_static_executor',
+        'ros2_caret:callback_group_add_timer',
+        'ros2_caret:callback_group_add_subscription',
+        'ros2_caret:callback_group_add_service',
+        'ros2_caret:callback_group_add_client',
+        'ros2_caret:tilde_subscription_init',
+        'ros2_caret:tilde_publisher_init',
+        'ros2_caret:tilde_subscribe_added',
+    })
+
     def accept(self, event: Event, common: LttngEventFilter.Common) -> bool:
-        # TODO(hsgwa): Definitions on tracepoint types are scattered. Refactor required.
-        init_events = {
-            'ros2:rcl_init',
-            'ros2_caret:rcl_init',
-            'ros2:rcl_node_init',
-            'ros2_caret:rcl_node_init',
-            'ros2:rcl_publisher_init',
-            'ros2_caret:rcl_publisher_init',
-            'ros2:rcl_subscription_init',
-            'ros2_caret:rcl_subscription_init',
-            'ros2:rclcpp_subscription_init',
-            'ros2_caret:rclcpp_subscription_init',
-            'ros2:rclcpp_subscription_callback_added',
-            'ros2_caret:rclcpp_subscription_callback_added',
-            'ros2:rcl_service_init',
-            'ros2_caret:rcl_service_init',
-            'ros2:rclcpp_service_callback_added',
-            'ros2_caret:rclcpp_service_callback_added',
-            'ros2:rcl_client_init',
-            'ros2_caret:rcl_client_init',
-            'ros2:rcl_timer_init',
-            'ros2_caret:rcl_timer_init',
-            'ros2:rclcpp_timer_callback_added',
-            'ros2_caret:rclcpp_timer_callback_added',
-            'ros2:rclcpp_timer_link_node',
-            'ros2_caret:rclcpp_timer_link_node',
-            'ros2:rclcpp_callback_register',
-            'ros2_caret:rclcpp_callback_register',
-            'ros2:rcl_lifecycle_state_machine_init',
-            'ros2_caret:rcl_lifecycle_state_machine_init',
-            'ros2:rcl_lifecycle_transition',
-            'ros2_caret:caret_init',
-            'ros2_caret:rmw_implementation',
-            'ros2_caret:add_callback_group',
-            'ros2_caret:add_callback_group_static_executor',
-            'ros2_caret:construct_executor',
-            'ros2_caret:construct_static_executor',
-            'ros2_caret:callback_group_add_timer',
-            'ros2_caret:callback_group_add_subscription',
-            'ros2_caret:callback_group_add_service',
-            'ros2_caret:callback_group_add_client',
-            'ros2_caret:tilde_subscription_init',
-            'ros2_caret:tilde_publisher_init',
-            'ros2_caret:tilde_subscribe_added',
-        }
-
-        return event[self.NAME] in init_events
+        return event[self.NAME] in self.INIT_EVENTS
 
 
 class EventStripFilter(LttngEventFilter):
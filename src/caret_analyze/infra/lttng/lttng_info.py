@@ -14,7 +14,6 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
 from collections.abc import Sequence
 from functools import cached_property, lru_cache
 from logging import getLogger, WARN
@@ -839,11 +838,7 @@ class DataFrameFormatted:
         DataFrameFormatted._add_construction_order_publisher_or_subscription(
             publishers, 'construction_order', 'timestamp', 'node_handle', 'topic_name')
 
-        def to_publisher_id(row: pd.Series):
-            publisher_handle = row['publisher_handle']
-            return f'publisher_{publisher_handle}'
-
-        publishers.add_column('publisher_id', to_publisher_id)
+        publishers.add_id_column('publisher_id', 'publisher_handle', 'publisher_')
         publishers.set_columns(columns)
         publishers.drop_duplicate()
 
@@ -856,12 +851,9 @@ class DataFrameFormatted:
         columns = ['timestamp', 'timer_handle', 'type', 'params']
         timers = data.timers.clone()
         timers.reset_index()
-        timers.add_column('type', lambda _: 'init')
-
-        def to_params(row: pd.Series):
-            return {'period': row['period']}
-
-        timers.add_column('params', to_params)
+        timers.derive_column('type', lambda df: ['init'] * len(df))
+        timers.derive_column(
+            'params', lambda df: [{'period': period} for period in df['period'].to_list()])
         timers.set_columns(columns)
         return timers
 
@@ -881,11 +873,7 @@ class DataFrameFormatted:
             executors = TracePointData.concat(
                 [executors, executors_static], columns_)
 
-        def to_executor_id(row: pd.Series) -> str:
-            addr = row['executor_addr']
-            return f'executor_{addr}'
-
-        executors.add_column('executor_id', to_executor_id)
+        executors.add_id_column('executor_id', 'executor_addr', 'executor_')
         executors.set_columns(columns)
 
         # data.callback_groups returns duplicate results that differ only in timestamp.
@@ -914,11 +902,10 @@ class DataFrameFormatted:
             callback_groups = TracePointData.concat(
                 [callback_groups, callback_groups_static], columns_)
 
-        def to_callback_group_id(row: pd.Series) -> str:
-            addr = row['callback_group_addr']
-            return CallbackGroupAddr(addr).group_id
-
-        callback_groups.add_column('callback_group_id', to_callback_group_id)
+        callback_groups.derive_column(
+            'callback_group_id',
+            lambda df: [CallbackGroupAddr.to_id(addr)
+                        for addr in df['callback_group_addr'].to_list()])
         callback_groups.set_columns(columns)
 
         # data.callback_groups returns duplicate results that differ only in timestamp.
@@ -961,9 +948,6 @@ class DataFrameFormatted:
             'period_ns', 'symbol', 'construction_order'
         ]
 
-        def callback_id(row: pd.Series) -> str:
-            cb_object = row['callback_object']
-            return f'timer_callback_{cb_object}'
         timers = data.timers.clone()
         timers.reset_index()
         timers.rename_column('period', 'period_ns')
@@ -992,7 +976,7 @@ class DataFrameFormatted:
         callback_group_timer.reset_index()
         merge(timers, callback_group_timer, 'timer_handle')
 
-        timers.add_column('callback_id', callback_id)
+        timers.add_id_column('callback_id', 'callback_object', 'timer_callback_')
 
         timers.set_columns(columns)
 
@@ -1013,10 +997,6 @@ class DataFrameFormatted:
             'construction_order'
         ]
 
-        def callback_id(row: pd.Series) -> str:
-            cb_object = row['callback_object']
-            return f'subscription_callback_{cb_object}'
-
         merge_drop_columns = ['tid', 'rmw_handle']
 
         subscriptions = data.subscriptions.clone()
@@ -1041,15 +1021,13 @@ class DataFrameFormatted:
         callback_group_subscription.reset_index()
         merge(subscriptions, callback_group_subscription, 'subscription_handle')
 
-        subscriptions.add_column('callback_id', callback_id)
+        subscriptions.add_id_column('callback_id', 'callback_object', 'subscription_callback_')
 
         subscriptions.set_columns(columns)
         subscriptions.drop_duplicate()
 
         return subscriptions
 
-    KeyType = tuple[int | str, int | str, str | int]
-
     @staticmethod
     def _add_construction_order(
         data: TracePointData,
@@ -1059,22 +1037,9 @@ class DataFrameFormatted:
         callback_parameter_column: str,
         symbol_column: str
     ) -> None:
-
         data.sort(timestamp_column)
-        order: dict[DataFrameFormatted.KeyType, int] = defaultdict(int)
-
-        def construct_order(row: pd.Series) -> int:
-            node = row[node_handle_column]
-            callback_param = row[callback_parameter_column]
-            symbol = row[symbol_column]
-            key: DataFrameFormatted.KeyType = node, callback_param, symbol
-            order_ = int(order[key])
-            order[key] += 1
-            return order_
-
-        data.add_column(column_name, construct_order)
-
-    KeyTypePubSub = tuple[int | str, str | int]
+        data.add_order_column(
+            column_name, [node_handle_column, callback_parameter_column, symbol_column])
 
     @staticmethod
     def _add_construction_order_publisher_or_subscription(
@@ -1084,18 +1049,8 @@ class DataFrameFormatted:
         node_handle_column: str,
         topic_name: str
     ) -> None:
-
         data.sort(timestamp_column)
-        order: dict[DataFrameFormatted.KeyTypePubSub, int] = defaultdict(int)
-
-        def construct_order(row: pd.Series) -> int:
-            node = row[node_handle_column]
-            key: DataFrameFormatted.KeyTypePubSub = node, row[topic_name]
-            order_ = int(order[key])
-            order[key] += 1
-            return order_
-
-        data.add_column(column_name, construct_order)
+        data.add_order_column(column_name, [node_handle_column, topic_name])
 
     @staticmethod
     def _build_srv_callbacks(
@@ -1106,10 +1061,6 @@ class DataFrameFormatted:
             'service_handle', 'callback_group_addr', 'service_name', 'symbol', 'construction_order'
         ]
 
-        def callback_id(row: pd.Series) -> str:
-            cb_object = row['callback_object']
-            return f'service_callback_{cb_object}'
-
         merge_drop_columns = ['tid', 'rmw_handle']
 
         services = data.services.clone()
@@ -1134,7 +1085,7 @@ class DataFrameFormatted:
         callback_group_service.reset_index()
         merge(services, callback_group_service, 'service_handle')
 
-        services.add_column('callback_id', callback_id)
+        services.add_id_column('callback_id', 'callback_object', 'service_callback_')
 
         services.set_columns(columns)
         services.drop_duplicate()
@@ -1191,10 +1142,6 @@ class DataFrameFormatted:
             'subscription_handle', 'callback_group_addr', 'topic_name', 'symbol', 'depth'
         ]
 
-        def callback_id(row: pd.Series) -> str:
-            cb_object = row['callback_object']
-            return f'subscription_callback_{cb_object}'
-
         subscriptions = data.subscriptions.clone()
         subscriptions.reset_index()
 
@@ -1209,7 +1156,7 @@ class DataFrameFormatted:
         cbg.reset_index()
         merge(subscriptions, cbg, 'subscription_handle')
 
-        subscriptions.add_column('callback_id', callback_id)
+        subscriptions.add_id_column('callback_id', 'callback_object', 'subscription_callback_')
 
         subscriptions.set_columns(columns)
         subscriptions.drop_duplicate()
@@ -1325,23 +1272,21 @@ class DataFrameFormatted:
         node = data.nodes.clone()
         node.reset_index()
 
-        def ns_and_node_name(row: pd.Series) -> str:
-            ns: str = row['namespace']
-            name: str = row['name']
-
+        def ns_and_node_name(ns: str, name: str) -> str:
             if ns[-1] == '/':
                 return ns + name
             else:
                 return ns + '/' + name
 
-        node.add_column('node_name', ns_and_node_name)
-
-        def to_node_id(row: pd.Series) -> str:
-            node_name = row['node_name']
-            node_handle = row['node_handle']
-            return f'{node_name}_{node_handle}'
-
-        node.add_column('node_id', to_node_id)
+        node.derive_column(
+            'node_name',
+            lambda df: [ns_and_node_name(ns, name)
+                        for ns, name in zip(df['namespace'].to_list(), df['name'].to_list())])
+        node.derive_column(
+            'node_id',
+            lambda df: [f'{node_name}_{node_handle}'
+                        for node_name, node_handle
+                        in zip(df['node_name'].to_list(), df['node_handle'].to_list())])
         node.set_columns(columns)
         node.drop_duplicate()
 
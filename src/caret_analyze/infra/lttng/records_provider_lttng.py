@@ -15,23 +15,28 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
+from copy import copy
 from functools import cached_property
 from logging import getLogger
 
 
 from caret_analyze.value_objects.message_context import MessageContext, MessageContextType
+import numpy as np
+import pandas as pd
 
 from .lttng import Lttng
 from .value_objects import (PublisherValueLttng,
                             SubscriptionCallbackValueLttng,
                             TimerCallbackValueLttng)
 from ...common import ClockConverter, Util
-from ...exceptions import (InvalidArgumentError,
+from ...exceptions import (Error,
+                           InvalidArgumentError,
                            UnsupportedNodeRecordsError,
                            UnsupportedTypeError)
 from ...infra.interface import RuntimeDataProvider
 from ...infra.lttng.column_names import COLUMN_NAME
-from ...record import (merge, merge_sequential, RecordsFactory, RecordsInterface)
+from ...record import (merge, merge_sequential, RecordsFactory, RecordsInterface,
+                       RecordsSlicer)
 from ...record.column import Columns, ColumnValue
 from ...value_objects import (CallbackChain,
                               CallbackStructValue,
@@ -66,6 +71,36 @@ class RecordsProviderLttng(RuntimeDataProvider):
         self._lttng = lttng
         self._source = FilteredRecordsSource(lttng)
         self._helper = RecordsProviderLttngHelper(lttng)
+        self._time_range: tuple[int | None, int | None] | None = None
+
+    def with_time_range(
+        self,
+        min_ns: int | None,
+        max_ns: int | None
+    ) -> RecordsProviderLttng:
+        """
+        Get a provider whose records are restricted to a time range [override].
+
+        The returned provider shares the grouped records with this provider.
+        Callback, publish and subscribe records are sliced by their own timestamps
+        before they are merged.
+
+        Parameters
+        ----------
+        min_ns : int | None
+            lower bound of the range (inclusive). Unbounded if None.
+        max_ns : int | None
+            upper bound of the range (inclusive). Unbounded if None.
+
+        Returns
+        -------
+        RecordsProviderLttng
+            provider restricted to the range.
+
+        """
+        provider = copy(self)
+        provider._time_range = (min_ns, max_ns)
+        return provider
 
     def communication_records(
         self,
@@ -147,7 +182,8 @@ class RecordsProviderLttng(RuntimeDataProvider):
 
         """
         callback_objects = self._helper.get_callback_objects(callback)
-        callback_records = self._source.callback_records(*callback_objects)
+        callback_records = self._source.callback_records(
+            *callback_objects, time_range=self._time_range)
 
         columns = [
             COLUMN_NAME.CALLBACK_START_TIMESTAMP,
@@ -229,7 +265,8 @@ class RecordsProviderLttng(RuntimeDataProvider):
             )
 
         callback_objects = self._helper.get_subscription_callback_objects(callback)
-        sub_records = self._source.sub_records(*callback_objects)
+        sub_records = self._source.sub_records(
+            *callback_objects, time_range=self._time_range)
 
         columns = [
             COLUMN_NAME.CALLBACK_START_TIMESTAMP,
@@ -283,12 +320,14 @@ class RecordsProviderLttng(RuntimeDataProvider):
             )
 
         callback_objects = self._helper.get_subscription_callback_objects(callback)
-        sub_records = self._source.sub_records(*callback_objects)
+        sub_records = self._source.sub_records(
+            *callback_objects, time_range=self._time_range)
 
         tilde_subscription = self._helper.get_tilde_subscription(callback)
 
         if tilde_subscription is not None:
-            tilde_records = self._source.tilde_subscribe_records(tilde_subscription)
+            tilde_records = self._source.tilde_subscribe_records(
+                tilde_subscription, time_range=self._time_range)
 
             sub_records = merge_sequential(
                 left_records=sub_records,
@@ -345,7 +384,8 @@ class RecordsProviderLttng(RuntimeDataProvider):
 
         """
         publisher_handles = self._helper.get_publisher_handles(publisher)
-        pub_records = self._source.publish_records(publisher_handles)
+        pub_records = self._source.publish_records(
+            publisher_handles, time_range=self._time_range)
 
         columns = []
         columns.append(COLUMN_NAME.RCLCPP_PUBLISH_TIMESTAMP)
@@ -425,10 +465,12 @@ class RecordsProviderLttng(RuntimeDataProvider):
 
         """
         publisher_handles = self._helper.get_publisher_handles(publisher)
-        pub_records = self._source.publish_records(publisher_handles)
+        pub_records = self._source.publish_records(
+            publisher_handles, time_range=self._time_range)
 
         tilde_publishers = self._helper.get_tilde_publishers(publisher)
-        tilde_records = self._source.tilde_publish_records(tilde_publishers)
+        tilde_records = self._source.tilde_publish_records(
+            tilde_publishers, time_range=self._time_range)
 
         pub_records = merge_sequential(
             left_records=tilde_records,
@@ -535,8 +577,10 @@ class RecordsProviderLttng(RuntimeDataProvider):
         assert len(publisher_addresses) > 0
         assert subscription_addr is not None
 
-        pub_records = self._source.tilde_publish_records(publisher_addresses)
-        sub_records = self._source.tilde_subscribe_records(subscription_addr)
+        pub_records = self._source.tilde_publish_records(
+            publisher_addresses, time_range=self._time_range)
+        sub_records = self._source.tilde_subscribe_records(
+            subscription_addr, time_range=self._time_range)
 
         records = merge(
             left_records=sub_records,
@@ -587,6 +631,90 @@ class RecordsProviderLttng(RuntimeDataProvider):
     def get_sim_time_converter(self, min_ns, max_ns) -> ClockConverter:
         return self._lttng.get_sim_time_converter(min_ns, max_ns)
 
+    def callback_latency_summary(
+        self,
+        callbacks: Sequence[CallbackStructValue],
+        percentiles: Sequence[float] = (50, 90, 99),
+    ) -> pd.DataFrame:
+        """
+        Summarize callback execution times of multiple callbacks.
+
+        All callbacks are summarized in one pass over the callback table,
+        without composing callback records for each callback.
+
+        Parameters
+        ----------
+        callbacks : Sequence[CallbackStructValue]
+            target callbacks.
+        percentiles : Sequence[float]
+            percentiles of execution time to be calculated. [%]
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per callback in the given order. Columns
+
+            - node_name
+            - callback_name
+            - count
+            - mean [ns]
+            - p{percentile} [ns] (for each percentile)
+            - max [ns]
+            - drop_rate
+
+            drop_rate is the ratio of timer periods without any callback execution
+            within the measured duration. NaN for other than timer callbacks.
+
+        """
+        label_map: dict[int, int] = {}
+        for i, callback in enumerate(callbacks):
+            try:
+                callback_objects = self._helper.get_callback_objects(callback)
+            except Error as e:
+                logger.warning(e)
+                continue
+            for callback_object in callback_objects:
+                if callback_object is not None:
+                    label_map[callback_object] = i
+
+        table = self._source.callback_table(time_range=self._time_range)
+        labels = table[COLUMN_NAME.CALLBACK_OBJECT].map(label_map)
+        table = table[labels.notna()]
+        labels = labels[labels.notna()].astype('int64')
+
+        start = table[COLUMN_NAME.CALLBACK_START_TIMESTAMP].astype('float64')
+        duration = table[COLUMN_NAME.CALLBACK_END_TIMESTAMP].astype('float64') - start
+        grouped = duration.groupby(labels)
+        grouped_start = start.groupby(labels)
+
+        index = pd.RangeIndex(len(callbacks))
+        count = grouped.size().reindex(index, fill_value=0)
+        summary = pd.DataFrame({
+            'node_name': [callback.node_name for callback in callbacks],
+            'callback_name': [callback.callback_name for callback in callbacks],
+            'count': count.values,
+            'mean [ns]': grouped.mean().reindex(index).values,
+        })
+        if len(percentiles) > 0:
+            quantiles = [percentile / 100 for percentile in percentiles]
+            percentile_values = grouped.quantile(quantiles).unstack()
+            percentile_values = percentile_values.reindex(index=index, columns=quantiles)
+            for percentile, quantile in zip(percentiles, quantiles):
+                summary[f'p{percentile:g} [ns]'] = percentile_values[quantile].values
+        summary['max [ns]'] = grouped.max().reindex(index).values
+
+        period_ns = np.array([
+            callback.period_ns if isinstance(callback, TimerCallbackStructValue) else np.nan
+            for callback in callbacks
+        ], dtype=np.float64)
+        duration_ns = (grouped_start.max() - grouped_start.min()).reindex(index).values
+        with np.errstate(divide='ignore', invalid='ignore'):
+            expected = np.floor(duration_ns / period_ns) + 1
+            drop_rate = np.clip(1 - count.values / expected, 0, 1)
+        summary['drop_rate'] = drop_rate
+
+        return summary
+
     def variable_passing_records(
         self,
         variable_passing_info: VariablePassingStructValue
@@ -640,8 +768,13 @@ class RecordsProviderLttng(RuntimeDataProvider):
         self,
         communication_value: CommunicationStructValue
     ) -> bool | None:
-        intra_record = self._compose_intra_proc_comm_records(communication_value)
-        return len(intra_record) > 0
+        subscription_cb = communication_value.subscribe_callback
+        assert isinstance(subscription_cb, SubscriptionCallbackStructValue)
+
+        publisher_handles = self._helper.get_publisher_handles(communication_value.publisher)
+        callback_object_intra = self._helper.get_subscription_callback_object_intra(
+            subscription_cb)
+        return self._source.has_intra_comm_records(publisher_handles, callback_object_intra)
 
     def path_beginning_records(
         self,
@@ -664,7 +797,8 @@ class RecordsProviderLttng(RuntimeDataProvider):
 
         """
         publisher_handles = self._helper.get_publisher_handles(publisher)
-        records = self._source.path_beginning_records(publisher_handles)
+        records = self._source.path_beginning_records(
+            publisher_handles, time_range=self._time_range)
 
         columns = [
             COLUMN_NAME.CALLBACK_START_TIMESTAMP,
@@ -695,7 +829,8 @@ class RecordsProviderLttng(RuntimeDataProvider):
 
         """
         callback_objects = self._helper.get_callback_objects(callback)
-        records = self._source.callback_records(*callback_objects)
+        records = self._source.callback_records(
+            *callback_objects, time_range=self._time_range)
 
         columns = [
             COLUMN_NAME.CALLBACK_START_TIMESTAMP,
@@ -786,7 +921,8 @@ class RecordsProviderLttng(RuntimeDataProvider):
         callback_object_intra = self._helper.get_subscription_callback_object_intra(
             subscription_cb)
 
-        records = self._source.intra_comm_records(publisher_handles, callback_object_intra)
+        records = self._source.intra_comm_records(
+            publisher_handles, callback_object_intra, time_range=self._time_range)
 
         columns = [
             COLUMN_NAME.RCLCPP_PUBLISH_TIMESTAMP,
@@ -830,7 +966,8 @@ class RecordsProviderLttng(RuntimeDataProvider):
         publisher_handles = self._helper.get_publisher_handles(publisher)
         callback_object = self._helper.get_subscription_callback_object_inter(subscription_cb)
 
-        records = self._source.inter_comm_records(publisher_handles, callback_object)
+        records = self._source.inter_comm_records(
+            publisher_handles, callback_object, time_range=self._time_range)
 
         columns = [COLUMN_NAME.RCLCPP_PUBLISH_TIMESTAMP]
         if COLUMN_NAME.RCL_PUBLISH_TIMESTAMP in records.columns:
@@ -1367,10 +1504,12 @@ class FilteredRecordsSource:
 
     def __init__(self, lttng: Lttng):
         self._lttng = lttng
+        self._slicers: dict[tuple[str, int | tuple[int, ...]], RecordsSlicer] = {}
 
     def tilde_subscribe_records(
         self,
-        tilde_subscription: int
+        tilde_subscription: int,
+        time_range: tuple[int | None, int | None] | None = None,
     ) -> RecordsInterface:
         """
         Compose filtered tilde subscribe records.
@@ -1379,6 +1518,8 @@ class FilteredRecordsSource:
         ----------
         tilde_subscription : int
             TILDE subscription
+        time_range : tuple[int | None, int | None] | None
+            If given, only records whose timestamp is within the range are returned.
 
         Returns
         -------
@@ -1406,7 +1547,9 @@ class FilteredRecordsSource:
         sub_records = RecordsFactory.create_instance(None, columns=column_values)
 
         if tilde_subscription is not None and tilde_subscription in grouped_records:
-            sub_records_ = grouped_records[tilde_subscription].clone()
+            sub_records_ = self._clone_group(
+                'tilde_sub', grouped_records, tilde_subscription,
+                COLUMN_NAME.TILDE_SUBSCRIBE_TIMESTAMP, time_range)
             sub_records.concat(sub_records_)
 
         sub_records.drop_columns([COLUMN_NAME.TILDE_SUBSCRIPTION])
@@ -1415,7 +1558,8 @@ class FilteredRecordsSource:
     def sub_records(
         self,
         inter_callback_object: int,
-        intra_callback_object: int | None
+        intra_callback_object: int | None,
+        time_range: tuple[int | None, int | None] | None = None,
     ) -> RecordsInterface:
         """
         Compose filtered subscribe records.
@@ -1426,6 +1570,8 @@ class FilteredRecordsSource:
             inter callback object
         intra_callback_object : int | None
             intra callback object
+        time_range : tuple[int | None, int | None] | None
+            If given, only records whose timestamp is within the range are returned.
 
         Returns
         -------
@@ -1454,10 +1600,14 @@ class FilteredRecordsSource:
         sub_records = RecordsFactory.create_instance(None, columns=column_values)
 
         if inter_callback_object in grouped_records:
-            sub_records.concat(grouped_records[inter_callback_object].clone())
+            sub_records.concat(self._clone_group(
+                'sub', grouped_records, inter_callback_object,
+                COLUMN_NAME.CALLBACK_START_TIMESTAMP, time_range))
 
         if intra_callback_object is not None and intra_callback_object in grouped_records:
-            intra_sub_records = grouped_records[intra_callback_object].clone()
+            intra_sub_records = self._clone_group(
+                'sub', grouped_records, intra_callback_object,
+                COLUMN_NAME.CALLBACK_START_TIMESTAMP, time_range)
             sub_records.concat(intra_sub_records)
             sub_records.sort(COLUMN_NAME.CALLBACK_START_TIMESTAMP)
 
@@ -1466,7 +1616,8 @@ class FilteredRecordsSource:
     def inter_comm_records(
         self,
         publisher_handles: list[int],
-        callback_object: int
+        callback_object: int,
+        time_range: tuple[int | None, int | None] | None = None,
     ) -> RecordsInterface:
         """
         Compose filtered inter communication records.
@@ -1477,14 +1628,16 @@ class FilteredRecordsSource:
             publisher handles
         callback_object : int
             callback object
+        time_range : tuple[int | None, int | None] | None
+            If given, only records whose timestamp is within the range are returned.
 
         Returns
         -------
         RecordsInterface
 
         """
-        pub_records = self.publish_records(publisher_handles)
-        sub_records = self.sub_records(callback_object, None)
+        pub_records = self.publish_records(publisher_handles, time_range)
+        sub_records = self.sub_records(callback_object, None, time_range)
 
         merged = merge(
             left_records=pub_records,
@@ -1524,7 +1677,8 @@ class FilteredRecordsSource:
     def intra_comm_records(
         self,
         publisher_handles: list[int],
-        intra_callback_object: int | None
+        intra_callback_object: int | None,
+        time_range: tuple[int | None, int | None] | None = None,
     ) -> RecordsInterface:
         """
         Compose filtered intra communication records.
@@ -1535,6 +1689,8 @@ class FilteredRecordsSource:
             publisher handles
         intra_callback_object : int | None
             intra callback object
+        time_range : tuple[int | None, int | None] | None
+            If given, only records whose timestamp is within the range are returned.
 
         Returns
         -------
@@ -1570,7 +1726,9 @@ class FilteredRecordsSource:
             for publisher_handle in publisher_handles:
                 key = (intra_callback_object, publisher_handle)
                 if key in grouped_records:
-                    records_ = grouped_records[key].clone()
+                    records_ = self._clone_group(
+                        'intra_comm', grouped_records, key,
+                        COLUMN_NAME.RCLCPP_PUBLISH_TIMESTAMP, time_range)
                     records.concat(records_)
         records.sort(COLUMN_NAME.RCLCPP_PUBLISH_TIMESTAMP)
 
@@ -1579,6 +1737,7 @@ class FilteredRecordsSource:
     def publish_records(
         self,
         publisher_handles: list[int],
+        time_range: tuple[int | None, int | None] | None = None,
     ) -> RecordsInterface:
         """
         Compose publish records.
@@ -1587,6 +1746,8 @@ class FilteredRecordsSource:
         ----------
         publisher_handles : list[int]
             publisher handles
+        time_range : tuple[int | None, int | None] | None
+            If given, only records whose timestamp is within the range are returned.
 
         Returns
         -------
@@ -1638,7 +1799,9 @@ class FilteredRecordsSource:
 
         for publisher_handle in publisher_handles:
             if publisher_handle in grouped_records:
-                inter_pub_records = grouped_records[publisher_handle].clone()
+                inter_pub_records = self._clone_group(
+                    'publish', grouped_records, publisher_handle,
+                    COLUMN_NAME.RCLCPP_PUBLISH_TIMESTAMP, time_range)
                 pub_records.concat(inter_pub_records)
 
         pub_records.sort(COLUMN_NAME.RCLCPP_PUBLISH_TIMESTAMP)
@@ -1647,7 +1810,8 @@ class FilteredRecordsSource:
 
     def tilde_publish_records(
         self,
-        tilde_publishers: Sequence[int]
+        tilde_publishers: Sequence[int],
+        time_range: tuple[int | None, int | None] | None = None,
     ) -> RecordsInterface:
         """
         Compose tilde publish records.
@@ -1656,6 +1820,8 @@ class FilteredRecordsSource:
         ----------
         tilde_publishers : Sequence[int]
             TILDE publishers
+        time_range : tuple[int | None, int | None] | None
+            If given, only records whose timestamp is within the range are returned.
 
         Returns
         -------
@@ -1684,12 +1850,94 @@ class FilteredRecordsSource:
 
         for tilde_publisher in tilde_publishers:
             if tilde_publisher in grouped_records:
-                tilde_records_ = grouped_records[tilde_publisher].clone()
+                tilde_records_ = self._clone_group(
+                    'tilde_pub', grouped_records, tilde_publisher,
+                    COLUMN_NAME.TILDE_PUBLISH_TIMESTAMP, time_range)
                 tilde_records.concat(tilde_records_)
 
         tilde_records.drop_columns([COLUMN_NAME.TILDE_PUBLISHER])
         return tilde_records
 
+    def has_intra_comm_records(
+        self,
+        publisher_handles: list[int],
+        intra_callback_object: int | None
+    ) -> bool:
+        """
+        Check whether intra communication records exist.
+
+        Parameters
+        ----------
+        publisher_handles : list[int]
+            publisher handles
+        intra_callback_object : int | None
+            intra callback object
+
+        Returns
+        -------
+        bool
+            Equivalent to len(intra_comm_records(...)) > 0,
+            without composing the records.
+
+        """
+        if intra_callback_object is None:
+            return False
+
+        grouped_records = self._grouped_intra_comm_records
+        return any(
+            (intra_callback_object, publisher_handle) in grouped_records
+            for publisher_handle in publisher_handles
+        )
+
+    def callback_table(
+        self,
+        time_range: tuple[int | None, int | None] | None = None,
+    ) -> pd.DataFrame:
+        """
+        Get callback records of all callbacks as a table.
+
+        Parameters
+        ----------
+        time_range : tuple[int | None, int | None] | None
+            If given, only records whose callback start timestamp is within the range
+            are returned.
+
+        Returns
+        -------
+        pd.DataFrame
+            Equivalent to lttng.compose_callback_records().to_dataframe().
+            The table is shared between calls and must not be modified.
+
+        """
+        table = self._callback_table
+        if time_range is None:
+            return table
+
+        min_ns, max_ns = time_range
+        start = table[COLUMN_NAME.CALLBACK_START_TIMESTAMP]
+        mask = np.full(len(table), True)
+        if min_ns is not None:
+            mask &= (start >= min_ns).values
+        if max_ns is not None:
+            mask &= (start <= max_ns).values
+        return table[mask]
+
+    def _clone_group(
+        self,
+        group_name: str,
+        grouped_records: dict,
+        key: int | tuple[int, ...],
+        column: str,
+        time_range: tuple[int | None, int | None] | None,
+    ) -> RecordsInterface:
+        if time_range is None:
+            return grouped_records[key].clone()
+
+        slicer_key = (group_name, key)
+        if slicer_key not in self._slicers:
+            self._slicers[slicer_key] = RecordsSlicer(grouped_records[key], column)
+        return self._slicers[slicer_key].slice(*time_range)
+
     def _expand_key_tuple(
         self,
         group: dict[tuple[int, ...], RecordsInterface]
@@ -1703,7 +1951,8 @@ class FilteredRecordsSource:
     def callback_records(
         self,
         inter_callback_object: int,
-        intra_callback_object: int | None
+        intra_callback_object: int | None,
+        time_range: tuple[int | None, int | None] | None = None,
     ) -> RecordsInterface:
         """
         Compose callback records.
@@ -1714,6 +1963,8 @@ class FilteredRecordsSource:
             inter callback object
         intra_callback_object : int | None
             intra callback object
+        time_range : tuple[int | None, int | None] | None
+            If given, only records whose timestamp is within the range are returned.
 
         Returns
         -------
@@ -1736,11 +1987,15 @@ class FilteredRecordsSource:
         )
 
         if inter_callback_object in records:
-            inter_callback_records = records[inter_callback_object].clone()
+            inter_callback_records = self._clone_group(
+                'callback', records, inter_callback_object,
+                COLUMN_NAME.CALLBACK_START_TIMESTAMP, time_range)
             callback_records.concat(inter_callback_records)
 
         if intra_callback_object is not None and intra_callback_object in records:
-            intra_callback_records = records[intra_callback_object].clone()
+            intra_callback_records = self._clone_group(
+                'callback', records, intra_callback_object,
+                COLUMN_NAME.CALLBACK_START_TIMESTAMP, time_range)
             callback_records.concat(intra_callback_records)
             callback_records.sort(COLUMN_NAME.CALLBACK_START_TIMESTAMP)
 
@@ -1748,7 +2003,8 @@ class FilteredRecordsSource:
 
     def path_beginning_records(
         self,
-        publisher_handles: list[int]
+        publisher_handles: list[int],
+        time_range: tuple[int | None, int | None] | None = None,
     ) -> RecordsInterface:
         """
         Compose callback_start to publish records.
@@ -1757,6 +2013,8 @@ class FilteredRecordsSource:
         ----------
         publisher_handles : list[int]
             publisher handles
+        time_range : tuple[int | None, int | None] | None
+            If given, only records whose timestamp is within the range are returned.
 
         Returns
         -------
@@ -1790,12 +2048,27 @@ class FilteredRecordsSource:
 
         for publisher_handle in publisher_handles:
             if publisher_handle in grouped_records:
-                records.concat(grouped_records[publisher_handle].clone())
+                records.concat(self._clone_group(
+                    'path_beginning', grouped_records, publisher_handle,
+                    COLUMN_NAME.CALLBACK_START_TIMESTAMP, time_range))
 
         records.sort(COLUMN_NAME.CALLBACK_START_TIMESTAMP)
 
         return records
 
+    @cached_property
+    def _callback_table(self) -> pd.DataFrame:
+        table = self._lttng.compose_callback_records().to_dataframe()
+        columns = [
+            COLUMN_NAME.CALLBACK_START_TIMESTAMP,
+            COLUMN_NAME.CALLBACK_END_TIMESTAMP,
+            COLUMN_NAME.CALLBACK_OBJECT,
+        ]
+        for column in columns:
+            if column not in table.columns:
+                table[column] = pd.Series(dtype='float64')
+        return table
+
     @cached_property
     def _grouped_callback_records(self) -> dict[int, RecordsInterface]:
         records = self._lttng.compose_callback_records()
@@ -253,6 +253,81 @@ class TracePointData:
 
         self._df = df
 
+    def derive_column(
+        self,
+        column: str,
+        f: Callable[[pd.DataFrame], Any]
+    ) -> None:
+        """
+        Add column computed from whole columns.
+
+        Unlike add_column, f is called once with the whole data,
+        so that the column can be derived by vectorised expressions.
+
+        Parameters
+        ----------
+        column : str
+            column name to be added.
+        f : Callable[[pd.DataFrame], Any]
+            function returning the column values in row order,
+            e.g. lambda df: df['a'] + df['b'].
+
+        """
+        values = f(self._df)
+        if isinstance(values, pd.Series):
+            values = values.to_numpy()
+        df = self._df.copy()
+        df[column] = values
+        self._df = df
+
+    def add_id_column(
+        self,
+        column: str,
+        source_column: str,
+        prefix: str
+    ) -> None:
+        """
+        Add column of prefixed id strings.
+
+        Parameters
+        ----------
+        column : str
+            column name to be added.
+        source_column : str
+            column name whose values are formatted.
+        prefix : str
+            prefix of ids. Each value becomes f'{prefix}{value}'.
+
+        """
+        self.derive_column(
+            column, lambda df: [f'{prefix}{v}' for v in df[source_column].to_list()])
+
+    def add_order_column(
+        self,
+        column: str,
+        key_columns: list[str],
+    ) -> None:
+        """
+        Add column of the order of appearance within each key.
+
+        Rows with the same key values are numbered 0, 1, 2, ... in the current row order.
+        Missing values are treated as a key value as well.
+
+        Parameters
+        ----------
+        column : str
+            column name to be added.
+        key_columns : list[str]
+            column names that form the key.
+
+        """
+        if len(self._df) == 0:
+            self.derive_column(column, lambda _: [])
+            return
+        self.derive_column(
+            column,
+            lambda df: df.groupby(key_columns, sort=False, dropna=False).cumcount())
+
     def remove_column(self, column: str) -> None:
         """
         Remove column.
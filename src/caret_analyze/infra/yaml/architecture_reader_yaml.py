@@ -15,7 +15,11 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
+from functools import cached_property
+from hashlib import sha256
 from logging import getLogger
+import os
+import pickle
 from typing import Any
 
 import yaml
@@ -32,16 +36,87 @@ from ...value_objects import (CallbackGroupValue, CallbackType, ExecutorValue,
 
 logger = getLogger(__name__)
 
+_SafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
 
-class ArchitectureReaderYaml(ArchitectureReader):
 
-    def __init__(self, file_path: str):
+class ArchitectureReaderYaml(ArchitectureReader):
+    """
+    Architecture reader for yaml files.
+
+    Nodes are indexed by name on first access,
+    so that per-node getters do not scan the whole node list.
+    """
+
+    CACHE_VERSION = 1
+    CACHE_SUFFIX = '.cache'
+
+    def __init__(self, file_path: str, use_cache: bool = False):
+        """
+        Construct an instance.
+
+        Parameters
+        ----------
+        file_path : str
+            path to the architecture yaml file.
+        use_cache : bool
+            If True, the parsed architecture is stored in a binary sidecar file
+            (file_path + '.cache') and reused while the yaml file is unchanged.
+            The sidecar is keyed by the modification time and hash of the yaml file.
+
+        """
         with open(file_path, 'r') as f:
             yaml_str = f.read()
-        self._arch = yaml.safe_load(yaml_str)
 
-        if self._arch is None:
+        self._publish_topic_names: dict[str, dict[str, list[str]]] = {}
+        arch: Any = None
+        if use_cache:
+            key = self._get_cache_key(file_path, yaml_str)
+            arch = self._load_cache(file_path, key)
+            if arch is None:
+                arch = yaml.load(yaml_str, Loader=_SafeLoader)
+                self._store_cache(file_path, key, arch)
+        else:
+            arch = yaml.load(yaml_str, Loader=_SafeLoader)
+
+        if arch is None:
             raise InvalidYamlFormatError('Failed to parse yaml.')
+        self._arch: dict = arch
+
+    @staticmethod
+    def _get_cache_key(file_path: str, yaml_str: str) -> tuple[int | None, str]:
+        try:
+            mtime_ns: int | None = os.stat(file_path).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        return mtime_ns, sha256(yaml_str.encode('utf-8')).hexdigest()
+
+    @classmethod
+    def _load_cache(cls, file_path: str, key: tuple[int | None, str]) -> Any:
+        cache_path = file_path + cls.CACHE_SUFFIX
+        if key[0] is None or not os.path.isfile(cache_path):
+            return None
+        try:
+            with open(cache_path, 'rb') as f:
+                cache = pickle.load(f)
+            if cache['version'] != cls.CACHE_VERSION or cache['key'] != key:
+                return None
+            return cache['arch']
+        except Exception as e:
+            logger.info(f'Failed to load yaml cache. {cache_path}: {e}')
+            return None
+
+    @classmethod
+    def _store_cache(cls, file_path: str, key: tuple[int | None, str], arch: Any) -> None:
+        if key[0] is None or arch is None:
+            return
+        cache_path = file_path + cls.CACHE_SUFFIX
+        try:
+            with open(cache_path, 'wb') as f:
+                pickle.dump(
+                    {'version': cls.CACHE_VERSION, 'key': key, 'arch': arch},
+                    f, protocol=pickle.HIGHEST_PROTOCOL)
+        except (OSError, pickle.PicklingError) as e:
+            logger.info(f'Failed to store yaml cache. {cache_path}: {e}')
 
     def get_node_names_and_cb_symbols(
         self,
@@ -83,16 +158,20 @@ class ArchitectureReaderYaml(ArchitectureReader):
         node_name: str,
         callback_name: str
     ) -> list[str]:
-        node_dict = self._get_node_dict(node_name)
-        if 'publishes' not in node_dict.keys():
-            return []
+        return list(self._get_publish_topic_names_by_callback(node_name).get(callback_name, []))
 
-        publishes = self._get_value(node_dict, 'publishes')
-        topic_names = [
-            self._get_value(p, 'topic_name')
-            for p
-            in publishes
-            if callback_name in self._get_value(p, 'callback_names')]
+    def _get_publish_topic_names_by_callback(self, node_name: str) -> dict[str, list[str]]:
+        if node_name in self._publish_topic_names:
+            return self._publish_topic_names[node_name]
+
+        node_dict = self._get_node_dict(node_name)
+        topic_names: dict[str, list[str]] = {}
+        if 'publishes' in node_dict.keys():
+            for p in self._get_value(node_dict, 'publishes'):
+                topic_name = self._get_value(p, 'topic_name')
+                for callback_name in dict.fromkeys(self._get_value(p, 'callback_names')):
+                    topic_names.setdefault(callback_name, []).append(topic_name)
+        self._publish_topic_names[node_name] = topic_names
         return topic_names
 
     def get_timer_callbacks(
@@ -357,9 +436,7 @@ class ArchitectureReaderYaml(ArchitectureReader):
         self,
         node_name: str
     ) -> dict:
-        node_values = self._get_value(self._arch, 'nodes')
-        nodes = list(filter(lambda x: self._get_value(
-            x, 'node_name') == node_name, node_values))
+        nodes = self._node_dicts.get(node_name, [])
 
         if len(nodes) == 0:
             message = f'Failed to find node by node_name. target node name = {node_name}'
@@ -372,3 +449,8 @@ class ArchitectureReaderYaml(ArchitectureReader):
             raise InvalidYamlFormatError(message)
 
         return nodes[0]
+
+    @cached_property
+    def _node_dicts(self) -> dict[str, list[dict]]:
+        node_values = self._get_value(self._arch, 'nodes')
+        return Util.group_items(lambda x: self._get_value(x, 'node_name'), node_values)
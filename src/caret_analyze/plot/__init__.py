@@ -13,11 +13,13 @@
 # limitations under the License.
 
 from .graphviz.chain_latency import chain_latency
+from .metrics_cache import MetricsCache
 from .plot_base import PlotBase
 from .plot_facade import Plot
 from .stacked_bar import LatencyStackedBar
 
 __all__ = [
+    'MetricsCache',
     'Plot',
     'PlotBase',
     'chain_latency',
@@ -18,19 +18,17 @@ from collections.abc import Sequence
 
 from bokeh.plotting import figure as Figure
 
-from caret_analyze.record import Frequency, Latency, Period, RecordsInterface, ResponseTime
-
-from numpy import histogram
+import numpy as np
 import pandas as pd
 
+from ..metrics_cache import MetricsCache
 from ..plot_base import PlotBase
 from ..util import get_clock_converter
 from ..visualize_lib import VisualizeLibInterface
 from ...common import ClockConverter
-from ...exceptions import UnsupportedTypeError
+from ...exceptions import InvalidArgumentError, UnsupportedTypeError
 from ...runtime import CallbackBase, Communication, Path, Publisher, Subscription
 
-MetricsTypes = Frequency | Latency | Period | ResponseTime
 HistTypes = CallbackBase | Communication | Path | Publisher | Subscription
 
 
@@ -39,17 +37,21 @@ class HistogramPlot(PlotBase):
 
     def __init__(
         self,
-        metrics: list[MetricsTypes],
         visualize_lib: VisualizeLibInterface,
         target_objects: Sequence[HistTypes],
         metrics_name: str,
-        case: str | None = None
+        case: str | None = None,
+        bins: int | Sequence[float] | np.ndarray | None = None,
+        log_scale: bool = False
     ) -> None:
-        self._metrics = metrics
+        if isinstance(bins, int) and bins < 1:
+            raise InvalidArgumentError(f'bins must be 1 or more. {bins}')
         self._visualize_lib = visualize_lib
         self._target_objects = target_objects
         self._metrics_name = metrics_name
         self._case = case
+        self._bins = bins
+        self._log_scale = log_scale
 
     def to_dataframe(
         self,
@@ -121,57 +123,64 @@ class HistogramPlot(PlotBase):
             bins,
             self._target_objects,
             self._metrics_name,
-            self._case
+            self._case,
+            self._log_scale
             )
 
     def _histogram_data(self, converter: ClockConverter | None
                         ) -> tuple[list[list[int]], list[float]]:
-
-        # wrapper function of to_records()/to_xxx_records()
-        def to_records(metrics: MetricsTypes,
-                       converter: ClockConverter | None) -> RecordsInterface:
-            if isinstance(metrics, ResponseTime):
-                if self._case == 'all':
-                    return metrics.to_all_records(converter=converter)
-                elif self._case == 'best':
-                    return metrics.to_best_case_records(converter=converter)
-                elif self._case == 'worst':
-                    return metrics.to_worst_case_records(converter=converter)
-                elif self._case == 'worst-with-external-latency':
-                    return metrics.to_worst_with_external_latency_case_records(converter=converter)
-                else:
-                    raise ValueError('optional argument "case" must be following: \
-                                     "all", "best", "worst", "worst-with-external-latency".')
-            else:
-                return metrics.to_records(converter=converter)
-
-        data_list: list[list[int]] = [
-            [
-                _ for _ in to_records(m, converter).get_column_series(self._metrics_name)
-                if _ is not None
+        cases = ['all', 'best', 'worst', 'worst-with-external-latency']
+        if self._metrics_name == 'response_time' and self._case not in cases:
+            raise ValueError('optional argument "case" must be following: \
+                             "all", "best", "worst", "worst-with-external-latency".')
+
+        if len(self._target_objects) == 0:
+            return [], []
+
+        # With precomputed bin edges, each object is counted as soon as its values are read.
+        if self._bins is not None and not isinstance(self._bins, int):
+            edges = np.asarray(self._bins, dtype=np.float64)
+            hists = [
+                np.histogram(self._values(target_object, converter), edges)[0].tolist()
+                for target_object in self._target_objects
             ]
-            for m in self._metrics
-        ]
-
-        if self._metrics_name in ['period', 'latency', 'response_time']:
-            data_list = [[_ *10**(-6) for _ in data] for data in data_list]
-
-        filled_data_list = [data for data in data_list if len(data)]
-        if len(filled_data_list) != 0:
-            max_value = max(max(filled_data_list, key=lambda x: max(x)))
-            min_value = min(min(filled_data_list, key=lambda x: min(x)))
-            data_range = (min_value, max_value)
+            return hists, edges.tolist()
+
+        values_list = [self._values(_, converter) for _ in self._target_objects]
+        filled_values_list = [values for values in values_list if len(values) > 0]
+        if self._log_scale:
+            filled_values_list = [values[values > 0] for values in filled_values_list]
+            filled_values_list = [values for values in filled_values_list if len(values) > 0]
+
+        data_range: tuple[float, float] | None = None
+        if len(filled_values_list) > 0:
+            data_range = (min(values.min() for values in filled_values_list),
+                          max(values.max() for values in filled_values_list))
+
+        num_bins = self._bins or 20
+        if self._log_scale:
+            if data_range is None:
+                raise InvalidArgumentError('log_scale requires positive values.')
+            edges = np.geomspace(*data_range, num_bins + 1)
         else:
-            data_range = None
+            edges = np.histogram_bin_edges([], num_bins, data_range)
 
-        hists: list[list[int]] = []
-        bins: list[float] = []
-        for hist_type in data_list:
-            hist, tmp_bins = histogram(hist_type, 20, data_range, density=False)
-            bins = list(tmp_bins)
-            hists.append(list(hist))
+        hists = [np.histogram(values, edges)[0].tolist() for values in values_list]
+        return hists, edges.tolist()
 
-        return hists, bins
+    def _values(
+        self,
+        target_object: HistTypes,
+        converter: ClockConverter | None
+    ) -> np.ndarray:
+        # Records of the same targets are shared with other plots.
+        records = MetricsCache.default()._get_metrics_records(
+            target_object, self._metrics_name, converter, self._case)
+        values = records.get_column_array(self._metrics_name)
+        values = values[~np.isnan(values)]
+        if self._metrics_name in ['period', 'latency', 'response_time']:
+            values *= 10**(-6)
+        return values
 
     def _validate_xaxis_type(self, xaxis_type: str) -> None:
         if xaxis_type not in ['system_time', 'sim_time', 'index']:
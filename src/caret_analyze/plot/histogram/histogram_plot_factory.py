@@ -16,14 +16,13 @@ from __future__ import annotations
 
 from collections.abc import Sequence
 
-from caret_analyze.record import Frequency, Latency, Period, ResponseTime
+import numpy as np
 
 from .histogram_plot import HistogramPlot
 from ..visualize_lib import VisualizeLibInterface
 from ...exceptions import UnsupportedTypeError
 from ...runtime import CallbackBase, Communication, Path, Publisher, Subscription
 
-MetricsType = Frequency | Latency | Period | ResponseTime
 HistTypes = CallbackBase | Communication | Path | Publisher | Subscription
 
 
@@ -35,7 +34,9 @@ class HistogramPlotFactory:
         target_objects: Sequence[HistTypes],
         metrics_name: str,
         visualize_lib: VisualizeLibInterface,
-        case: str | None = None
+        case: str | None = None,
+        bins: int | Sequence[float] | np.ndarray | None = None,
+        log_scale: bool = False
     ) -> HistogramPlot:
         """
         Create an instance of HistogramPlot.
@@ -52,6 +53,12 @@ class HistogramPlotFactory:
             supported case: [all/best/worst/worst-with-external-latency].
         visualize_lib : VisualizeLibInterface
             Instance of VisualizeLibInterface used for visualization.
+        bins : int | Sequence[float] | np.ndarray | None, optional
+            Number of bins, or bin edges, by default 20 bins.
+            With bin edges, the histogram of each object is counted one by one
+            without holding the values of all objects.
+        log_scale : bool, optional
+            If True, bins are spaced evenly on a log scale. Non-positive values are ignored.
 
         Returns
         -------
@@ -63,29 +70,17 @@ class HistogramPlotFactory:
             Argument metrics is not "frequency", "latency", or "period".
 
         """
-        metrics_list: list[MetricsType] = []
-        if metrics_name == 'frequency':
-            metrics_list =\
-                [Frequency(target_object.to_records()) for target_object in target_objects]
-        elif metrics_name == 'latency':
-            metrics_list =\
-                [Latency(target_object.to_records()) for target_object in target_objects]
-        elif metrics_name == 'period':
-            metrics_list =\
-                [Period(target_object.to_records()) for target_object in target_objects]
-        elif metrics_name == 'response_time':
-            metrics_list =\
-                [ResponseTime(target_object.to_records()) for target_object in target_objects]
-        else:
+        if metrics_name not in ['frequency', 'latency', 'period', 'response_time']:
             raise UnsupportedTypeError(
                 'Unsupported metrics specified. '
                 'Supported metrics: [frequency/latency/period]'
             )
 
         return HistogramPlot(
-            metrics_list,
             visualize_lib,
             target_objects,
             metrics_name,
-            case
+            case,
+            bins,
+            log_scale
             )
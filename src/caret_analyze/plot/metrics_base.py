@@ -42,11 +42,35 @@ class MetricsBase(metaclass=ABCMeta):
     def to_dataframe(self, xaxis_type: str = 'system_time') -> pd.DataFrame:
         raise NotImplementedError()
 
-    @abstractmethod
     def to_timeseries_records_list(
         self,
         xaxis_type: str = 'system_time'
     ) -> list[RecordsInterface]:
+        """
+        Get timeseries records list of all target objects.
+
+        Parameters
+        ----------
+        xaxis_type : str
+            Type of time for timestamp.
+            "system_time", "index", or "sim_time" can be specified.
+            The default is "system_time".
+
+        Returns
+        -------
+        list[RecordsInterface]
+            Copies of the timeseries records, which can be modified.
+
+        """
+        return [records.clone() for records
+                in self._to_shared_timeseries_records_list(xaxis_type)]
+
+    @abstractmethod
+    def _to_shared_timeseries_records_list(
+        self,
+        xaxis_type: str = 'system_time'
+    ) -> list[RecordsInterface]:
+        # Records cached by MetricsCache, which are shared between plots and not copied.
         raise NotImplementedError()
 
     # TODO: Multi-column DataFrame are difficult for users to handle,
@@ -0,0 +1,272 @@
+# Copyright 2021 TIER IV, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from ..common import ClockConverter
+from ..exceptions import InvalidArgumentError
+from ..record import Frequency, Latency, Period, RecordsInterface, ResponseTime
+from ..runtime import CallbackBase, Communication, Path, Publisher, Subscription
+
+TargetTypes = CallbackBase | Communication | Path | Publisher | Subscription
+MetricsTypes = Frequency | Latency | Period | ResponseTime
+
+_RESPONSE_TIME_CASES = ['all', 'best', 'worst', 'worst-with-external-latency']
+
+
+class MetricsCache:
+    """
+    LRU cache of metrics shared by plot factories.
+
+    Records of target objects, metrics instances and metrics records are cached
+    by the target object, the metrics name, the converter and the response time case,
+    so that plotting the same targets with another chart type skips the recalculation.
+    Entries of a target object are invalidated when its records may change,
+    e.g. by clear_cache() or by changing include_last_callback of a path.
+
+    get_records() and get_metrics_records() return copies of the cached records,
+    so modifying them does not affect other plots.
+    Metrics instances returned by get_metrics() are shared and must not be updated.
+
+    The cache used by plots is MetricsCache.default(). It keeps the target objects
+    and their records until they are evicted, so call clear() to release them,
+    or set maxsize to limit the number of entries (0 disables caching).
+
+    Examples
+    --------
+    >>> from caret_analyze.plot import MetricsCache
+    >>> MetricsCache.default().clear()
+    >>> MetricsCache.default().maxsize = 64
+
+    """
+
+    DEFAULT_MAXSIZE = 1024
+
+    __default: MetricsCache | None = None
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE) -> None:
+        """
+        Construct an instance.
+
+        Parameters
+        ----------
+        maxsize : int
+            maximum number of cached entries.
+
+        """
+        self._entries: OrderedDict[Hashable, tuple[TargetTypes, Any]] = OrderedDict()
+        self.maxsize = maxsize
+
+    @classmethod
+    def default(cls) -> MetricsCache:
+        """
+        Get the cache shared by plot factories.
+
+        Returns
+        -------
+        MetricsCache
+            shared cache.
+
+        """
+        if cls.__default is None:
+            cls.__default = MetricsCache()
+        return cls.__default
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize: int) -> None:
+        if maxsize < 0:
+            raise InvalidArgumentError(f'maxsize must be 0 or more. {maxsize}')
+        self._maxsize = maxsize
+        self._evict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+    def get_records(self, target_object: TargetTypes) -> RecordsInterface:
+        """
+        Get records of a target object.
+
+        Parameters
+        ----------
+        target_object : TargetTypes
+            target object.
+
+        Returns
+        -------
+        RecordsInterface
+            copy of the same records as target_object.to_records().
+
+        """
+        return self._get_records(target_object).clone()
+
+    def _get_records(self, target_object: TargetTypes) -> RecordsInterface:
+        # The cached records are returned as they are, for read-only use in plots.
+        return self._get(target_object, ('records',), target_object.to_records)
+
+    def get_metrics(
+        self,
+        target_object: TargetTypes,
+        metrics_name: str
+    ) -> MetricsTypes:
+        """
+        Get metrics instance of a target object.
+
+        Parameters
+        ----------
+        target_object : TargetTypes
+            target object.
+        metrics_name : str
+            supported metrics: [frequency/latency/period/response_time]
+
+        Returns
+        -------
+        MetricsTypes
+            metrics instance created from the records of the target object.
+            It is shared by the cache, so it must not be updated.
+
+        Raises
+        ------
+        InvalidArgumentError
+            metrics_name is not supported.
+
+        """
+        metrics_types: dict[str, Callable[[RecordsInterface], MetricsTypes]] = {
+            'frequency': Frequency,
+            'latency': Latency,
+            'period': Period,
+            'response_time': ResponseTime,
+        }
+        if metrics_name not in metrics_types:
+            raise InvalidArgumentError(
+                f'Unsupported metrics: {metrics_name}. '
+                'Supported metrics: [frequency/latency/period/response_time]')
+
+        return self._get(
+            target_object, ('metrics', metrics_name),
+            lambda: metrics_types[metrics_name](self._get_records(target_object)))
+
+    def get_metrics_records(
+        self,
+        target_object: TargetTypes,
+        metrics_name: str,
+        converter: ClockConverter | None = None,
+        case: str | None = None,
+        interval_ns: int = 1000000000,
+        base_timestamp: int | None = None,
+        until_timestamp: int | None = None
+    ) -> RecordsInterface:
+        """
+        Get metrics records of a target object.
+
+        Parameters
+        ----------
+        target_object : TargetTypes
+            target object.
+        metrics_name : str
+            supported metrics: [frequency/latency/period/response_time]
+        converter : ClockConverter | None
+            converter to simulation time.
+        case : str | None
+            response time calculation method, used only for response time.
+            supported case: [all/best/worst/worst-with-external-latency].
+        interval_ns : int
+            interval to count the frequency, used only for frequency.
+        base_timestamp : int | None
+            start of the first interval, used only for frequency.
+        until_timestamp : int | None
+            end of the last interval, used only for frequency.
+
+        Returns
+        -------
+        RecordsInterface
+            copy of the cached metrics records.
+
+        Raises
+        ------
+        InvalidArgumentError
+            metrics_name or case is not supported.
+
+        """
+        return self._get_metrics_records(
+            target_object, metrics_name, converter, case,
+            interval_ns, base_timestamp, until_timestamp).clone()
+
+    def _get_metrics_records(
+        self,
+        target_object: TargetTypes,
+        metrics_name: str,
+        converter: ClockConverter | None = None,
+        case: str | None = None,
+        interval_ns: int = 1000000000,
+        base_timestamp: int | None = None,
+        until_timestamp: int | None = None
+    ) -> RecordsInterface:
+        # The cached records are returned as they are, for read-only use in plots.
+        if metrics_name == 'response_time' and case not in _RESPONSE_TIME_CASES:
+            raise InvalidArgumentError(
+                'optional argument "case" must be following: '
+                '"all", "best", "worst", "worst-with-external-latency".')
+
+        def to_records() -> RecordsInterface:
+            metrics = self.get_metrics(target_object, metrics_name)
+            if isinstance(metrics, ResponseTime):
+                if case == 'all':
+                    return metrics.to_all_records(converter=converter)
+                elif case == 'best':
+                    return metrics.to_best_case_records(converter=converter)
+                elif case == 'worst':
+                    return metrics.to_worst_case_records(converter=converter)
+                return metrics.to_worst_with_external_latency_case_records(converter=converter)
+            if isinstance(metrics, Frequency):
+                return metrics.to_records(
+                    interval_ns, base_timestamp, until_timestamp, converter=converter)
+            return metrics.to_records(converter=converter)
+
+        key = ('metrics_records', metrics_name, converter, case,
+               interval_ns, base_timestamp, until_timestamp)
+        return self._get(target_object, key, to_records)
+
+    def _get(
+        self,
+        target_object: TargetTypes,
+        key: tuple,
+        create: Callable[[], Any]
+    ) -> Any:
+        # The target object is kept in the entry, so that its id is not reused while cached.
+        key = (id(target_object), target_object._records_version, *key)
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return self._entries[key][1]
+
+        value = create()
+        if self._maxsize > 0:
+            self._entries[key] = (target_object, value)
+            self._evict()
+        return value
+
+    def _evict(self) -> None:
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
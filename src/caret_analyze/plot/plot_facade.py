@@ -17,6 +17,8 @@ from __future__ import annotations
 from collections.abc import Sequence
 from logging import getLogger
 
+import numpy as np
+
 from .callback_scheduling import CallbackSchedulingPlot, CallbackSchedulingPlotFactory
 from .histogram import HistogramPlotFactory
 from .message_flow import MessageFlowPlot, MessageFlowPlotFactory
@@ -245,7 +247,9 @@ class Plot:
     @staticmethod
     @type_check_decorator
     def create_frequency_histogram_plot(
-        *target_objects: CallbackBase | Communication | Publisher | Subscription
+        *target_objects: CallbackBase | Communication | Publisher | Subscription,
+        bins: int | Sequence[float] | np.ndarray | None = None,
+        log_scale: bool = False
     ) -> PlotBase:
         """
         Get frequency histogram plot instance.
@@ -255,6 +259,10 @@ class Plot:
         *target_objects : CallbackBase | Communication | Publisher | Subscription
             Instances that are the sources of the plotting.
             This also accepts multiple inputs by unpacking.
+        bins : int | Sequence[float] | np.ndarray | None, optional
+            Number of bins, or bin edges, by default 20 bins.
+        log_scale : bool, optional
+            If True, bins are spaced evenly on a log scale, by default False.
 
         Returns
         -------
@@ -262,13 +270,16 @@ class Plot:
 
         """
         visualize_lib = VisualizeLibFactory.create_instance()
-        plot = HistogramPlotFactory.create_instance(target_objects, 'frequency', visualize_lib)
+        plot = HistogramPlotFactory.create_instance(
+            target_objects, 'frequency', visualize_lib, bins=bins, log_scale=log_scale)
         return plot
 
     @staticmethod
     @type_check_decorator
     def create_latency_histogram_plot(
-        *target_objects: CallbackBase | Communication
+        *target_objects: CallbackBase | Communication,
+        bins: int | Sequence[float] | np.ndarray | None = None,
+        log_scale: bool = False
     ) -> PlotBase:
         """
         Get latency histogram plot instance.
@@ -278,6 +289,10 @@ class Plot:
         *target_objects : CallbackBase | Communication
             Instances that are the sources of the plotting.
             This also accepts multiple inputs by unpacking.
+        bins : int | Sequence[float] | np.ndarray | None, optional
+            Number of bins, or bin edges, by default 20 bins.
+        log_scale : bool, optional
+            If True, bins are spaced evenly on a log scale, by default False.
 
         Returns
         -------
@@ -285,13 +300,16 @@ class Plot:
 
         """
         visualize_lib = VisualizeLibFactory.create_instance()
-        plot = HistogramPlotFactory.create_instance(target_objects, 'latency', visualize_lib)
+        plot = HistogramPlotFactory.create_instance(
+            target_objects, 'latency', visualize_lib, bins=bins, log_scale=log_scale)
         return plot
 
     @staticmethod
     @type_check_decorator
     def create_period_histogram_plot(
-        *target_objects: CallbackBase | Communication | Publisher | Subscription
+        *target_objects: CallbackBase | Communication | Publisher | Subscription,
+        bins: int | Sequence[float] | np.ndarray | None = None,
+        log_scale: bool = False
     ) -> PlotBase:
         """
         Get period histogram plot instance.
@@ -301,6 +319,10 @@ class Plot:
         *target_objects : CallbackBase | Communication | Publisher | Subscription
             Instances that are the sources of the plotting.
             This also accepts multiple inputs by unpacking.
+        bins : int | Sequence[float] | np.ndarray | None, optional
+            Number of bins, or bin edges, by default 20 bins.
+        log_scale : bool, optional
+            If True, bins are spaced evenly on a log scale, by default False.
 
         Returns
         -------
@@ -308,7 +330,8 @@ class Plot:
 
         """
         visualize_lib = VisualizeLibFactory.create_instance()
-        plot = HistogramPlotFactory.create_instance(target_objects, 'period', visualize_lib)
+        plot = HistogramPlotFactory.create_instance(
+            target_objects, 'period', visualize_lib, bins=bins, log_scale=log_scale)
         return plot
 
     @staticmethod
@@ -316,6 +339,8 @@ class Plot:
     def create_response_time_histogram_plot(
         *target_objects: Path,
         case: str = 'all',
+        bins: int | Sequence[float] | np.ndarray | None = None,
+        log_scale: bool = False
     ) -> PlotBase:
         """
         Get response time histogram plot instance.
@@ -328,6 +353,10 @@ class Plot:
         case: str, optional
             Response time calculation method, all by default.
             supported case: [all/best/worst/worst-with-external-latency].
+        bins : int | Sequence[float] | np.ndarray | None, optional
+            Number of bins, or bin edges, by default 20 bins.
+        log_scale : bool, optional
+            If True, bins are spaced evenly on a log scale, by default False.
 
         Returns
         -------
@@ -336,6 +365,6 @@ class Plot:
         """
         visualize_lib = VisualizeLibFactory.create_instance()
         plot = HistogramPlotFactory.create_instance(
-            target_objects, 'response_time', visualize_lib, case
+            target_objects, 'response_time', visualize_lib, case, bins, log_scale
         )
         return plot
@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
 from ..util import get_clock_converter
@@ -54,11 +55,11 @@ class LatencyStackedBar:
         # NOTE: returned columns aren't used because they don't include 'start time'
         # TODO: delete 1e-6
         stacked_bar_dict, _ = self.to_stacked_bar_data(xaxis_type)
-        millisecond_dict: dict[str, list[float]] = {}
         if xaxis_type == 'system_time' or xaxis_type == 'sim_time':
-            for column in stacked_bar_dict:
-                millisecond_dict[column] = \
-                    [timestamp * 1e-6 for timestamp in stacked_bar_dict[column]]
+            millisecond_dict: dict[str, np.ndarray] = {
+                column: np.asarray(values, dtype=np.float64) * 1e-6
+                for column, values in stacked_bar_dict.items()
+            }
             df = pd.DataFrame(millisecond_dict)
             return df
         else:  # index
@@ -19,9 +19,10 @@ from collections.abc import Sequence
 import pandas as pd
 
 from ..metrics_base import MetricsBase
+from ..metrics_cache import MetricsCache
 from ..util import get_clock_converter
 from ...common import ClockConverter
-from ...record import Frequency, RecordsInterface
+from ...record import RecordsInterface
 from ...runtime import CallbackBase, Communication, Publisher, Subscription
 
 TimeSeriesTypes = CallbackBase | Communication | (Publisher | Subscription)
@@ -57,7 +58,7 @@ class FrequencyTimeSeries(MetricsBase):
         xaxis_type "system_time" and "index" return the same DataFrame.
 
         """
-        timeseries_records_list = self.to_timeseries_records_list(xaxis_type)
+        timeseries_records_list = self._to_shared_timeseries_records_list(xaxis_type)
         all_df = pd.DataFrame()
         for to, frequency_records in zip(self.target_objects, timeseries_records_list):
             frequency_df = frequency_records.to_dataframe()
@@ -75,7 +76,7 @@ class FrequencyTimeSeries(MetricsBase):
 
         return all_df.sort_index(level=0, axis=1, sort_remaining=False)
 
-    def to_timeseries_records_list(
+    def _to_shared_timeseries_records_list(
         self,
         xaxis_type: str = 'system_time'
     ) -> list[RecordsInterface]:
@@ -95,23 +96,9 @@ class FrequencyTimeSeries(MetricsBase):
             Frequency records list of all target objects.
 
         """
-        if self._target_objects and isinstance(self._target_objects[0], Communication):
-            columns = self._target_objects[0].to_records().columns
-            start_column = columns[0]
-            end_column = columns[1]
-
-            def row_filter_communication(record) -> bool:
-                """Return True only if communication is established."""
-                comm_start_column = start_column
-                comm_end_column = end_column
-                if (record.data.get(comm_start_column) is not None
-                        and record.data.get(comm_end_column) is not None):
-                    return True
-                else:
-                    return False
-
+        cache = MetricsCache.default()
         timeseries_records_list: list[RecordsInterface] = [
-            _.to_records() for _ in self._target_objects
+            cache._get_records(_) for _ in self._target_objects
         ]
 
         converter: ClockConverter | None = None
@@ -121,20 +108,14 @@ class FrequencyTimeSeries(MetricsBase):
         min_time, max_time = self._get_timestamp_range(timeseries_records_list)
 
         frequency_timeseries_list: list[RecordsInterface] = []
-        for records in timeseries_records_list:
-            frequency = Frequency(
-                records,
-                row_filter=row_filter_communication
-                if isinstance(records, Communication) else None
-            )
-            frequency_timeseries_list.append(frequency.to_records(
-                base_timestamp=min_time, until_timestamp=max_time,
-                converter=converter
+        for target_object in self._target_objects:
+            frequency_timeseries_list.append(cache._get_metrics_records(
+                target_object, 'frequency', converter,
+                base_timestamp=min_time, until_timestamp=max_time
             ))
 
         return frequency_timeseries_list
 
-    # TODO: Migrate into record.
     @staticmethod
     def _get_timestamp_range(
         timeseries_records_list: list[RecordsInterface]
@@ -144,12 +125,10 @@ class FrequencyTimeSeries(MetricsBase):
         for records in timeseries_records_list:
             if len(records) == 0:
                 continue
-            first_timestamp = records.get_column_series(records.columns[0])[0]
-            if isinstance(first_timestamp, int):
-                first_timestamps.append(first_timestamp)
-            last_timestamp = records.get_column_series(records.columns[0])[-1]
-            if isinstance(last_timestamp, int):
-                last_timestamps.append(last_timestamp)
+            timestamp_range = records.get_column_range(records.columns[0])
+            if timestamp_range is not None:
+                first_timestamps.append(timestamp_range[0])
+                last_timestamps.append(timestamp_range[1])
 
         if len(first_timestamps) == 0 or len(last_timestamps) == 0:
             return 0, 1  # Intended to show an empty figure.
@@ -19,9 +19,10 @@ from collections.abc import Sequence
 import pandas as pd
 
 from ..metrics_base import MetricsBase
+from ..metrics_cache import MetricsCache
 from ..util import get_clock_converter
 from ...common import ClockConverter
-from ...record import Latency, RecordsInterface
+from ...record import RecordsInterface
 from ...runtime import CallbackBase, Communication
 
 
@@ -55,7 +56,7 @@ class LatencyTimeSeries(MetricsBase):
         xaxis_type "system_time" and "index" return the same DataFrame.
 
         """
-        timeseries_records_list = self.to_timeseries_records_list(xaxis_type)
+        timeseries_records_list = self._to_shared_timeseries_records_list(xaxis_type)
         all_df = pd.DataFrame()
         for to, latency_records in zip(self._target_objects, timeseries_records_list):
             latency_df = latency_records.to_dataframe()
@@ -74,7 +75,7 @@ class LatencyTimeSeries(MetricsBase):
 
         return all_df.sort_index(level=0, axis=1, sort_remaining=False)
 
-    def to_timeseries_records_list(
+    def _to_shared_timeseries_records_list(
         self,
         xaxis_type: str = 'system_time'
     ) -> list[RecordsInterface]:
@@ -94,17 +95,14 @@ class LatencyTimeSeries(MetricsBase):
             Latency records list of all target objects.
 
         """
-        timeseries_records_list: list[RecordsInterface] = [
-            _.to_records() for _ in self._target_objects
-        ]
-
         converter: ClockConverter | None = None
         if xaxis_type == 'sim_time':
             converter = get_clock_converter(self._target_objects)
 
-        latency_timeseries_list: list[RecordsInterface] = []
-        for records in timeseries_records_list:
-            latency = Latency(records)
-            latency_timeseries_list.append(latency.to_records(converter=converter))
+        cache = MetricsCache.default()
+        latency_timeseries_list: list[RecordsInterface] = [
+            cache._get_metrics_records(target_object, 'latency', converter)
+            for target_object in self._target_objects
+        ]
 
         return latency_timeseries_list
@@ -19,9 +19,10 @@ from collections.abc import Sequence
 import pandas as pd
 
 from ..metrics_base import MetricsBase
+from ..metrics_cache import MetricsCache
 from ..util import get_clock_converter
 from ...common import ClockConverter
-from ...record import Period, RecordsInterface
+from ...record import RecordsInterface
 from ...runtime import CallbackBase, Communication, Publisher, Subscription
 
 TimeSeriesTypes = CallbackBase | Communication | (Publisher | Subscription)
@@ -62,7 +63,7 @@ class PeriodTimeSeries(MetricsBase):
         xaxis_type "system_time" and "index" return the same DataFrame.
 
         """
-        timeseries_records_list = self.to_timeseries_records_list(xaxis_type)
+        timeseries_records_list = self._to_shared_timeseries_records_list(xaxis_type)
         all_df = pd.DataFrame()
         for to, period_records in zip(self.target_objects, timeseries_records_list):
             period_df = period_records.to_dataframe()
@@ -81,7 +82,7 @@ class PeriodTimeSeries(MetricsBase):
 
         return all_df.sort_index(level=0, axis=1, sort_remaining=False)
 
-    def to_timeseries_records_list(
+    def _to_shared_timeseries_records_list(
         self,
         xaxis_type: str = 'system_time'
     ) -> list[RecordsInterface]:
@@ -101,36 +102,14 @@ class PeriodTimeSeries(MetricsBase):
             Period records list of all target objects.
 
         """
-        if self._target_objects and isinstance(self._target_objects[0], Communication):
-            columns = self._target_objects[0].to_records().columns
-            start_column = columns[0]
-            end_column = columns[1]
-
-            def row_filter_communication(record) -> bool:
-                """Return True only if communication is established."""
-                comm_start_column = start_column
-                comm_end_column = end_column
-                if (record.data.get(comm_start_column) is not None
-                        and record.data.get(comm_end_column) is not None):
-                    return True
-                else:
-                    return False
-
-        timeseries_records_list: list[RecordsInterface] = [
-            _.to_records() for _ in self._target_objects
-        ]
-
         converter: ClockConverter | None = None
         if xaxis_type == 'sim_time':
             converter = get_clock_converter(self._target_objects)
 
-        period_timeseries_list: list[RecordsInterface] = []
-        for records in timeseries_records_list:
-            period = Period(
-                records,
-                row_filter=row_filter_communication
-                if isinstance(records, Communication) else None
-            )
-            period_timeseries_list.append(period.to_records(converter=converter))
+        cache = MetricsCache.default()
+        period_timeseries_list: list[RecordsInterface] = [
+            cache._get_metrics_records(target_object, 'period', converter)
+            for target_object in self._target_objects
+        ]
 
         return period_timeseries_list
@@ -19,9 +19,10 @@ from collections.abc import Sequence
 import pandas as pd
 
 from ..metrics_base import MetricsBase
+from ..metrics_cache import MetricsCache
 from ..util import get_clock_converter
 from ...common import ClockConverter
-from ...record import RecordsInterface, ResponseTime
+from ...record import RecordsInterface
 from ...runtime import Path
 
 
@@ -57,7 +58,7 @@ class ResponseTimeTimeSeries(MetricsBase):
         xaxis_type "system_time" and "index" return the same DataFrame.
 
         """
-        timeseries_records_list = self.to_timeseries_records_list(xaxis_type)
+        timeseries_records_list = self._to_shared_timeseries_records_list(xaxis_type)
         all_df = pd.DataFrame()
         for to, response_records in zip(self._target_objects, timeseries_records_list):
             response_df = response_records.to_dataframe()
@@ -76,7 +77,7 @@ class ResponseTimeTimeSeries(MetricsBase):
 
         return all_df.sort_index(level=0, axis=1, sort_remaining=False)
 
-    def to_timeseries_records_list(
+    def _to_shared_timeseries_records_list(
         self,
         xaxis_type: str = 'system_time'
     ) -> list[RecordsInterface]:
@@ -96,29 +97,18 @@ class ResponseTimeTimeSeries(MetricsBase):
             Response time records list of all target objects.
 
         """
-        timeseries_records_list: list[RecordsInterface] = [
-            _.to_records() for _ in self._target_objects
-        ]
+        if self._case not in ['all', 'best', 'worst', 'worst-with-external-latency']:
+            raise ValueError('optional argument "case" must be following: \
+                             "all", "best", "worst", "worst-with-external-latency".')
 
         converter: ClockConverter | None = None
         if xaxis_type == 'sim_time':
             converter = get_clock_converter(self._target_objects)
 
-        response_timeseries_list: list[RecordsInterface] = []
-        for records in timeseries_records_list:
-            response = ResponseTime(records)
-            if self._case == 'all':
-                response_timeseries_list.append(response.to_all_records(converter=converter))
-            elif self._case == 'best':
-                response_timeseries_list.append(response.to_best_case_records(converter=converter))
-            elif self._case == 'worst':
-                response_timeseries_list.append(response.to_worst_case_records(
-                    converter=converter))
-            elif self._case == 'worst-with-external-latency':
-                response_timeseries_list.append(
-                    response.to_worst_with_external_latency_case_records(converter=converter))
-            else:
-                raise ValueError('optional argument "case" must be following: \
-                                 "all", "best", "worst", "worst-with-external-latency".')
+        cache = MetricsCache.default()
+        response_timeseries_list: list[RecordsInterface] = [
+            cache._get_metrics_records(target_object, 'response_time', converter, self._case)
+            for target_object in self._target_objects
+        ]
 
         return response_timeseries_list
@@ -16,6 +16,7 @@ from __future__ import annotations
 
 from collections.abc import Sequence
 
+from .metrics_cache import MetricsCache
 from ..common import ClockConverter
 from ..record import Range
 from ..runtime import CallbackBase, Communication, Path, Publisher, Subscription
@@ -26,7 +27,8 @@ TimeSeriesTypes = CallbackBase | Communication | (Publisher | Subscription) | Pa
 def get_clock_converter(
     target_objects: Sequence[TimeSeriesTypes],
 ) -> ClockConverter:
-    records_range = Range([to.to_records() for to in target_objects])
+    cache = MetricsCache.default()
+    records_range = Range([cache._get_records(to) for to in target_objects])
     frame_min, frame_max = records_range.get_range()
     if isinstance(target_objects[0], Communication):
         for comm in target_objects:
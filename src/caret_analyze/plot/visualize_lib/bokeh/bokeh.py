@@ -164,7 +164,8 @@ class Bokeh(VisualizeLibInterface):
         bins: list[float],
         target_objects: Sequence[HistTypes],
         metrics_name: str,
-        case: str | None = None
+        case: str | None = None,
+        log_scale: bool = False
     ) -> Figure:
         """
         Get a histogram figure.
@@ -183,8 +184,8 @@ class Bokeh(VisualizeLibInterface):
         case : str
             Parameter specifying all, best, worst, or worst-with-external-latency.
             Use to create Response time histogram graph.
-        converter: ClockConverter
-            Time conversion function at sim_time.
+        log_scale : bool
+            If True, x-axis is drawn in log scale.
 
 
         Returns
@@ -204,7 +205,8 @@ class Bokeh(VisualizeLibInterface):
         plot: Figure = Figure(
             title=f'Histogram of {metrics_name}'
             if case is None else f'Histogram of {metrics_name} --- {case} case ---',
-            x_axis_label=x_label, y_axis_label='The number of samples', width=800
+            x_axis_label=x_label, y_axis_label='The number of samples', width=800,
+            x_axis_type='log' if log_scale else 'linear'
             )
 
         hists_t = np.array(hist_list).T
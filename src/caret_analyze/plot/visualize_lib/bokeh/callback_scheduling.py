@@ -25,6 +25,7 @@ import pandas as pd
 
 from .util import (apply_x_axis_offset, ColorSelectorFactory, get_callback_param_desc,
                    HoverKeysFactory, HoverSource, init_figure, LegendManager, RectValues)
+from ...metrics_cache import MetricsCache
 from ....common import ClockConverter, Util
 from ....record import Clip, Range
 from ....runtime import CallbackBase, CallbackGroup, TimerCallback
@@ -59,7 +60,8 @@ class BokehCallbackSched:
         # Apply xaxis offset
         callbacks: list[CallbackBase] = Util.flatten(
             cbg.callbacks for cbg in self._callback_groups if len(cbg.callbacks) > 0)
-        records_range = Range([cb.to_records() for cb in callbacks])
+        cache = MetricsCache.default()
+        records_range = Range([cache._get_records(cb) for cb in callbacks])
         range_min, range_max = records_range.get_range()
         clip_min = int(range_min + self._lstrip_s*1.0e9)
         clip_max = int(range_max - self._rstrip_s*1.0e9)
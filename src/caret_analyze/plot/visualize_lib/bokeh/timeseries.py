@@ -24,6 +24,7 @@ from bokeh.plotting import ColumnDataSource, figure as Figure
 from .util import (apply_x_axis_offset, ColorSelectorFactory, get_callback_param_desc,
                    HoverKeysFactory, HoverSource, init_figure, LegendManager)
 from ...metrics_base import MetricsBase
+from ...metrics_cache import MetricsCache
 from ...util import get_clock_converter
 
 from ....common import ClockConverter
@@ -51,7 +52,8 @@ class BokehTimeSeries:
 
     def create_figure(self) -> Figure:
         target_objects = self._metrics.target_objects
-        timeseries_records_list = self._metrics.to_timeseries_records_list(self._xaxis_type)
+        timeseries_records_list = \
+            self._metrics._to_shared_timeseries_records_list(self._xaxis_type)
 
         # Initialize figure
         y_axis_label = timeseries_records_list[0].columns[1]
@@ -69,7 +71,9 @@ class BokehTimeSeries:
         fig = init_figure(title, self._ywheel_zoom, self._xaxis_type, y_axis_label)
 
         # Apply xaxis offset
-        records_range = Range([to.to_records() for to in target_objects])
+        # The cached records keep their timestamp ranges between figures.
+        cache = MetricsCache.default()
+        records_range = Range([cache._get_records(to) for to in target_objects])
         frame_min, frame_max = records_range.get_range()
         converter: ClockConverter | None = None
         if self._xaxis_type == 'sim_time':
@@ -85,6 +85,7 @@ class VisualizeLibInterface(metaclass=ABCMeta):
         bins: list[float],
         target_objects: Sequence[HistTypes],
         metrics_name: str,
-        case: str | None = None
+        case: str | None = None,
+        log_scale: bool = False
     ) -> Figure:
         raise NotImplementedError()
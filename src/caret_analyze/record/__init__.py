@@ -22,7 +22,17 @@ from .record import (merge,
                      Records,
                      RecordsInterface)
 from .record_factory import RecordFactory, RecordsFactory
-from .records_service import Frequency, Latency, Period, Range, ResponseTime, StackedBar
+from .records_service import (Frequency,
+                              Latency,
+                              MultiPathResponseTime,
+                              Period,
+                              QuantileSketch,
+                              Range,
+                              ResponseTime,
+                              StackedBar,
+                              StatisticsSample,
+                              StreamingStatistics)
+from .records_slicer import RecordsSlicer
 
 __all__ = [
     'Clip',
@@ -32,7 +42,9 @@ __all__ = [
     'DataFrameShaper',
     'Frequency',
     'Latency',
+    'MultiPathResponseTime',
     'Period',
+    'QuantileSketch',
     'Record',
     'RecordFactory',
     'RecordInterface',
@@ -40,8 +52,11 @@ __all__ = [
     'Range',
     'RecordsFactory',
     'RecordsInterface',
+    'RecordsSlicer',
     'ResponseTime',
     'StackedBar',
+    'StatisticsSample',
+    'StreamingStatistics',
     'Strip',
     'merge',
     'merge_sequential',
@@ -56,8 +56,8 @@ class Clip(DataFrameShaper):
 class Strip(DataFrameShaper):
 
     def __init__(self, lstrip_s: float, rstrip_s: float) -> None:
-        self._lstrip_ns = lstrip_s * 1.0e9
-        self._rstrip_ns = rstrip_s * 1.0e9
+        self._lstrip_ns = round(lstrip_s * 1.0e9)
+        self._rstrip_ns = round(rstrip_s * 1.0e9)
 
     def execute(self, df: pd.DataFrame) -> pd.DataFrame:
         if len(df.columns) == 0 or len(df) == 0:
@@ -73,6 +73,9 @@ class Strip(DataFrameShaper):
         start_ns = df.at[0, first_column]
         end_ns = df.at[len(df)-1, first_column]
 
+        return self.to_clip_with_range(start_ns, end_ns)
+
+    def to_clip_with_range(self, start_ns: int, end_ns: int) -> Clip:
         stripped_start_ns = start_ns + self._lstrip_ns
         stripped_end_ns = end_ns - self._rstrip_ns
         clip = Clip(stripped_start_ns, stripped_end_ns)
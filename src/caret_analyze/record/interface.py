@@ -18,6 +18,7 @@ from abc import abstractmethod
 from collections.abc import Callable, Iterator, Sequence
 
 from multimethod import multimethod as singledispatchmethod
+import numpy as np
 import pandas as pd
 
 from .column import ColumnValue
@@ -345,6 +346,54 @@ class RecordsInterface:
     def get_column_series(self, column_name: str) -> Sequence[int | None]:
         pass
 
+    @abstractmethod
+    def get_column_array(self, column_name: str) -> np.ndarray:
+        """
+        Get values of a column as a float array.
+
+        Parameters
+        ----------
+        column_name : str
+            target column name.
+
+        Returns
+        -------
+        np.ndarray
+            float64 array of the column values. Missing values are NaN.
+
+        Raises
+        ------
+        InvalidArgumentError
+            column_name is not a column of the records.
+
+        """
+        pass
+
+    @abstractmethod
+    def get_column_range(self, column_name: str) -> tuple[int, int] | None:
+        """
+        Get minimum and maximum values of a column.
+
+        The range is calculated on first use and cached until the records are modified.
+
+        Parameters
+        ----------
+        column_name : str
+            target column name.
+
+        Returns
+        -------
+        tuple[int, int] | None
+            minimum and maximum values, or None if the column has no values.
+
+        Raises
+        ------
+        InvalidArgumentError
+            column_name is not a column of the records.
+
+        """
+        pass
+
     def __len__(self) -> int:
         return len(self.data)
 
@@ -19,6 +19,7 @@ from copy import deepcopy
 from enum import IntEnum
 from itertools import groupby
 
+import numpy as np
 import pandas as pd
 
 from .column import Column, Columns, ColumnValue
@@ -103,6 +104,7 @@ class Records(RecordsInterface):
         self._validate(init_, column_names)
         self._data: list[RecordInterface] = init_
         self._columns: Columns = Columns(column_values or [])
+        self._column_ranges: dict[str, tuple[int, int] | None] = {}
 
     @staticmethod
     def _validate(
@@ -219,6 +221,7 @@ class Records(RecordsInterface):
         self._append_record(record)
 
     def _append_record(self, other: RecordInterface):
+        self._column_ranges.clear()
         self._data.append(other)
         unknown_columns = set(other.columns) - set(self.columns)
         if len(unknown_columns) > 0:
@@ -232,12 +235,14 @@ class Records(RecordsInterface):
             msg = 'Contains an unknown columns. '
             msg += f'{unknown_columns}'
             raise InvalidArgumentError(msg)
+        self._column_ranges.clear()
         self._data += list(other.data)
 
     def drop_columns(self, columns: list[str]) -> None:
         data_: list[RecordInterface]
 
         self._columns.drop(columns)
+        self._column_ranges.clear()
         data_ = self._data
 
         for record in data_:
@@ -257,6 +262,7 @@ class Records(RecordsInterface):
                 record.change_dict_key(key_from, key_to)
 
         self._columns.rename(columns)
+        self._column_ranges.clear()
         return None
 
     def append_column(self, column: ColumnValue, values: list[int]) -> None:
@@ -266,6 +272,7 @@ class Records(RecordsInterface):
             raise InvalidArgumentError('len(values) != len(records)')
 
         self._columns.append(Column(column))
+        self._column_ranges.clear()
         for record, value in zip(self.data, values):
             record.add(column.column_name, value)
 
@@ -276,6 +283,7 @@ class Records(RecordsInterface):
                 records.append(record)
 
         self._data = records._data
+        self._column_ranges.clear()
         return None
 
     def equals(self, records: RecordsInterface) -> bool:
@@ -309,11 +317,49 @@ class Records(RecordsInterface):
     def get_column_series(self, column_name: str) -> Sequence[int | None]:
         return self._get_column_series_core(self, column_name)
 
+    def get_column_array(self, column_name: str) -> np.ndarray:
+        return self._get_column_array_core(self, column_name)
+
+    def get_column_range(self, column_name: str) -> tuple[int, int] | None:
+        if column_name not in self._column_ranges:
+            self._column_ranges[column_name] = self._get_column_range_core(self, column_name)
+        return self._column_ranges[column_name]
+
     def get_row_series(self, index: int) -> RecordInterface:
         if index >= len(self.data):
             raise InvalidArgumentError('index exceeds the row size.')
         return self.data[index]
 
+    @staticmethod
+    def _get_column_range_core(
+        records: RecordsInterface,
+        column_name: str
+    ) -> tuple[int, int] | None:
+        if column_name not in records.columns:
+            raise InvalidArgumentError(f'Unknown column_name: {column_name}')
+        min_value: int | None = None
+        max_value: int | None = None
+        for datum in records.data:
+            value = datum.data.get(column_name)
+            if value is None:
+                continue
+            if min_value is None or value < min_value:
+                min_value = value
+            if max_value is None or value > max_value:
+                max_value = value
+        if min_value is None or max_value is None:
+            return None
+        return min_value, max_value
+
+    @staticmethod
+    def _get_column_array_core(records: RecordsInterface, column_name: str) -> np.ndarray:
+        if column_name not in records.columns:
+            raise InvalidArgumentError(f'Unknown column_name: {column_name}')
+        data = records.data
+        return np.fromiter(
+            (datum.data.get(column_name, np.nan) for datum in data),
+            dtype=np.float64, count=len(data))
+
     @staticmethod
     def _get_column_series_core(records: RecordsInterface, column_name: str):
         if column_name not in records.columns:
@@ -363,6 +409,7 @@ class Records(RecordsInterface):
         return deepcopy(self)
 
     def bind_drop_as_delay(self) -> None:
+        self._column_ranges.clear()
         self.sort_column_order(ascending=False, put_none_at_top=False)
 
         oldest_values: dict[str, int] = {}
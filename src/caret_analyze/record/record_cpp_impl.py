@@ -16,6 +16,7 @@ from __future__ import annotations
 
 from collections.abc import Callable, Sequence
 
+import numpy as np
 from record_cpp_impl import RecordBase, RecordsBase
 
 from .column import Column, Columns, ColumnValue
@@ -39,6 +40,7 @@ class RecordsCppImpl(RecordsInterface):
         init_ = [] if init is None else list(init)
         Records._validate(init_, column_names)
         self._columns = Columns(columns)
+        self._column_ranges: dict[str, tuple[int, int] | None] = {}
         self._records = RecordsBase(init_, column_names)
 
     def export_yaml(self, path: str) -> None:
@@ -56,6 +58,7 @@ class RecordsCppImpl(RecordsInterface):
         other: dict[str, int]
     ) -> None:
         record = RecordBase(other)
+        self._column_ranges.clear()
         self._records.append(record)
 
     def _append_record(
@@ -68,6 +71,7 @@ class RecordsCppImpl(RecordsInterface):
             msg += f'{unknown_columns}'
             raise InvalidArgumentError(msg)
 
+        self._column_ranges.clear()
         self._records.append(other)
 
     def concat(
@@ -79,6 +83,7 @@ class RecordsCppImpl(RecordsInterface):
             msg = 'Contains an unknown columns. '
             msg += f'{unknown_columns}'
             raise InvalidArgumentError(msg)
+        self._column_ranges.clear()
         self._records.concat(other._records)
         return None
 
@@ -98,6 +103,7 @@ class RecordsCppImpl(RecordsInterface):
         self._records.sort_column_order(ascending, put_none_at_top)
 
     def bind_drop_as_delay(self) -> None:
+        self._column_ranges.clear()
         self._records.bind_drop_as_delay()
 
     def to_dataframe(self):
@@ -110,6 +116,7 @@ class RecordsCppImpl(RecordsInterface):
         validate_rename_rule(columns)
         self._records.rename_columns(columns)
         self._columns.rename(columns)
+        self._column_ranges.clear()
         return None
 
     def merge(
@@ -157,6 +164,15 @@ class RecordsCppImpl(RecordsInterface):
     def get_column_series(self, column_name: str) -> Sequence[int | None]:
         return Records._get_column_series_core(self, column_name)
 
+    def get_column_array(self, column_name: str) -> np.ndarray:
+        return Records._get_column_array_core(self, column_name)
+
+    def get_column_range(self, column_name: str) -> tuple[int, int] | None:
+        if column_name not in self._column_ranges:
+            self._column_ranges[column_name] = \
+                Records._get_column_range_core(self, column_name)
+        return self._column_ranges[column_name]
+
     @property
     def columns(self) -> list[str]:
         return self._columns.column_names
@@ -184,6 +200,7 @@ class RecordsCppImpl(RecordsInterface):
         return records
 
     def _insert_records(self, records: RecordsBase) -> None:
+        self._column_ranges.clear()
         self._records = records
 
     def append_column(
@@ -195,15 +212,18 @@ class RecordsCppImpl(RecordsInterface):
             raise InvalidArgumentError('len(values) != len(records)')
 
         self._columns.append(Column(column))
+        self._column_ranges.clear()
         self._records.append_column(column.column_name, values)
 
     def drop_columns(self, column_names: list[str]) -> None:
         if not isinstance(column_names, list):
             raise InvalidArgumentError('columns must be list.')
         self._columns.drop(column_names)
+        self._column_ranges.clear()
         self._records.drop_columns(column_names)
 
     def filter_if(self, f: Callable[[RecordInterface], bool]) -> None:
+        self._column_ranges.clear()
         self._records.filter_if(f)
 
     @property
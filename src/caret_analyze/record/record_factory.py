@@ -15,12 +15,14 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 
 from multimethod import multimethod as singledispatchmethod
+import numpy as np
 
 from .column import ColumnValue
 from .record import Record, RecordInterface, Records, RecordsInterface
+from ..exceptions import InvalidArgumentError
 
 try:
     import caret_analyze.record.record_cpp_impl as cpp_impl
@@ -96,6 +98,38 @@ class RecordsFactory:
         else:
             return Records(records, columns)
 
+    @staticmethod
+    def create_instance_from_arrays(
+        arrays: Mapping[str, Sequence[int] | np.ndarray]
+    ) -> RecordsInterface:
+        """
+        Create records from column arrays.
+
+        Parameters
+        ----------
+        arrays : Mapping[str, Sequence[int] | np.ndarray]
+            column name and values of the column. All columns have the same length.
+
+        Returns
+        -------
+        RecordsInterface
+            records in the order of the arrays.
+
+        Raises
+        ------
+        InvalidArgumentError
+            The columns have different lengths.
+
+        """
+        columns = list(arrays)
+        values = [np.asarray(array, dtype=np.int64).tolist() for array in arrays.values()]
+        lengths = {column: len(value) for column, value in zip(columns, values)}
+        if len(set(lengths.values())) > 1:
+            raise InvalidArgumentError(f'Columns have different lengths. {lengths}')
+        init = [dict(zip(columns, row)) for row in zip(*values)]
+        return RecordsFactory.create_instance(
+            init, columns=[ColumnValue(column) for column in columns])
+
     @staticmethod
     def _create_cpp_instance(
         init: Sequence[RecordInterface] | None = None,
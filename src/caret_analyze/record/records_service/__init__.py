@@ -16,14 +16,19 @@ from .frequency import Frequency
 from .latency import Latency
 from .period import Period
 from .range import Range
-from .response_time import ResponseTime
+from .response_time import MultiPathResponseTime, ResponseTime
 from .stacked_bar import StackedBar
+from .statistics import QuantileSketch, StatisticsSample, StreamingStatistics
 
 __all__ = [
     'Frequency',
     'Latency',
+    'MultiPathResponseTime',
     'Period',
+    'QuantileSketch',
     'Range',
     'ResponseTime',
     'StackedBar',
+    'StatisticsSample',
+    'StreamingStatistics',
 ]
@@ -16,10 +16,12 @@ from __future__ import annotations
 
 from collections.abc import Callable
 
-from ..column import ColumnValue
+import numpy as np
+
 from ..interface import RecordsInterface
 from ..record_factory import RecordsFactory
 from ...common import ClockConverter
+from ...exceptions import InvalidArgumentError
 
 
 class Frequency:
@@ -56,13 +58,81 @@ class Frequency:
 
         """
         self._target_column = target_column or records.columns[0]
-        self._target_timestamps: list[int] = []
-        for record in records:
-            if row_filter and not row_filter(record):
+        self._row_filter = row_filter
+        self._target_timestamps = self._get_target_timestamps(records)
+        # Interval settings and the first interval index fixed by update().
+        self._update_settings: tuple[int, int, ClockConverter | None] | None = None
+        self._first_interval = 0
+
+    def update(
+        self,
+        new_records: RecordsInterface,
+        interval_ns: int = 1000000000,
+        base_timestamp: int | None = None,
+        converter: ClockConverter | None = None
+    ) -> None:
+        """
+        Continue the calculation with records which follow the current records.
+
+        Only the timestamps in the last interval are carried over,
+        so the cost of the update depends on the new records only.
+        Afterwards, frequency records are calculated from the last interval.
+        The first record replaces the last record of the previous results,
+        provided that the new timestamps are not earlier than the last interval.
+
+        Parameters
+        ----------
+        new_records : RecordsInterface
+            records which follow the current records, with the same columns.
+        interval_ns: int, optional
+            Interval used for frequency calculation, by default 1000000000 [ns].
+            to_records() must be called with the same interval.
+        base_timestamp : int | None, optional
+            Initial timestamp used for frequency calculation, by default None.
+            If None, the base timestamp of the current records is kept.
+            to_records() must be called with the same base timestamp or None.
+        converter : ClockConverter | None, optional
+            Converter to simulation time.
+            to_records() must be called with the same converter.
+
+        """
+        new_timestamps = self._get_target_timestamps(new_records)
+        if base_timestamp is None:
+            if self._update_settings is not None:
+                base_timestamp = self._update_settings[1]
+            elif len(self._target_timestamps) > 0:
+                base_timestamp = int(self._target_timestamps[0])
+            elif len(new_timestamps) > 0:
+                base_timestamp = int(new_timestamps[0])
+            else:
+                return
+
+        # The last interval, which includes the last timestamp, is not complete yet.
+        timestamps = self._target_timestamps
+        first_interval = 0
+        if len(timestamps) > 0:
+            if converter:
+                base_timestamp_ = round(converter.convert(base_timestamp))
+                timestamps_ = np.rint(converter.convert_many(timestamps)).astype(np.int64)
+            else:
+                base_timestamp_, timestamps_ = base_timestamp, timestamps
+            intervals = (timestamps_ - base_timestamp_) // interval_ns
+            first_interval = max(0, int(intervals.max()))
+            timestamps = timestamps[intervals >= first_interval]
+
+        self._target_timestamps = np.concatenate([timestamps, new_timestamps])
+        self._update_settings = (interval_ns, base_timestamp, converter)
+        self._first_interval = first_interval
+
+    def _get_target_timestamps(self, records: RecordsInterface) -> np.ndarray:
+        target_timestamps: list[int] = []
+        for record in records.data:
+            if self._row_filter and not self._row_filter(record):
                 continue
-            if self._target_column in record.columns:
-                timestamp = record.get(self._target_column)
-                self._target_timestamps.append(timestamp)
+            timestamp = record.data.get(self._target_column)
+            if timestamp is not None:
+                target_timestamps.append(timestamp)
+        return np.array(target_timestamps, dtype=np.int64)
 
     def to_records(
         self,
@@ -97,31 +167,32 @@ class Frequency:
             - {frequency_column}
 
         """
-        records = self._create_empty_records()
-        if not self._target_timestamps:
-            return records
-
-        timestamp_list, frequency_list = self._get_frequency_with_timestamp(
+        if self._update_settings is not None:
+            update_interval_ns, update_base_timestamp, update_converter = self._update_settings
+            if interval_ns != update_interval_ns or converter != update_converter or \
+                    base_timestamp not in (None, update_base_timestamp):
+                raise InvalidArgumentError(
+                    'After update(), frequency must be calculated with '
+                    'the same interval_ns, base_timestamp and converter as update().')
+
+        if len(self._target_timestamps) == 0:
+            return RecordsFactory.create_instance_from_arrays(
+                {self._target_column: [], 'frequency': []})
+
+        if self._update_settings is not None:
+            base_timestamp = self._update_settings[1]
+        else:
+            base_timestamp = base_timestamp or int(self._target_timestamps[0])
+        timestamps, frequencies = self._get_frequency_with_timestamp(
             interval_ns,
-            base_timestamp or self._target_timestamps[0],
-            until_timestamp or self._target_timestamps[-1],
+            base_timestamp,
+            until_timestamp or int(self._target_timestamps[-1]),
             converter=converter
         )
-        for ts, freq in zip(timestamp_list, frequency_list):
-            record = {
-                self._target_column: ts,
-                'frequency': freq
-            }
-            records.append(record)
-
-        return records
-
-    def _create_empty_records(
-        self
-    ) -> RecordsInterface:
-        return RecordsFactory.create_instance(None, columns=[
-            ColumnValue(self._target_column), ColumnValue('frequency')
-        ])
+        return RecordsFactory.create_instance_from_arrays({
+            self._target_column: timestamps,
+            'frequency': frequencies,
+        })
 
     def _get_frequency_with_timestamp(
         self,
@@ -129,28 +200,20 @@ class Frequency:
         base_timestamp: int,
         until_timestamp: int,
         converter: ClockConverter | None = None
-    ) -> tuple[list[int], list[int]]:
+    ) -> tuple[np.ndarray, np.ndarray]:
+        timestamps = self._target_timestamps
         if converter:
             base_timestamp = round(converter.convert(base_timestamp))
             until_timestamp = round(converter.convert(until_timestamp))
-        timestamp_list: list[int] = [base_timestamp]
-        frequency_list: list[int] = [0]
-        interval_start_time = base_timestamp
-
-        for timestamp in self._target_timestamps:
-            if converter:
-                timestamp = round(converter.convert(timestamp))
-            if timestamp < base_timestamp:
-                continue
-            while not (interval_start_time <= timestamp < interval_start_time + interval_ns):
-                next_interval_start_time = interval_start_time + interval_ns
-                timestamp_list.append(next_interval_start_time)
-                frequency_list.append(0)
-                interval_start_time = next_interval_start_time
-            frequency_list[-1] += 1
-
-        while timestamp_list[-1] + interval_ns <= until_timestamp:
-            timestamp_list.append(timestamp_list[-1] + interval_ns)
-            frequency_list.append(0)
-
-        return timestamp_list, frequency_list
+            timestamps = np.rint(converter.convert_many(timestamps)).astype(np.int64)
+
+        # Count timestamps in each interval from the base timestamp.
+        # Intervals are continued until the until timestamp even if they are empty.
+        # Intervals before the first interval are already counted before update().
+        first = self._first_interval
+        bins = (timestamps[timestamps >= base_timestamp] - base_timestamp) // interval_ns
+        bins = bins[bins >= first] - first
+        num_bins = max(int(bins.max()) + 1 if len(bins) > 0 else 1,
+                       (until_timestamp - base_timestamp) // interval_ns + 1 - first)
+        frequencies = np.bincount(bins, minlength=num_bins)
+        return base_timestamp + (first + np.arange(num_bins)) * interval_ns, frequencies
@@ -14,7 +14,9 @@
 
 from __future__ import annotations
 
-from ..column import ColumnValue
+import numpy as np
+
+from .statistics import StreamingStatistics
 from ..interface import RecordsInterface
 from ..record_factory import RecordsFactory
 from ...common import ClockConverter
@@ -45,17 +47,34 @@ class Latency:
         """
         self._start_column = start_column or records.columns[0]
         self._end_column = end_column or records.columns[-1]
+        self._start_timestamps, self._end_timestamps = self._get_timestamps(records)
+
+    def update(self, new_records: RecordsInterface) -> None:
+        """
+        Continue the calculation with records which follow the current records.
+
+        Latency of each record does not depend on other records, so nothing is carried over.
+        Afterwards, latency records and statistics are calculated for the new records only.
+
+        Parameters
+        ----------
+        new_records : RecordsInterface
+            records which follow the current records, with the same columns.
+
+        """
+        self._start_timestamps, self._end_timestamps = self._get_timestamps(new_records)
 
-        self._start_timestamps: list[int] = []
-        self._end_timestamps: list[int] = []
-        for record in records:
-            if (self._start_column not in record.columns or
-                    self._end_column not in record.columns):
+    def _get_timestamps(self, records: RecordsInterface) -> tuple[np.ndarray, np.ndarray]:
+        start_timestamps: list[int] = []
+        end_timestamps: list[int] = []
+        for record in records.data:
+            data = record.data
+            if self._start_column not in data or self._end_column not in data:
                 continue
-            start_ts = record.get(self._start_column)
-            self._start_timestamps.append(start_ts)
-            end_ts = record.get(self._end_column)
-            self._end_timestamps.append(end_ts)
+            start_timestamps.append(data[self._start_column])
+            end_timestamps.append(data[self._end_column])
+        return (np.array(start_timestamps, dtype=np.int64),
+                np.array(end_timestamps, dtype=np.int64))
 
     def to_records(
         self,
@@ -78,26 +97,43 @@ class Latency:
             - {latency_column}
 
         """
-        records = self._create_empty_records()
-
-        for start_ts, end_ts in zip(self._start_timestamps, self._end_timestamps):
-            if converter:
-                record = {
-                    self._start_column: round(converter.convert(start_ts)),
-                    'latency': end_ts - start_ts
-                }
-            else:
-                record = {
-                    self._start_column: start_ts,
-                    'latency': end_ts - start_ts
-                }
-            records.append(record)
-
-        return records
-
-    def _create_empty_records(
-        self
-    ) -> RecordsInterface:
-        return RecordsFactory.create_instance(None, columns=[
-            ColumnValue(self._start_column), ColumnValue('latency')
-        ])
+        start_timestamps = self._start_timestamps
+        if converter:
+            start_timestamps = np.rint(converter.convert_many(start_timestamps)).astype(np.int64)
+        return RecordsFactory.create_instance_from_arrays({
+            self._start_column: start_timestamps,
+            'latency': self._end_timestamps - self._start_timestamps,
+        })
+
+    def to_stats(
+        self,
+        top_k: int = 10,
+        relative_accuracy: float = 0.01
+    ) -> StreamingStatistics:
+        """
+        Calculate summary statistics of latency without creating records.
+
+        Parameters
+        ----------
+        top_k : int, optional
+            Number of the worst samples to keep with their source records.
+        relative_accuracy : float, optional
+            Relative accuracy of the estimated percentiles.
+
+        Returns
+        -------
+        StreamingStatistics
+            Statistics of the latency.
+            Timestamps of the samples are {start_timestamp_column}.
+
+        """
+        start_timestamps = self._start_timestamps
+        end_timestamps = self._end_timestamps
+
+        def get_record(i: int) -> dict[str, int]:
+            return {self._start_column: int(start_timestamps[i]),
+                    self._end_column: int(end_timestamps[i])}
+
+        stats = StreamingStatistics(top_k, relative_accuracy)
+        stats.update(end_timestamps - start_timestamps, start_timestamps, get_record)
+        return stats
@@ -16,7 +16,9 @@ from __future__ import annotations
 
 from collections.abc import Callable
 
-from ..column import ColumnValue
+import numpy as np
+
+from .statistics import StreamingStatistics
 from ..interface import RecordsInterface
 from ..record_factory import RecordsFactory
 from ...common import ClockConverter
@@ -56,13 +58,36 @@ class Period:
 
         """
         self._target_column = target_column or records.columns[0]
-        self._target_timestamps: list[int] = []
-        for record in records:
-            if row_filter and not row_filter(record):
+        self._row_filter = row_filter
+        self._target_timestamps = self._get_target_timestamps(records)
+
+    def update(self, new_records: RecordsInterface) -> None:
+        """
+        Continue the calculation with records which follow the current records.
+
+        Only the last timestamp is carried over,
+        so the cost of the update depends on the new records only.
+        Afterwards, periods are calculated from the carried-over timestamp,
+        i.e. the period between the current and new records comes first.
+
+        Parameters
+        ----------
+        new_records : RecordsInterface
+            records which follow the current records, with the same columns.
+
+        """
+        self._target_timestamps = np.concatenate(
+            [self._target_timestamps[-1:], self._get_target_timestamps(new_records)])
+
+    def _get_target_timestamps(self, records: RecordsInterface) -> np.ndarray:
+        target_timestamps: list[int] = []
+        for record in records.data:
+            if self._row_filter and not self._row_filter(record):
                 continue
-            if self._target_column in record.columns:
-                timestamp = record.get(self._target_column)
-                self._target_timestamps.append(timestamp)
+            timestamp = record.data.get(self._target_column)
+            if timestamp is not None:
+                target_timestamps.append(timestamp)
+        return np.array(target_timestamps, dtype=np.int64)
 
     def to_records(
         self,
@@ -85,27 +110,45 @@ class Period:
             - {period_column}
 
         """
-        records = self._create_empty_records()
-
-        for i in range(1, len(self._target_timestamps)):
-            if converter:
-                record = {
-                    self._target_column: round(converter.convert(self._target_timestamps[i-1])),
-                    'period': round(converter.convert(self._target_timestamps[i])
-                                    - converter.convert(self._target_timestamps[i-1]))
-                }
-            else:
-                record = {
-                    self._target_column: self._target_timestamps[i-1],
-                    'period': self._target_timestamps[i] - self._target_timestamps[i-1]
-                }
-            records.append(record)
-
-        return records
-
-    def _create_empty_records(
-        self
-    ) -> RecordsInterface:
-        return RecordsFactory.create_instance(None, columns=[
-            ColumnValue(self._target_column), ColumnValue('period')
-        ])
+        if converter:
+            timestamps = converter.convert_many(self._target_timestamps)
+            return RecordsFactory.create_instance_from_arrays({
+                self._target_column: np.rint(timestamps[:-1]).astype(np.int64),
+                'period': np.rint(np.diff(timestamps)).astype(np.int64),
+            })
+
+        return RecordsFactory.create_instance_from_arrays({
+            self._target_column: self._target_timestamps[:-1],
+            'period': np.diff(self._target_timestamps),
+        })
+
+    def to_stats(
+        self,
+        top_k: int = 10,
+        relative_accuracy: float = 0.01
+    ) -> StreamingStatistics:
+        """
+        Calculate summary statistics of period without creating records.
+
+        Parameters
+        ----------
+        top_k : int, optional
+            Number of the worst samples to keep with their source records.
+        relative_accuracy : float, optional
+            Relative accuracy of the estimated percentiles.
+
+        Returns
+        -------
+        StreamingStatistics
+            Statistics of the period.
+            Timestamps of the samples are the {timestamp_column} of the former record.
+
+        """
+        timestamps = self._target_timestamps
+
+        def get_record(i: int) -> dict[str, int]:
+            return {self._target_column: int(timestamps[i + 1])}
+
+        stats = StreamingStatistics(top_k, relative_accuracy)
+        stats.update(np.diff(timestamps), timestamps[:-1], get_record)
+        return stats
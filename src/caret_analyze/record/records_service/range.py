@@ -45,16 +45,9 @@ class Range:
         Only the system time is picked out here.
 
         """
-        def remove_none(series: Sequence[int | None]) -> list[int]:
-            return [v for v in series if v is not None]
-
-        base_series = [remove_none(r.get_column_series(r.columns[0])) for r in self._records_list]
-        min_series: list[int] = []
-        max_series: list[int] = []
-        for series in base_series:
-            if len(series) > 0:
-                min_series.append(min(series))
-                max_series.append(max(series))
+        ranges = [r.get_column_range(r.columns[0]) for r in self._records_list]
+        min_series = [r[0] for r in ranges if r is not None]
+        max_series = [r[1] for r in ranges if r is not None]
 
         has_valid_data = len(min_series) > 0 and len(max_series) > 0
         if has_valid_data:
@@ -18,10 +18,113 @@ from collections.abc import Iterator, Sequence
 
 from warnings import warn
 
+import numpy as np
+import pandas as pd
+
+from .statistics import StreamingStatistics
 from ..column import ColumnValue
 from ..interface import RecordInterface, RecordsInterface
-from ..record_factory import RecordFactory, RecordsFactory
+from ..record_factory import RecordsFactory
 from ...common import ClockConverter
+from ...exceptions import InvalidArgumentError
+
+# Placeholder of missing timestamps in column arrays.
+_MISSING = np.iinfo(np.int64).max
+
+
+def _to_column_arrays(
+    records: Sequence[RecordInterface],
+    columns: Sequence[str]
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Convert records to column arrays.
+
+    Parameters
+    ----------
+    records : Sequence[RecordInterface]
+        records to convert.
+    columns : Sequence[str]
+        column names to extract.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        Timestamps and presence mask, both shaped (len(records), len(columns)).
+        Missing timestamps are _MISSING.
+
+    """
+    dicts = [record.data for record in records]
+    values = np.full((len(dicts), len(columns)), _MISSING, dtype=np.int64)
+    for i, column in enumerate(columns):
+        values[:, i] = [d.get(column, _MISSING) for d in dicts]
+    return values, values != _MISSING
+
+
+def _create_records(
+    columns: Sequence[str],
+    arrays: Sequence[np.ndarray] | np.ndarray,
+    sort: bool = False
+) -> RecordsInterface:
+    """
+    Create records from column arrays.
+
+    Parameters
+    ----------
+    columns : Sequence[str]
+        column names.
+    arrays : Sequence[np.ndarray] | np.ndarray
+        values of each column, or a matrix whose rows are the columns.
+    sort : bool
+        If True, rows are sorted by the columns in order, as sort_column_order does.
+
+    Returns
+    -------
+    RecordsInterface
+        created records.
+
+    """
+    column_arrays = [np.asarray(a, dtype=np.int64) for a in arrays]
+    if sort and len(column_arrays[0]) > 0:
+        order = np.lexsort(tuple(column_arrays[::-1]))
+        column_arrays = [a[order] for a in column_arrays]
+    return RecordsFactory.create_instance_from_arrays(dict(zip(columns, column_arrays)))
+
+
+def _convert(
+    timestamps: np.ndarray,
+    converter: ClockConverter | None
+) -> np.ndarray:
+    if converter is None:
+        return timestamps
+    return np.rint(converter.convert_many(timestamps)).astype(np.int64)
+
+
+def _group_first_rows(keys: np.ndarray, values: np.ndarray, *, last: bool = False) -> np.ndarray:
+    """
+    Get the row index with the minimum (or maximum) value for each key.
+
+    Parameters
+    ----------
+    keys : np.ndarray
+        group keys.
+    values : np.ndarray
+        values compared within each group.
+    last : bool
+        If True, the row with the maximum value is returned.
+
+    Returns
+    -------
+    np.ndarray
+        row indices in ascending order of the keys.
+
+    """
+    if len(keys) == 0:
+        return np.array([], dtype=np.int64)
+    order = np.lexsort((values, keys))
+    _, first = np.unique(keys[order], return_index=True)
+    if last:
+        first = np.append(first[1:] - 1, len(order) - 1)
+    return order[first]
 
 
 class TimeRange:
@@ -117,25 +220,21 @@ class ResponseMap():
 
         """
         self._columns = columns
-        new_data = {}
-
-        input_min_time = None
 
-        for data in records.data:
-            if not set(self._columns) <= set(data.columns):
-                continue
+        data = records.data
+        values, present = _to_column_arrays(data, columns)
+        valid = present.all(axis=1)
+        self._records = [data[i] for i in np.flatnonzero(valid).tolist()]
+        self._values = values[valid]
 
-            input_time, output_time = data.get(self.input_column), data.get(self.output_column)
+        inputs = self._values[:, 0]
+        outputs = self._values[:, -1]
+        self._input_min_time: int | None = int(inputs[0]) if len(inputs) > 0 else None
 
-            if input_min_time is None:
-                input_min_time = input_time
-
-            if output_time not in new_data:
-                new_data[output_time] = TimeRange(input_min_time, data, self.input_column)
-            else:
-                new_data[output_time].update(data)
-
-        self._data = new_data
+        # For each output time, the row with the latest input. The first one wins ties.
+        order = np.lexsort((np.arange(len(inputs)), -inputs, outputs))
+        self._output_times, first = np.unique(outputs[order], return_index=True)
+        self._latest_rows = order[first]
 
     def sorted_iter(self) -> Iterator[int]:
         """
@@ -147,7 +246,7 @@ class ResponseMap():
             iterator which returns output time.
 
         """
-        return iter(sorted(self._data))
+        return iter(self._output_times.tolist())
 
     def __len__(self) -> int:
         """
@@ -159,7 +258,7 @@ class ResponseMap():
             number of output time. It is same as number of TimeRange.
 
         """
-        return len(self._data)
+        return len(self._output_times)
 
     def at(self, end_time: int) -> TimeRange:
         """
@@ -176,7 +275,51 @@ class ResponseMap():
             TimeRange that matches the output time.
 
         """
-        return self._data[end_time]
+        i = int(np.searchsorted(self._output_times, end_time))
+        if i == len(self._output_times) or self._output_times[i] != end_time:
+            raise KeyError(end_time)
+        assert self._input_min_time is not None
+        record = self._records[int(self._latest_rows[i])]
+        return TimeRange(self._input_min_time, record, self.input_column)
+
+    @property
+    def values(self) -> np.ndarray:
+        """
+        Get timestamps of the records which have all columns.
+
+        Returns
+        -------
+        np.ndarray
+            timestamps shaped (number of records, number of columns).
+
+        """
+        return self._values
+
+    @property
+    def latest_rows(self) -> np.ndarray:
+        """
+        Get rows with the latest input for each output time.
+
+        Returns
+        -------
+        np.ndarray
+            row indices of values, in ascending order of the output time.
+
+        """
+        return self._latest_rows
+
+    @property
+    def input_min_time(self) -> int | None:
+        """
+        Get input time of the first record.
+
+        Returns
+        -------
+        int | None
+            input time. None if there are no records.
+
+        """
+        return self._input_min_time
 
     @property
     def input_column(self) -> str:
@@ -216,7 +359,8 @@ class ResponseMapAll:
     def __init__(
         self,
         records: RecordsInterface,
-        columns: list[str]
+        columns: list[str],
+        previous: ResponseMapAll | None = None
     ) -> None:
         """
         Construct an instance.
@@ -228,6 +372,10 @@ class ResponseMapAll:
         columns : list[str] | None, optional
             Column name of start timestamps used in the calculation, by default None
             If None, the first column of records is selected.
+        previous : ResponseMapAll | None, optional
+            Response map of the preceding records, by default None.
+            If given, records are the open records of previous followed by new records,
+            and the responses continue those of previous.
 
         """
         if columns:
@@ -239,260 +387,301 @@ class ResponseMapAll:
             self._end_column = records.columns[-1]
             self._columns = records.columns
 
-        self._start_timestamps: list[int] = []
-        self._end_timestamps: list[int] = []
-        self._records: list[RecordInterface] = []
-
-        for record in reversed(records.data):
-            if self._end_column in record.columns:
-                end_ts = record.get(self._end_column)
-            elif len(self._end_timestamps) > 0:
-                end_ts = min(self._end_timestamps)
-            else:
-                continue
-
-            if self._start_column not in record.columns:
-                continue
-            start_ts = record.get(self._start_column)
-
-            if end_ts < start_ts:
-                warn('Record data is invalid. '
-                     'The end time of the path is recorded before the start time.',
-                     UserWarning)
-                continue
-
-            if start_ts not in self._start_timestamps:
-                self._start_timestamps.insert(0, start_ts)
-                self._end_timestamps.insert(0, end_ts)
-                self._records.insert(0, record)
-            else:
-                idx = self._start_timestamps.index(start_ts)
-                if end_ts < self._end_timestamps[idx]:
-                    self._end_timestamps[idx] = end_ts
-                    self._records[idx] = record
-
-        min_end_timestamp_idx = [
-            i for i, v in enumerate(self._end_timestamps) if v == min(self._end_timestamps)
-            ]
-
-        self._start_timestamps = [
-            v for i, v in enumerate(self._start_timestamps) if i not in min_end_timestamp_idx
-            ]
-        self._end_timestamps = [
-            v for i, v in enumerate(self._end_timestamps) if i not in min_end_timestamp_idx
-            ]
-        self._records = [
-            v for i, v in enumerate(self._records) if i not in min_end_timestamp_idx
-            ]
+        data = records.data
+        values, present = _to_column_arrays(data, self._columns)
+        starts = values[:, 0]
+        ends = values[:, -1]
+        has_start = present[:, 0]
+
+        # A record ends at its own end timestamp, or else at the earliest end timestamp
+        # of the valid records after it. Valid records have both timestamps in order.
+        valid_ends = np.where(has_start & present[:, -1] & (ends >= starts), ends, _MISSING)
+        following_min_ends = np.full(len(data), _MISSING, dtype=np.int64)
+        if len(data) > 1:
+            following_min_ends[:-1] = np.minimum.accumulate(valid_ends[:0:-1])[::-1]
+        end_ts = np.where(present[:, -1], ends, following_min_ends)
+        candidates = has_start & (end_ts != _MISSING)
+        if np.any(candidates & (end_ts < starts)):
+            warn('Record data is invalid. '
+                 'The end time of the path is recorded before the start time.',
+                 UserWarning)
+        accepted_rows = np.flatnonzero(candidates & (end_ts >= starts))
+
+        # Keep the earliest end timestamp for each start timestamp, the latest record on ties.
+        # Start timestamps are ordered by their latest accepted record.
+        accepted_starts = starts[accepted_rows]
+        order = np.lexsort((-accepted_rows, end_ts[accepted_rows], accepted_starts))
+        is_first = np.ones(len(order), dtype=bool)
+        is_first[1:] = accepted_starts[order][1:] != accepted_starts[order][:-1]
+        group_rows = accepted_rows[order][is_first]
+        if len(order) > 0:
+            latest_rows = np.maximum.reduceat(accepted_rows[order], np.flatnonzero(is_first))
+            group_rows = group_rows[np.argsort(latest_rows)]
+        group_starts = starts[group_rows]
+        group_ends = end_ts[group_rows]
+
+        min_end_ts: int | None = None
+        last_row: int | None = None
+        if len(accepted_rows) > 0:
+            min_end_ts = int(group_ends.min())
+            last_row = int(accepted_rows[-1])
+
+        # Records after the last response have no end timestamp yet.
+        open_row = 0 if last_row is None else last_row + 1
+        self._open_records = list(data[open_row:])
+        self._previous_response: tuple[int, int] | None = None
+        self._min_end_timestamp: int | None = min_end_ts
+        self._resolved_starts: set[int] = set()
+        if previous is not None:
+            self._previous_response = previous.last_response
+            if previous._min_end_timestamp is not None:
+                self._min_end_timestamp = previous._min_end_timestamp
+            # Inputs resolved by the preceding records keep their earlier responses.
+            self._resolved_starts = previous._resolved_starts
+            if self._resolved_starts:
+                resolved = np.fromiter(self._resolved_starts, dtype=np.int64,
+                                       count=len(self._resolved_starts))
+                unresolved = ~np.isin(group_starts, resolved)
+                group_rows = group_rows[unresolved]
+                group_starts = group_starts[unresolved]
+                group_ends = group_ends[unresolved]
+
+        # Resolved inputs which may appear again in the following records are kept,
+        # i.e. those not earlier than the inputs of the last response and open records.
+        tail_starts = starts[open_row:][has_start[open_row:]]
+        if last_row is not None:
+            tail_starts = np.append(tail_starts, starts[last_row])
+        if len(tail_starts) > 0:
+            min_tail_start = tail_starts.min()
+            self._resolved_starts = {
+                start_ts for start_ts in self._resolved_starts if start_ts >= min_tail_start}
+            self._resolved_starts.update(
+                group_starts[group_starts >= min_tail_start].tolist())
+
+        # Records ending at the earliest end timestamp are dropped.
+        kept = group_ends != self._min_end_timestamp
+        rows = group_rows[kept]
+        self._start_timestamps = group_starts[kept]
+        self._end_timestamps = group_ends[kept]
+        self._values = values[rows]
+        self._present = present[rows]
+
+    @property
+    def open_records(self) -> list[RecordInterface]:
+        """
+        Get records whose response is not determined yet.
+
+        Returns
+        -------
+        list[RecordInterface]
+            records after the last record which has a response.
+
+        """
+        return list(self._open_records)
+
+    @property
+    def last_response(self) -> tuple[int, int] | None:
+        """
+        Get the last response in the order of all records.
+
+        Returns
+        -------
+        tuple[int, int] | None
+            start and end timestamps. None if there are no responses.
+
+        """
+        if len(self._start_timestamps) > 0:
+            return int(self._start_timestamps[-1]), int(self._end_timestamps[-1])
+        return self._previous_response
 
     def to_worst_with_external_latency_case_records(
         self,
         converter: ClockConverter | None = None
     ) -> RecordsInterface:
-
-        end_timestamps: list[int] = []
-        start_timestamps: list[int] = []
-        worst_to_best_timestamps: list[int] = []
-        for start_ts, end_ts, prev_start_ts in zip(self._start_timestamps[1:],
-                                                   self._end_timestamps[1:],
-                                                   self._start_timestamps[:-1]):
-            if end_ts not in end_timestamps:
-                start_timestamps.append(start_ts)
-                end_timestamps.append(end_ts)
-                worst_to_best_timestamps.append(start_ts - prev_start_ts)
-            else:
-                idx = end_timestamps.index(end_ts)
-                if start_ts < start_timestamps[idx]:
-                    start_timestamps[idx] = start_ts
-                    worst_to_best_timestamps[idx] = start_ts - prev_start_ts
-
-        records = self._create_empty_records()
-        for start_ts, end_ts, worst_to_best_ts in sorted(zip(start_timestamps,
-                                                             end_timestamps,
-                                                             worst_to_best_timestamps),
-                                                         key=lambda x: x[0]):
-            if converter:
-                record = {
-                    self._start_column: round(converter.convert(start_ts - worst_to_best_ts)),
-                    'response_time': end_ts - (start_ts - worst_to_best_ts)
-                }
-            else:
-                record = {
-                    self._start_column: start_ts - worst_to_best_ts,
-                    'response_time': end_ts - (start_ts - worst_to_best_ts)
-                }
-            records.append(record)
-
-        return records
+        return self._create_response_records(
+            *self._case_timestamps('worst-with-external-latency'), converter)
 
     def to_best_case_records(
         self,
         converter: ClockConverter | None = None
     ) -> RecordsInterface:
-
-        end_timestamps: list[int] = []
-        start_timestamps: list[int] = []
-        for start_ts, end_ts in zip(self._start_timestamps, self._end_timestamps):
-
-            if end_ts not in end_timestamps:
-                start_timestamps.append(start_ts)
-                end_timestamps.append(end_ts)
-            else:
-                idx = end_timestamps.index(end_ts)
-                if start_ts > start_timestamps[idx]:
-                    start_timestamps[idx] = start_ts
-
-        records = self._create_empty_records()
-        for start_ts, end_ts in sorted(zip(start_timestamps, end_timestamps), key=lambda x: x[0]):
-            if converter:
-                record = {
-                    self._start_column: round(converter.convert(start_ts)),
-                    'response_time': end_ts - start_ts
-                }
-            else:
-                record = {
-                    self._start_column: start_ts,
-                    'response_time': end_ts - start_ts
-                }
-            records.append(record)
-
-        return records
+        return self._create_response_records(*self._case_timestamps('best'), converter)
 
     def to_all_records(
         self,
         converter: ClockConverter | None = None
     ) -> RecordsInterface:
-        records = self._create_empty_records()
-
-        for start_ts, end_ts in zip(self._start_timestamps, self._end_timestamps):
-            if converter:
-                record = {
-                    self._start_column: round(converter.convert(start_ts)),
-                    'response_time': end_ts - start_ts
-                }
-            else:
-                record = {
-                    self._start_column: start_ts,
-                    'response_time': end_ts - start_ts
-                }
-            records.append(record)
-
-        return records
+        return self._create_response_records(*self._case_timestamps('all'), converter)
 
     def to_worst_case_records(
         self,
         converter: ClockConverter | None = None
     ) -> RecordsInterface:
-        end_timestamps: list[int] = []
-        start_timestamps: list[int] = []
-        for start_ts, end_ts in zip(self._start_timestamps, self._end_timestamps):
-            if end_ts not in end_timestamps:
-                start_timestamps.append(start_ts)
-                end_timestamps.append(end_ts)
-            else:
-                idx = end_timestamps.index(end_ts)
-                if start_ts < start_timestamps[idx]:
-                    start_timestamps[idx] = start_ts
-
-        records = self._create_empty_records()
-        for start_ts, end_ts in sorted(zip(start_timestamps, end_timestamps), key=lambda x: x[0]):
-            if converter:
-                record = {
-                    self._start_column: round(converter.convert(start_ts)),
-                    'response_time': end_ts - start_ts
-                }
-            else:
-                record = {
-                    self._start_column: start_ts,
-                    'response_time': end_ts - start_ts
-                }
-            records.append(record)
-
-        return records
+        return self._create_response_records(*self._case_timestamps('worst'), converter)
+
+    def to_stats(
+        self,
+        case: str,
+        top_k: int = 10,
+        relative_accuracy: float = 0.01
+    ) -> StreamingStatistics:
+        rows, start_timestamps, end_timestamps = self._case_rows(case)
+
+        def get_record(i: int) -> dict[str, int]:
+            row = rows[i]
+            return {column: int(value) for column, value, present
+                    in zip(self._columns, self._values[row], self._present[row]) if present}
+
+        stats = StreamingStatistics(top_k, relative_accuracy)
+        stats.update(end_timestamps - start_timestamps, start_timestamps, get_record)
+        return stats
+
+    def to_responses(self, case: str) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Get the response time of each input.
+
+        Parameters
+        ----------
+        case : str
+            'all', 'best', 'worst' or 'worst-with-external-latency'.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            Input timestamps in ascending order and response times of them.
+            Input timestamps are not moved back even for 'worst-with-external-latency'.
+
+        """
+        rows, start_timestamps, end_timestamps = self._case_rows(case)
+        inputs = self._start_timestamps[rows]
+        order = np.argsort(inputs, kind='stable')
+        return inputs[order], (end_timestamps - start_timestamps)[order]
+
+    def _case_timestamps(self, case: str) -> tuple[np.ndarray, np.ndarray]:
+        _, start_timestamps, end_timestamps = self._case_rows(case)
+        return start_timestamps, end_timestamps
+
+    def _case_rows(self, case: str) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get the response of each case.
+
+        Parameters
+        ----------
+        case : str
+            'all', 'best', 'worst' or 'worst-with-external-latency'.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, np.ndarray]
+            Source rows, start timestamps and end timestamps,
+            in ascending order of the start timestamps except for 'all'.
+
+        """
+        starts = self._start_timestamps
+        ends = self._end_timestamps
+        if case == 'all':
+            return np.arange(len(starts)), starts, ends
+
+        if case == 'best':
+            # the latest start timestamp for each end timestamp
+            rows = _group_first_rows(ends, starts, last=True)
+        elif case == 'worst':
+            # the earliest start timestamp for each end timestamp
+            rows = _group_first_rows(ends, starts)
+        elif case == 'worst-with-external-latency':
+            # The response of the preceding records is the previous input of the first one.
+            offset = 0
+            if self._previous_response is not None:
+                offset = 1
+                starts = np.r_[self._previous_response[0], starts]
+                ends = np.r_[self._previous_response[1], ends]
+            if len(starts) < 2:
+                return starts[:0], starts[:0], ends[:0]
+            # The earliest start timestamp for each end timestamp,
+            # moved back by the interval from the previous input.
+            rows = _group_first_rows(ends[1:], starts[1:]) + 1
+            rows = rows[np.argsort(starts[rows], kind='stable')]
+            worst_to_best = starts[rows] - starts[rows - 1]
+            return rows - offset, starts[rows] - worst_to_best, ends[rows]
+        else:
+            raise InvalidArgumentError(f'Unsupported case: {case}')
+
+        rows = rows[np.argsort(starts[rows], kind='stable')]
+        return rows, starts[rows], ends[rows]
 
     def to_all_stacked_bar(self) -> RecordsInterface:
-        end_column_record_dict: dict[int, list[RecordInterface]] = {}
-
-        # classify records which have same end timestamp
-        end_ts = None
-        for record in reversed(self._records):
-            if self._end_column in record.columns:
-                end_ts = record.get(self._end_column)
-            elif end_ts is None:
-                continue
-
-            if end_ts in end_column_record_dict.keys():
-                end_column_record_dict[end_ts].insert(0, record)
-            else:
-                end_column_record_dict[end_ts] = [record]
-
-        # fill empty data
-        filled_records_dict: dict[int, list[RecordInterface]] = {}
-        # for each records which have same end timestamp
-        for end_ts, record_list in end_column_record_dict.items():
-            filled_records_dict[end_ts] = []
-
-            for record in reversed(record_list):
-                # if record doesn't have some timestamps,
-                # record timestamps just after
-                for column in self._columns:
-                    if column in record.columns:
-                        continue
-                    timestamps = [record.get(column) for record in filled_records_dict[end_ts]
-                                  if column in record.columns]
-                    record.add(column, min(timestamps))
-                record.drop_columns(list(record.columns - set(self._columns)))
-                filled_records_dict[end_ts].append(record)
-
-        columns = [ColumnValue(c) for c in self._columns]
-        init = [_.data for _ in sum(filled_records_dict.values(), [])]
-        stacked_bar_records: RecordsInterface =\
-            RecordsFactory.create_instance(init,
-                                           columns=columns)
-        stacked_bar_records.sort_column_order()
-        return stacked_bar_records
+        values, present, group_starts = self._group_by_end_timestamp()
+        if len(values) == 0:
+            return _create_records(self._columns, values.T)
+
+        # Missing timestamps are filled with the minimum of the later records
+        # which have the same end timestamp.
+        later_min = pd.DataFrame(values).groupby(
+            np.repeat(np.arange(len(group_starts)), np.diff(group_starts, append=len(values)))
+        ).cummin().to_numpy(dtype=np.int64)
+        later_min = np.roll(later_min, 1, axis=0)
+        later_min[group_starts] = _MISSING
+
+        filled = np.where(present, values, later_min)
+        missing = (filled == _MISSING).any(axis=0)
+        if missing.any():
+            column = self._columns[int(np.argmax(missing))]
+            raise ValueError(f'No later record has {column}.')
+
+        return _create_records(self._columns, filled.T, sort=True)
 
     def to_worst_case_stacked_bar(self) -> RecordsInterface:
-        end_column_record_dict: dict[int, list[RecordInterface]] = {}
+        values, _, group_starts = self._group_by_end_timestamp()
+
+        # generate worst-case work flow
+        if len(values) == 0:
+            return _create_records(self._columns, values.T)
+        worst = np.minimum.reduceat(values, group_starts, axis=0)
+        missing = (worst == _MISSING).any(axis=0)
+        if missing.any():
+            column = self._columns[int(np.argmax(missing))]
+            raise ValueError(f'No record has {column}.')
+
+        return _create_records(self._columns, worst.T, sort=True)
 
-        # classify records which have same end timestamp
-        end_ts = None
-        for record in reversed(self._records):
-            if self._end_column in record.columns:
-                end_ts = record.get(self._end_column)
-            elif end_ts is None:
-                continue
+    def _group_by_end_timestamp(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Classify records which have same end timestamp.
 
-            if end_ts in end_column_record_dict.keys():
-                end_column_record_dict[end_ts].append(record)
-            else:
-                end_column_record_dict[end_ts] = [record]
+        Records without the end timestamp belong to the record just after them.
 
-        # generate worst-case work flow
-        filled_record_list: list[RecordInterface] = []
-        for record_list in end_column_record_dict.values():
-            worst_record = RecordFactory.create_instance()
-
-            for column in self._columns:
-                timestamps = [r.get(column) for r in record_list if column in r.columns]
-                worst_record.add(column, min(timestamps))
-            worst_record.drop_columns(list(worst_record.columns - set(self._columns)))
-            filled_record_list.append(worst_record)
-
-        columns = [ColumnValue(c) for c in self._columns]
-        init = [_.data for _ in filled_record_list]
-        stacked_bar_records: RecordsInterface =\
-            RecordsFactory.create_instance(init,
-                                           columns=columns)
-        stacked_bar_records.sort_column_order()
-        return stacked_bar_records
-
-    def _create_empty_records(
-        self
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, np.ndarray]
+            Timestamps and presence mask of the classified records,
+            and the first row of each group.
+            Rows in a group are in the reversed order, i.e. the latest one first.
+
+        """
+        values = self._values[::-1]
+        present = self._present[::-1]
+        # forward-fill the end timestamps from the latest record
+        end_rows = np.where(present[:, -1], np.arange(len(values)), -1)
+        end_rows = np.maximum.accumulate(end_rows) if len(end_rows) > 0 else end_rows
+        rows = np.flatnonzero(end_rows >= 0)
+        keys = values[end_rows[rows], -1]
+
+        order = np.argsort(keys, kind='stable')
+        keys = keys[order]
+        values = values[rows[order]]
+        present = present[rows[order]]
+        group_starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])[:len(keys)]
+        return values, present, group_starts
+
+    def _create_response_records(
+        self,
+        start_timestamps: np.ndarray,
+        end_timestamps: np.ndarray,
+        converter: ClockConverter | None
     ) -> RecordsInterface:
-        return RecordsFactory.create_instance(None, columns=[
-            ColumnValue(self._start_column), ColumnValue('response_time')
-        ])
+        return _create_records(
+            [self._start_column, 'response_time'],
+            [_convert(start_timestamps, converter), end_timestamps - start_timestamps])
 
 
 class ResponseTime:
@@ -547,9 +736,54 @@ class ResponseTime:
 
         """
         columns = columns or [records.columns[0], records.columns[-1]]
+        self._columns = columns
         response_map = ResponseMap(records, columns)
         self._response_map_all = ResponseMapAll(records, columns)
         self._records = ResponseRecords(response_map)
+        output_range = records.get_column_range(columns[-1])
+        self._last_output: int | None = None if output_range is None else output_range[1]
+
+    def update(self, new_records: RecordsInterface) -> None:
+        """
+        Continue the calculation with records which follow the current records.
+
+        Only the records whose output is not recorded yet are carried over,
+        so the cost of the update depends on the new records only.
+        Afterwards, response time records and statistics
+        are calculated for the carried-over and new records.
+        Appending them to the previous results gives the same results as
+        the calculation on all records.
+        An input which already has a response keeps it even if it appears again,
+        as long as the inputs of the records are in ascending order.
+        Stacked bar and range records are also calculated
+        for the carried-over and new records only.
+
+        Parameters
+        ----------
+        new_records : RecordsInterface
+            records which follow the current records, with the same columns.
+
+        Raises
+        ------
+        InvalidArgumentError
+            An output of new_records is not later than the outputs of the current records.
+
+        """
+        output_range = new_records.get_column_range(self._columns[-1])
+        if output_range is not None:
+            if self._last_output is not None and output_range[0] <= self._last_output:
+                raise InvalidArgumentError(
+                    'Outputs of new records must be later than the current outputs. '
+                    f'new output: {output_range[0]}, current output: {self._last_output}')
+            self._last_output = output_range[1]
+
+        data = [*self._response_map_all.open_records, *new_records.data]
+        records = RecordsFactory.create_instance(
+            [dict(record.data) for record in data],
+            columns=[ColumnValue(column) for column in new_records.columns])
+        self._response_map_all = ResponseMapAll(
+            records, self._columns, previous=self._response_map_all)
+        self._records = ResponseRecords(ResponseMap(records, self._columns))
 
     def to_all_records(
         self,
@@ -662,6 +896,39 @@ class ResponseTime:
             converter=converter
         )
 
+    def to_stats(
+        self,
+        case: str = 'best',
+        top_k: int = 10,
+        relative_accuracy: float = 0.01
+    ) -> StreamingStatistics:
+        """
+        Calculate summary statistics of response time without creating records.
+
+        Parameters
+        ----------
+        case : str, optional
+            'all', 'best', 'worst' or 'worst-with-external-latency', by default 'best'.
+        top_k : int, optional
+            Number of the worst samples to keep with their source records.
+        relative_accuracy : float, optional
+            Relative accuracy of the estimated percentiles.
+
+        Returns
+        -------
+        StreamingStatistics
+            Statistics of the response time.
+            Timestamps of the samples are {columns[0]}.
+            Statistics of other paths or trace files can be merged into it.
+
+        Raises
+        ------
+        InvalidArgumentError
+            case is not supported.
+
+        """
+        return self._response_map_all.to_stats(case, top_k, relative_accuracy)
+
     def to_all_stacked_bar(self) -> RecordsInterface:
         """
         Calculate records for stacked bar.
@@ -736,6 +1003,188 @@ class ResponseTime:
         return self._records.to_range_records('worst-with-external-latency')
 
 
+class MultiPathResponseTime:
+    """
+    Class which compares response times of paths from the same input.
+
+    Response times of the paths are aligned on the input timestamps
+    which all paths have, so that the critical path of each input is found.
+
+    Examples
+    --------
+    >>> from caret_analyze import Application, Architecture, Lttng
+    >>> from caret_analyze.record import MultiPathResponseTime
+
+    >>> # Load results
+    >>> arch = Architecture('yaml', '/path/to/yaml')
+    >>> lttng = Lttng('/path/to/ctf')
+    >>> app = Application(arch, lttng)
+
+    >>> # Compare branches from the same sensor
+    >>> paths = [app.get_path('lidar_to_planning'), app.get_path('lidar_to_control')]
+    >>> response = MultiPathResponseTime(
+    ...     [path.to_records() for path in paths], names=[path.path_name for path in paths])
+    >>> response_df = response.to_records(case='best').to_dataframe()
+    >>> response.to_critical_path_counts(case='best')
+
+    """
+
+    def __init__(
+        self,
+        records: Sequence[RecordsInterface],
+        *,
+        names: Sequence[str] | None = None
+    ) -> None:
+        """
+        Construct an instance.
+
+        Parameters
+        ----------
+        records : Sequence[RecordsInterface]
+            records of each path. All records have the same first column as input.
+            The last column of each records is used as output.
+        names : Sequence[str] | None
+            names of the paths, used as column names.
+            If None, 'path0', 'path1', ... are used.
+
+        Raises
+        ------
+        InvalidArgumentError
+            No records are given, the first columns differ, or the names are invalid.
+
+        """
+        if len(records) == 0:
+            raise InvalidArgumentError('records must not be empty.')
+        if any(len(records_.columns) < 2 for records_ in records):
+            raise InvalidArgumentError('Each records must have 2 or more columns.')
+
+        input_columns = {records_.columns[0] for records_ in records}
+        if len(input_columns) != 1:
+            raise InvalidArgumentError(
+                f'All records must have the same first column. {sorted(input_columns)}')
+        self._input_column = records[0].columns[0]
+
+        if names is None:
+            names = [f'path{i}' for i in range(len(records))]
+        self._names = list(names)
+        if len(self._names) != len(records):
+            raise InvalidArgumentError(
+                f'len(names) != len(records). {len(self._names)} != {len(records)}')
+        columns = [self._input_column, *self._names, 'critical_path']
+        if len(set(columns)) != len(columns):
+            raise InvalidArgumentError(f'Duplicated column names. {columns}')
+
+        self._response_maps = [
+            ResponseMapAll(records_, [records_.columns[0], records_.columns[-1]])
+            for records_ in records
+        ]
+
+    @property
+    def names(self) -> list[str]:
+        return list(self._names)
+
+    @property
+    def input_column(self) -> str:
+        return self._input_column
+
+    def to_records(
+        self,
+        case: str = 'all',
+        converter: ClockConverter | None = None
+    ) -> RecordsInterface:
+        """
+        Calculate response times of the paths for each common input.
+
+        Parameters
+        ----------
+        case : str, optional
+            'all', 'best', 'worst' or 'worst-with-external-latency', by default 'all'.
+            Each path is calculated in the same way as ResponseTime.
+        converter : ClockConverter | None, optional
+            Converter to simulation time.
+
+        Returns
+        -------
+        RecordsInterface
+            Response times of inputs which all paths have in the case.
+
+            Columns
+            - {input_column}
+            - {names[0]}
+            - {...}
+            - {names[n-1]}
+            - critical_path (index of the path with the longest response time)
+
+        Raises
+        ------
+        InvalidArgumentError
+            case is not supported.
+
+        """
+        inputs, response_times = self._align(case)
+        critical_paths = np.argmax(response_times, axis=1) if len(inputs) > 0 \
+            else np.empty(0, dtype=np.int64)
+        arrays = {self._input_column: _convert(inputs, converter)}
+        for i, name in enumerate(self._names):
+            arrays[name] = response_times[:, i]
+        arrays['critical_path'] = critical_paths
+        return RecordsFactory.create_instance_from_arrays(arrays)
+
+    def to_critical_path_counts(self, case: str = 'all') -> dict[str, int]:
+        """
+        Count how many times each path is the critical path.
+
+        Parameters
+        ----------
+        case : str, optional
+            'all', 'best', 'worst' or 'worst-with-external-latency', by default 'all'.
+
+        Returns
+        -------
+        dict[str, int]
+            Path name and the number of common inputs
+            for which the path has the longest response time.
+            The first path wins ties.
+
+        Raises
+        ------
+        InvalidArgumentError
+            case is not supported.
+
+        """
+        _, response_times = self._align(case)
+        counts = np.zeros(len(self._names), dtype=np.int64)
+        if len(response_times) > 0:
+            counts = np.bincount(np.argmax(response_times, axis=1), minlength=len(self._names))
+        return dict(zip(self._names, counts.tolist()))
+
+    def _align(self, case: str) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Align response times of the paths on the common inputs.
+
+        Parameters
+        ----------
+        case : str
+            'all', 'best', 'worst' or 'worst-with-external-latency'.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            Common input timestamps in ascending order,
+            and response times shaped (len(inputs), len(names)).
+
+        """
+        responses = [response_map.to_responses(case) for response_map in self._response_maps]
+        common = responses[0][0]
+        for inputs, _ in responses[1:]:
+            common = np.intersect1d(common, inputs, assume_unique=True)
+
+        response_times = np.empty((len(common), len(responses)), dtype=np.int64)
+        for i, (inputs, path_response_times) in enumerate(responses):
+            response_times[:, i] = path_response_times[np.searchsorted(inputs, common)]
+        return common, response_times
+
+
 class ResponseRecords:
 
     def __init__(
@@ -772,39 +1221,14 @@ class ResponseRecords:
             - {columns[n-1]}
 
         """
-        columns = []
+        input_min, values = self._create_response_records_core()
         if case == 'best':
-            columns = [ColumnValue(self._columns[0])]
-        else:  # worst
-            columns = [
-                ColumnValue(f'{self._input_column}_min'),
-                ColumnValue(f'{self._input_column}_max'),
-            ]
+            return _create_records(self._columns, values.T, sort=True)
 
-        columns += [ColumnValue(column) for column in self._columns[1:]]
-
-        records = self._create_empty_records(columns)
-
-        def add_records(
-            input_time_min: int,
-            record: RecordInterface
-        ):
-            if case == 'best':
-                record = self._create_best_case_record(
-                    record, self._columns
-                )
-            else:  # worst
-                record = self._create_worst_to_best_case_record(
-                    record, self._columns, input_time_min
-                )
-
-            records.append(record)
-
-        self._create_response_records_core(add_records)
-
-        records.sort_column_order()
-
-        return records
+        # worst
+        columns = [f'{self._input_column}_min', f'{self._input_column}_max']
+        columns += self._columns[1:]
+        return _create_records(columns, [input_min, *values.T], sort=True)
 
     def to_best_case_stacked_bar(self) -> RecordsInterface:
         """
@@ -820,20 +1244,8 @@ class ResponseRecords:
             - {columns[n-1]}
 
         """
-        records = self._create_empty_records()
-
-        def add_records(
-            _: int,
-            record: RecordInterface
-        ):
-            record_best_case = self._create_best_case_record(record, self._columns)
-            records.append(record_best_case)
-
-        self._create_response_records_core(add_records)
-
-        records.sort_column_order()
-
-        return records
+        _, values = self._create_response_records_core()
+        return _create_records(self._columns, values.T, sort=True)
 
     def to_worst_case_stacked_bar(self) -> RecordsInterface:
         """
@@ -849,21 +1261,8 @@ class ResponseRecords:
             - {columns[n-1]}
 
         """
-        records = self._create_empty_records()
-
-        def add_records(
-            input_time_min: int,
-            record: RecordInterface
-        ):
-            record_worst_case = self._create_worst_case_record(
-                record, self._columns, input_time_min)
-            records.append(record_worst_case)
-
-        self._create_response_records_core(add_records)
-
-        records.sort_column_order()
-
-        return records
+        input_min, values = self._create_response_records_core()
+        return _create_records(self._columns, [input_min, *values.T[1:]], sort=True)
 
     @property
     def _input_column(self):
@@ -877,115 +1276,40 @@ class ResponseRecords:
     def _columns(self) -> list[str]:
         return self._response_map.columns
 
-    def _create_empty_records(
-        self,
-        columns: Sequence[ColumnValue] | None = None
-    ) -> RecordsInterface:
-        columns = columns or [ColumnValue(column) for column in self._columns]
-        return RecordsFactory.create_instance(
-            None,
-            columns=columns
-        )
-
     def _create_all_pattern_records(self) -> RecordsInterface:
-        records = self._create_empty_records()
-
-        for output_time in self._response_map.sorted_iter():
-            input_time_range = self._response_map.at(output_time)
-            record = input_time_range.record
-
-            record_worst_case = self._create_worst_case_record(
-                record, self._columns, input_time_range.min_value)
-            records.append(record_worst_case)
-
-            if input_time_range.min_value == input_time_range.max_value:
-                continue
-
-            record_best_case = self._create_best_case_record(record, self._columns)
-            records.append(record_best_case)
-
-        records.sort_column_order()
+        values = self._response_map.values[self._response_map.latest_rows]
+        input_min = np.full(len(values), self._response_map.input_min_time or 0, dtype=np.int64)
 
-        return records
+        worst = np.column_stack([input_min, values[:, 1:]])
+        best = values[input_min != values[:, 0]]
+        return _create_records(self._columns, np.concatenate([worst, best]).T, sort=True)
 
     def _create_response_records(self) -> RecordsInterface:
-        records = self._create_empty_records()
-
-        def add_records(
-            input_time_min: int,
-            record: RecordInterface
-        ) -> None:
-            record_worst_case = self._create_worst_case_record(
-                record, self._columns, input_time_min)
-            records.append(record_worst_case)
-
-            record_best_case = self._create_best_case_record(record, self._columns)
-            records.append(record_best_case)
-
-        self._create_response_records_core(add_records)
-
-        records.sort_column_order()
-
-        return records
-
-    def _create_response_records_core(self, callback) -> RecordsInterface:
-        records = self._create_empty_records()
-
-        input_max_time_ = 0
-
-        for output_time in self._response_map.sorted_iter():
-            input_time_range = self._response_map.at(output_time)
+        input_min, values = self._create_response_records_core()
 
-            input_min_time = max(input_max_time_, input_time_range.min_value)
-            input_max_time = max(input_max_time_, input_time_range.max_value)
+        worst = np.column_stack([input_min, values[:, 1:]])
+        return _create_records(self._columns, np.concatenate([worst, values]).T, sort=True)
 
-            # store max_value in previous iteration
-            input_max_time_ = input_time_range.max_value
-
-            if input_min_time == input_max_time:
-                continue
-
-            callback(input_min_time, input_time_range.record)
-
-        records.sort_column_order()
-
-        return records
-
-    @staticmethod
-    def _create_best_case_record(
-        record: RecordInterface,
-        columns: list[str]
-    ) -> RecordInterface:
-        record_dict: dict[str, int] = {}
-        for column in columns:
-            record_dict[column] = record.get(column)
-        return RecordFactory.create_instance(record_dict)
-
-    @staticmethod
-    def _create_worst_case_record(
-        record: RecordInterface,
-        columns: list[str],
-        input_time_min: int
-    ) -> RecordInterface:
-        record_dict: dict[str, int] = {}
+    def _create_response_records_core(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Get the input range for each output time.
 
-        record_dict[columns[0]] = input_time_min
-        for column in columns[1:]:
-            record_dict[column] = record.get(column)
-        return RecordFactory.create_instance(record_dict)
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            The earliest input time and timestamps of the latest record,
+            for each output time whose input range is not empty.
 
-    @staticmethod
-    def _create_worst_to_best_case_record(
-        record: RecordInterface,
-        columns: list[str],
-        input_time_min: int
-    ) -> RecordInterface:
-        record_dict: dict[str, int] = {}
-
-        input_min_column = f'{columns[0]}_min'
-        input_max_column = f'{columns[0]}_max'
-        record_dict[input_min_column] = input_time_min
-        record_dict[input_max_column] = record.get(columns[0])
-        for column in columns[1:]:
-            record_dict[column] = record.get(column)
-        return RecordFactory.create_instance(record_dict)
+        """
+        values = self._response_map.values[self._response_map.latest_rows]
+        input_max = values[:, 0]
+        if len(input_max) == 0:
+            return input_max, values
+
+        # Inputs up to the previous output are already answered by the previous output.
+        input_min_time = self._response_map.input_min_time
+        assert input_min_time is not None
+        input_max_prev = np.concatenate([[0], input_max[:-1]])
+        input_min = np.maximum(input_max_prev, input_min_time)
+        valid = input_min != np.maximum(input_max_prev, input_max)
+        return input_min[valid], values[valid]
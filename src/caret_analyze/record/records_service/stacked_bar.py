@@ -14,11 +14,9 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+import numpy as np
 
-from .latency import Latency
 from ..interface import RecordsInterface
-from ..record import ColumnValue
 from ..record_factory import RecordsFactory
 from ...common import ClockConverter
 
@@ -47,58 +45,57 @@ class StackedBar:
 
         """
         # rename columns to nodes and topics granularity
-        self._records = records
         self._first_latency_name = '[worst - best] response time'
         rename_map: dict[str, str] = \
-            self._get_rename_column_map(self._records.columns)
-        renamed_records: RecordsInterface = \
-            self._rename_columns(self._records, rename_map)
+            self._get_rename_column_map(records.columns)
         columns = list(rename_map.values())
         if len(columns) < 2:
             raise ValueError(f'Column size is {len(columns)} and must be more 2.')
+        if len(records) == 0:
+            raise ValueError('Records are empty.')
 
         # add stacked bar data
         xlabel: str = 'start time'
-        x_axis_values: RecordsInterface = \
-            self._get_x_axis_values(renamed_records, columns[0], xlabel)
-        stacked_bar_records = self._to_stacked_bar_records(renamed_records, columns)
-        series_seq: Sequence[int | None] = x_axis_values.get_column_series(xlabel)
+        timestamps = self._to_column_matrix(records, list(rename_map))
+        x_axis_values = timestamps[:, 0]
         if converter:
-            series_seq = [round(converter.convert(float(t))) for t in series_seq if t is not None]
-        series_list: list[int] = self._convert_sequence_to_list(series_seq)
-        stacked_bar_records = \
-            self._merge_column_series(
-                stacked_bar_records,
-                series_list,
-                xlabel,
-            )
-        self._stacked_bar_records = stacked_bar_records
+            x_axis_values = np.rint(converter.convert_many(x_axis_values)).astype(np.int64)
+        latencies = np.diff(timestamps, axis=1)
+
         self._columns = columns[:-1]
+        self._arrays: dict[str, np.ndarray] = {
+            column: latencies[:, i] for i, column in enumerate(self._columns)}
+        self._arrays[xlabel] = x_axis_values
+        self._stacked_bar_records: RecordsInterface | None = None
 
     @staticmethod
-    def _rename_columns(
+    def _to_column_matrix(
         records: RecordsInterface,
-        rename_map: dict[str, str],
-    ) -> RecordsInterface:
+        columns: list[str],
+    ) -> np.ndarray:
         """
-        Rename columns of records.
+        Extract columns as a matrix.
 
         Parameters
         ----------
         records : RecordsInterface
             Target records.
-        rename_map : dict[str, str]
-            Names before and after changed.
+        columns : list[str]
+            Target columns.
 
         Returns
         -------
-        RecordsInterface
-            Renamed records
+        np.ndarray
+            Timestamps of shape (len(records), len(columns)).
 
         """
-        for before, after in rename_map.items():
-            records.rename_columns({before: after})
-        return records
+        dicts = [record.data for record in records.data]
+        matrix = np.empty((len(dicts), len(columns)), dtype=np.int64)
+        for i, column in enumerate(columns):
+            series = [d.get(column) for d in dicts]
+            assert None not in series
+            matrix[:, i] = np.array(series, dtype=np.int64)
+        return matrix
 
     def _get_rename_column_map(
         self,
@@ -136,109 +133,6 @@ class StackedBar:
 
         return rename_map
 
-    @staticmethod
-    def _get_x_axis_values(
-        records: RecordsInterface,
-        column: str,
-        xlabel: str,
-    ) -> RecordsInterface:
-        """
-        Get x axis values.
-
-        Parameters
-        ----------
-        records : RecordsInterface
-            Target records.
-        column : str
-            Target column.
-        xlabel : str
-            Label name.
-
-        Returns
-        -------
-        RecordsInterface
-            Target column's records.
-
-        """
-        series = records.get_column_series(column)
-        record_dict = [{xlabel: _} for _ in series]
-        record: RecordsInterface = \
-            RecordsFactory.create_instance(record_dict, columns=[ColumnValue(xlabel)])
-        return record
-
-    def _to_stacked_bar_records(
-        self,
-        records: RecordsInterface,
-        columns: list[str],
-    ) -> RecordsInterface:
-        """
-        Calculate stacked bar data.
-
-        Parameters
-        ----------
-        records : RecordsInterface
-            Target records.
-        columns : list[str]
-            Target columns (Node/Topic granularity).
-
-        Returns
-        -------
-        RecordsInterface
-            Stacked bar records.
-
-        """
-        output_records: RecordsInterface = RecordsFactory.create_instance()
-        record_size = len(records.data)
-        for column in columns[:-1]:
-            output_records.append_column(ColumnValue(column), [])
-
-        for column_from, column_to in zip(columns[:-1], columns[1:]):
-            latency_handler = Latency(records, column_from, column_to)
-            assert record_size == len(latency_handler.to_records())
-
-            latency_records = latency_handler.to_records()
-            latency_seq: Sequence[int | None] = latency_records.get_column_series('latency')
-            latency_list: list[int] = self._convert_sequence_to_list(latency_seq)
-
-            output_records = self._merge_column_series(output_records, latency_list, column_from)
-
-        return output_records
-
-    @staticmethod
-    def _merge_column_series(
-        records: RecordsInterface,
-        series: list[int],
-        column: str,
-    ) -> RecordsInterface:
-        """
-        Append series to records.
-
-        Parameters
-        ----------
-        records : RecordsInterface
-            Source records.
-        series : list[int]
-            Data to append.
-        column : str
-            The column with appended data.
-
-        Returns
-        -------
-        RecordsInterface
-            Appended records.
-
-        """
-        record_dict = [{column: t} for t in series]
-
-        if len(records.data) == 0:
-            new_records: RecordsInterface = \
-                RecordsFactory.create_instance(
-                    record_dict, columns=[ColumnValue(column)])
-            records.concat(new_records)
-        else:
-            records.append_column(ColumnValue(column), series)
-        return records
-
     def to_dict(self) -> dict[str, list[int]]:
         """
         Get stacked bar dict data.
@@ -249,37 +143,7 @@ class StackedBar:
             Stacked bar dict data.
 
         """
-        return self._to_dict(self._stacked_bar_records)
-
-    def _to_dict(self, records: RecordsInterface) -> dict[str, list[int]]:
-        """
-        Generate dict from records.
-
-        Parameters
-        ----------
-        records : RecordsInterface
-            Target records.
-
-        Returns
-        -------
-        dict[str, list[int]]
-            Dict generated from records.
-
-        """
-        columns = records.columns
-        output_dict: dict[str, list[int]] = {}
-        for column in columns:
-            series_seq: Sequence[int | None] = records.get_column_series(column)
-            series_list: list[int] = self._convert_sequence_to_list(series_seq)
-            output_dict[column] = series_list
-        return output_dict
-
-    @staticmethod
-    def _convert_sequence_to_list(
-        seq: Sequence[int | None],
-    ) -> list[int]:
-        assert not any(x is None for x in seq)
-        return [x for x in seq if x is not None]
+        return {column: array.tolist() for column, array in self._arrays.items()}
 
     @property
     def columns(self) -> list[str]:
@@ -287,4 +151,6 @@ class StackedBar:
 
     @property
     def records(self) -> RecordsInterface:
+        if self._stacked_bar_records is None:
+            self._stacked_bar_records = RecordsFactory.create_instance_from_arrays(self._arrays)
         return self._stacked_bar_records
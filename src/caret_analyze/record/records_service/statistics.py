@@ -0,0 +1,396 @@
+# Copyright 2021 TIER IV, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+import math
+from typing import NamedTuple
+
+import numpy as np
+
+from ...exceptions import InvalidArgumentError
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch with relative accuracy guarantee (DDSketch).
+
+    Values are counted in logarithmic buckets,
+    so any quantile is estimated within relative_accuracy of the exact value.
+    The number of buckets only depends on the range of the values,
+    e.g. about 1400 buckets for 1 ns to 1000 s with 1 % accuracy.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01) -> None:
+        """
+        Construct an instance.
+
+        Parameters
+        ----------
+        relative_accuracy : float
+            relative accuracy of the estimated quantiles. 0 < relative_accuracy < 1.
+
+        Raises
+        ------
+        InvalidArgumentError
+            relative_accuracy is out of range.
+
+        """
+        if not 0 < relative_accuracy < 1:
+            raise InvalidArgumentError(
+                f'relative_accuracy must be in (0, 1). {relative_accuracy}')
+        self._relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._positive: dict[int, int] = {}
+        self._negative: dict[int, int] = {}
+        self._zero_count = 0
+        self._count = 0
+
+    @property
+    def relative_accuracy(self) -> float:
+        return self._relative_accuracy
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def add(self, values: Sequence[float] | np.ndarray) -> None:
+        """
+        Add values.
+
+        Parameters
+        ----------
+        values : Sequence[float] | np.ndarray
+            values to add.
+
+        """
+        values = np.asarray(values, dtype=np.float64)
+        self._add_to_store(self._positive, values[values > 0])
+        self._add_to_store(self._negative, -values[values < 0])
+        self._zero_count += int(np.count_nonzero(values == 0))
+        self._count += len(values)
+
+    def merge(self, other: QuantileSketch) -> None:
+        """
+        Merge another sketch into this sketch.
+
+        Parameters
+        ----------
+        other : QuantileSketch
+            sketch to merge. It must have the same relative_accuracy.
+
+        Raises
+        ------
+        InvalidArgumentError
+            relative_accuracy differs.
+
+        """
+        if other._relative_accuracy != self._relative_accuracy:
+            raise InvalidArgumentError(
+                'Failed to merge sketches with different relative_accuracy. '
+                f'{self._relative_accuracy} != {other._relative_accuracy}')
+        for store, other_store in ((self._positive, other._positive),
+                                   (self._negative, other._negative)):
+            for key, count in other_store.items():
+                store[key] = store.get(key, 0) + count
+        self._zero_count += other._zero_count
+        self._count += other._count
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile.
+
+        Parameters
+        ----------
+        q : float
+            quantile to estimate. 0 <= q <= 1.
+
+        Returns
+        -------
+        float
+            estimated value. NaN if the sketch is empty.
+
+        """
+        if not 0 <= q <= 1:
+            raise InvalidArgumentError(f'q must be in [0, 1]. {q}')
+        if self._count == 0:
+            return math.nan
+
+        rank = q * (self._count - 1)
+        accumulated = 0
+        for key in sorted(self._negative, reverse=True):
+            accumulated += self._negative[key]
+            if accumulated > rank:
+                return -self._value(key)
+        accumulated += self._zero_count
+        if accumulated > rank:
+            return 0.0
+        for key in sorted(self._positive):
+            accumulated += self._positive[key]
+            if accumulated > rank:
+                return self._value(key)
+        return self._value(max(self._positive))
+
+    def _add_to_store(self, store: dict[int, int], values: np.ndarray) -> None:
+        if len(values) == 0:
+            return
+        keys = np.ceil(np.log(values) / self._log_gamma).astype(np.int64)
+        unique_keys, counts = np.unique(keys, return_counts=True)
+        for key, count in zip(unique_keys.tolist(), counts.tolist()):
+            store[key] = store.get(key, 0) + count
+
+    def _value(self, key: int) -> float:
+        return 2 * self._gamma ** key / (self._gamma + 1)
+
+
+class StatisticsSample(NamedTuple):
+    """Sample kept as one of the worst values."""
+
+    value: int
+    timestamp: int
+    record: dict[str, int]
+
+
+class StreamingStatistics:
+    """
+    Summary statistics which are updated chunk by chunk with constant memory.
+
+    Count, mean, standard deviation, minimum and maximum are exact.
+    Percentiles are estimated by QuantileSketch.
+    The top-k worst samples are kept together with their source records.
+    Statistics of different time chunks or trace files can be merged.
+
+    Examples
+    --------
+    >>> stats = StreamingStatistics()
+    >>> stats.update([10, 20, 30], [0, 100, 200])
+    >>> stats.update([40], [300])
+    >>> stats.summary()['max [ns]']
+    40
+
+    """
+
+    def __init__(
+        self,
+        top_k: int = 10,
+        relative_accuracy: float = 0.01
+    ) -> None:
+        """
+        Construct an instance.
+
+        Parameters
+        ----------
+        top_k : int
+            number of the worst samples to keep.
+        relative_accuracy : float
+            relative accuracy of the estimated percentiles.
+
+        """
+        if top_k < 0:
+            raise InvalidArgumentError(f'top_k must be 0 or more. {top_k}')
+        self._top_k = top_k
+        self._sketch = QuantileSketch(relative_accuracy)
+        self._count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._min: int | None = None
+        self._max: int | None = None
+        self._max_timestamp: int | None = None
+        self._worst: list[StatisticsSample] = []
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def mean(self) -> float:
+        return self._mean if self._count > 0 else math.nan
+
+    @property
+    def std(self) -> float:
+        """
+        Get population standard deviation.
+
+        Returns
+        -------
+        float
+            standard deviation. NaN if there are no samples.
+
+        """
+        return math.sqrt(self._m2 / self._count) if self._count > 0 else math.nan
+
+    @property
+    def min(self) -> int | None:
+        return self._min
+
+    @property
+    def max(self) -> int | None:
+        return self._max
+
+    @property
+    def worst_timestamp(self) -> int | None:
+        """
+        Get timestamp of the maximum value.
+
+        Returns
+        -------
+        int | None
+            timestamp. The earliest one among the same values.
+            None if there are no samples.
+
+        """
+        return self._max_timestamp
+
+    @property
+    def worst_samples(self) -> list[StatisticsSample]:
+        """
+        Get the worst samples.
+
+        Returns
+        -------
+        list[StatisticsSample]
+            samples in descending order of the value.
+            The earlier sample comes first among the same values.
+
+        """
+        return list(self._worst)
+
+    @property
+    def sketch(self) -> QuantileSketch:
+        return self._sketch
+
+    def update(
+        self,
+        values: Sequence[int] | np.ndarray,
+        timestamps: Sequence[int] | np.ndarray,
+        get_record: Callable[[int], dict[str, int]] | None = None
+    ) -> None:
+        """
+        Add a chunk of samples.
+
+        Parameters
+        ----------
+        values : Sequence[int] | np.ndarray
+            values such as latency or response time. [ns]
+        timestamps : Sequence[int] | np.ndarray
+            timestamps of the samples.
+        get_record : Callable[[int], dict[str, int]] | None
+            function which returns the source record of the i-th sample.
+            It is only called for candidates of the worst samples.
+
+        """
+        values = np.asarray(values, dtype=np.int64)
+        timestamps = np.asarray(timestamps, dtype=np.int64)
+        if len(values) != len(timestamps):
+            raise InvalidArgumentError('values and timestamps must have the same length.')
+        if len(values) == 0:
+            return
+
+        # Chan's parallel algorithm to combine the moments.
+        chunk_mean = float(values.mean())
+        chunk_m2 = float(((values - chunk_mean) ** 2).sum())
+        self._combine_moments(len(values), chunk_mean, chunk_m2)
+
+        chunk_max_index = int(np.argmax(values))
+        self._update_range(int(values.min()), int(values[chunk_max_index]),
+                           int(timestamps[chunk_max_index]))
+        self._sketch.add(values)
+
+        if self._top_k == 0:
+            return
+        k = min(self._top_k, len(values))
+        candidates = np.argpartition(-values, k - 1)[:k] if k < len(values) \
+            else np.arange(len(values))
+        samples = [
+            StatisticsSample(int(values[i]), int(timestamps[i]),
+                             get_record(i) if get_record else {})
+            for i in candidates.tolist()
+        ]
+        self._merge_worst(samples)
+
+    def merge(self, other: StreamingStatistics) -> None:
+        """
+        Merge statistics of another chunk into this statistics.
+
+        Parameters
+        ----------
+        other : StreamingStatistics
+            statistics to merge.
+
+        """
+        self._sketch.merge(other._sketch)
+        if other._count == 0:
+            return
+        self._combine_moments(other._count, other._mean, other._m2)
+        assert other._min is not None and other._max is not None
+        assert other._max_timestamp is not None
+        self._update_range(other._min, other._max, other._max_timestamp)
+        self._merge_worst(other._worst)
+
+    def summary(
+        self,
+        percentiles: Sequence[float] = (50, 99, 99.9)
+    ) -> dict[str, float | int | None]:
+        """
+        Get summary statistics.
+
+        Parameters
+        ----------
+        percentiles : Sequence[float]
+            percentiles to be estimated. [%]
+
+        Returns
+        -------
+        dict[str, float | int | None]
+            - count
+            - mean [ns]
+            - std [ns]
+            - min [ns]
+            - p{percentile} [ns] (for each percentile)
+            - max [ns]
+            - worst_timestamp
+
+        """
+        summary: dict[str, float | int | None] = {
+            'count': self._count,
+            'mean [ns]': self.mean,
+            'std [ns]': self.std,
+            'min [ns]': self._min,
+        }
+        for percentile in percentiles:
+            summary[f'p{percentile:g} [ns]'] = self._sketch.quantile(percentile / 100)
+        summary['max [ns]'] = self._max
+        summary['worst_timestamp'] = self._max_timestamp
+        return summary
+
+    def _combine_moments(self, count: int, mean: float, m2: float) -> None:
+        total = self._count + count
+        delta = mean - self._mean
+        self._mean += delta * count / total
+        self._m2 += m2 + delta ** 2 * self._count * count / total
+        self._count = total
+
+    def _update_range(self, min_value: int, max_value: int, max_timestamp: int) -> None:
+        if self._min is None or min_value < self._min:
+            self._min = min_value
+        if self._max is None or self._max_timestamp is None or max_value > self._max or \
+                (max_value == self._max and max_timestamp < self._max_timestamp):
+            self._max = max_value
+            self._max_timestamp = max_timestamp
+
+    def _merge_worst(self, samples: Sequence[StatisticsSample]) -> None:
+        merged = sorted([*self._worst, *samples], key=lambda s: (-s.value, s.timestamp))
+        self._worst = merged[:self._top_k]
@@ -0,0 +1,128 @@
+# Copyright 2021 TIER IV, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import numpy as np
+
+from .column import Columns
+from .interface import RecordsInterface
+from .record_factory import RecordsFactory
+
+
+class RecordsSlicer:
+    """
+    Class that extracts records within a time range.
+
+    The first column is indexed once on construction,
+    so that each slice only copies the rows within the requested range.
+    """
+
+    def __init__(
+        self,
+        records: RecordsInterface,
+        column: str | None = None,
+    ) -> None:
+        """
+        Construct an instance.
+
+        Parameters
+        ----------
+        records : RecordsInterface
+            records to be sliced. The records are not modified.
+        column : str | None
+            column name used as the time axis. The first column is used if None.
+
+        """
+        self._records = records
+        self._columns = Columns.from_str(records.columns).to_value()
+
+        if column is None and len(records.columns) > 0:
+            column = records.columns[0]
+
+        series = [] if column is None else records.get_column_series(column)
+        indices = np.array(
+            [i for i, stamp in enumerate(series) if stamp is not None], dtype=np.int64)
+        stamps = np.array([series[i] for i in indices], dtype=np.int64)
+        order = np.argsort(stamps, kind='stable')
+        self._indices = indices[order]
+        self._stamps = stamps[order]
+
+    @property
+    def time_range(self) -> tuple[int, int] | None:
+        """
+        Get minimum and maximum timestamps.
+
+        Returns
+        -------
+        tuple[int, int] | None
+            Minimum and maximum timestamps. None if there are no valid timestamps.
+
+        """
+        if len(self._stamps) == 0:
+            return None
+        return int(self._stamps[0]), int(self._stamps[-1])
+
+    def count(self, min_ns: int | None = None, max_ns: int | None = None) -> int:
+        """
+        Count records within a time range.
+
+        Parameters
+        ----------
+        min_ns : int | None
+            lower bound of the range (inclusive). Unbounded if None.
+        max_ns : int | None
+            upper bound of the range (inclusive). Unbounded if None.
+
+        Returns
+        -------
+        int
+            number of records within the range.
+
+        """
+        lo, hi = self._search(min_ns, max_ns)
+        return hi - lo
+
+    def slice(self, min_ns: int | None = None, max_ns: int | None = None) -> RecordsInterface:
+        """
+        Get records within a time range.
+
+        Parameters
+        ----------
+        min_ns : int | None
+            lower bound of the range (inclusive). Unbounded if None.
+        max_ns : int | None
+            upper bound of the range (inclusive). Unbounded if None.
+
+        Returns
+        -------
+        RecordsInterface
+            copied records within the range. The original row order is kept.
+
+        """
+        lo, hi = self._search(min_ns, max_ns)
+        records = RecordsFactory.create_instance(None, columns=self._columns)
+        for index in np.sort(self._indices[lo:hi]):
+            record = self._records.get_row_series(int(index))
+            records.append(dict(record.data))
+        return records
+
+    def _search(self, min_ns: int | None, max_ns: int | None) -> tuple[int, int]:
+        lo = 0
+        hi = len(self._stamps)
+        if min_ns is not None:
+            lo = int(np.searchsorted(self._stamps, min_ns, side='left'))
+        if max_ns is not None:
+            hi = int(np.searchsorted(self._stamps, max_ns, side='right'))
+        return lo, max(lo, hi)
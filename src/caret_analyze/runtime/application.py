@@ -14,9 +14,13 @@
 
 from __future__ import annotations, unicode_literals
 
+from collections.abc import Sequence
 import fnmatch
-
+from functools import cached_property
 from logging import getLogger
+from typing import TYPE_CHECKING
+
+import pandas as pd
 
 from .callback import CallbackBase
 from .callback_group import CallbackGroup
@@ -35,6 +39,9 @@ from ..infra.lttng.lttng import Lttng
 from ..infra.lttng.records_provider_lttng import RecordsProviderLttng
 from ..value_objects import NodePathStructValue
 
+if TYPE_CHECKING:
+    from .runtime_loaded import RuntimeLoaded
+
 logger = getLogger(__name__)
 
 
@@ -73,11 +80,41 @@ class Application(Summarizable):
 
         loaded = RuntimeLoaded(architecture, provider)
 
+        self._provider = provider
+        self._set_loaded(loaded)
+
+    def _set_loaded(self, loaded: RuntimeLoaded) -> None:
+        self._loaded = loaded
         self._nodes: list[Node] = loaded.nodes
         self._executors: list[Executor] = loaded.executors
         self._communications: list[Communication] = loaded.communications
         self._paths: list[Path] = loaded.paths
 
+        # Drop lookup indices of the previous runtime objects.
+        for name in self._INDEX_NAMES:
+            self.__dict__.pop(name, None)
+
+    def update_architecture(self, architecture: Architecture) -> None:
+        """
+        Apply an edited architecture.
+
+        Only the runtime objects of edited elements are rebuilt.
+        Nodes, node paths, communications and paths whose values are unchanged are kept
+        with their record caches, so that e.g. changing the message context of one node
+        does not require recalculating the records of unrelated paths.
+        Communications and paths passing through an edited node are rebuilt
+        on top of its unchanged node paths.
+
+        Parameters
+        ----------
+        architecture : Architecture
+            Architecture edited by e.g. update_message_context, add_path or rename_*.
+
+        """
+        from .runtime_loaded import RuntimeLoaded
+
+        self._set_loaded(RuntimeLoaded(architecture, self._provider, self._loaded))
+
     @property
     def executors(self) -> list[Executor]:
         """
@@ -175,6 +212,96 @@ class Application(Summarizable):
                 cbs += list(node.callbacks)
         return sorted(cbs, key=lambda x: x.callback_name)
 
+    def callback_latency_summary(
+        self,
+        percentiles: Sequence[float] = (50, 90, 99),
+    ) -> pd.DataFrame:
+        """
+        Summarize execution times of all callbacks in the application.
+
+        Execution times of all callbacks are summarized at once,
+        which is faster than calculating records of each callback.
+
+        Parameters
+        ----------
+        percentiles : Sequence[float]
+            percentiles of execution time to be calculated. [%]
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per callback, sorted by callback name. Columns
+
+            - node_name
+            - callback_name
+            - count
+            - mean [ns]
+            - p{percentile} [ns] (for each percentile)
+            - max [ns]
+            - drop_rate
+
+        Raises
+        ------
+        UnsupportedTypeError
+            Occurs when the provider does not support runtime data.
+
+        """
+        if not isinstance(self._provider, RuntimeDataProvider):
+            raise UnsupportedTypeError('Callback latency summary requires runtime data.')
+
+        callbacks = [callback.value for callback in self.callbacks]
+        return self._provider.callback_latency_summary(callbacks, percentiles)
+
+    # Lookup indices built on first use.
+    # The similar-name search is only used to report a miss.
+    _INDEX_NAMES = (
+        '_paths_by_name', '_executors_by_name', '_nodes_by_name', '_callbacks_by_name',
+        '_callback_groups_by_name', '_communications_by_key', '_communications_by_topic',
+        '_node_paths_by_key', '_node_paths_by_node',
+    )
+
+    @cached_property
+    def _paths_by_name(self) -> dict[str, list[Path]]:
+        return Util.group_items(lambda x: x.path_name, self.paths)
+
+    @cached_property
+    def _executors_by_name(self) -> dict[str, list[Executor]]:
+        return Util.group_items(lambda x: x.executor_name, self.executors)
+
+    @cached_property
+    def _nodes_by_name(self) -> dict[str, list[Node]]:
+        return Util.group_items(lambda x: x.node_name, self.nodes)
+
+    @cached_property
+    def _callbacks_by_name(self) -> dict[str, list[CallbackBase]]:
+        return Util.group_items(lambda x: x.callback_name, self.callbacks)
+
+    @cached_property
+    def _callback_groups_by_name(self) -> dict[str, list[CallbackGroup]]:
+        return Util.group_items(lambda x: x.callback_group_name, self.callback_groups)
+
+    @cached_property
+    def _communications_by_key(self) -> dict[tuple, list[Communication]]:
+        return Util.group_items(
+            lambda x: (x.publish_node_name, x.subscribe_node_name, x.topic_name,
+                       x.publisher_construction_order, x.subscription_construction_order),
+            self.communications)
+
+    @cached_property
+    def _communications_by_topic(self) -> dict[str, list[Communication]]:
+        return Util.group_items(lambda x: x.topic_name, self.communications)
+
+    @cached_property
+    def _node_paths_by_key(self) -> dict[tuple, list[NodePathStructValue]]:
+        return Util.group_items(
+            lambda x: (x.node_name, x.subscribe_topic_name, x.publish_topic_name,
+                       x.publisher_construction_order, x.subscription_construction_order),
+            self.node_paths)
+
+    @cached_property
+    def _node_paths_by_node(self) -> dict[str, list[NodePathStructValue]]:
+        return Util.group_items(lambda x: x.node_name, self.node_paths)
+
     def get_path(self, path_name: str) -> Path:
         """
         Get a path that matches the condition.
@@ -203,6 +330,10 @@ class Application(Summarizable):
         if not isinstance(path_name, str):
             raise InvalidArgumentError('Argument type is invalid.')
 
+        paths = self._paths_by_name.get(path_name)
+        if paths:
+            return paths[0]
+
         def get_name(x):
             return x.path_name
 
@@ -239,6 +370,10 @@ class Application(Summarizable):
         if not isinstance(executor_name, str):
             raise InvalidArgumentError('Argument type is invalid.')
 
+        executors = self._executors_by_name.get(executor_name)
+        if executors:
+            return executors[0]
+
         def get_name(x):
             return x.executor_name
 
@@ -296,6 +431,10 @@ class Application(Summarizable):
         if not isinstance(callback_group_name, str):
             raise InvalidArgumentError('Argument type is invalid.')
 
+        callback_groups = self._callback_groups_by_name.get(callback_group_name)
+        if callback_groups:
+            return callback_groups[0]
+
         def get_name(x):
             return x.callback_group_name
 
@@ -355,6 +494,12 @@ class Application(Summarizable):
              'publisher_construction_order': publisher_construction_order,
              'subscription_construction_order': subscription_construction_order}
 
+        comms = self._communications_by_key.get(
+            (publisher_node_name, subscription_node_name, topic_name,
+             publisher_construction_order, subscription_construction_order))
+        if comms:
+            return comms[0]
+
         def get_names(x):
             return {'publisher_node_name': x.publish_node_name,
                     'subscription_node_name': x.subscribe_node_name,
@@ -485,6 +630,12 @@ class Application(Summarizable):
              'publisher_construction_order': publisher_construction_order,
              'subscription_construction_order': subscription_construction_order}
 
+        node_paths = self._node_paths_by_key.get(
+            (node_name, subscribe_topic_name, publish_topic_name,
+             publisher_construction_order, subscription_construction_order))
+        if node_paths:
+            return node_paths[0]
+
         def get_names(x):
             return {'node_name': x.node_name,
                     'subscribe_topic_name': x.subscribe_topic_name,
@@ -524,10 +675,7 @@ class Application(Summarizable):
         if not isinstance(topic_name, str):
             raise InvalidArgumentError('Argument type is invalid.')
 
-        comms = Util.filter_items(
-            lambda x: x.topic_name == topic_name,
-            self.communications
-        )
+        comms = self._communications_by_topic.get(topic_name, [])
         if (len(comms) == 0):
             Util.find_similar_one(topic_name,
                                   self.communications,
@@ -627,10 +775,7 @@ class Application(Summarizable):
         if not isinstance(node_name, str):
             raise InvalidArgumentError('Argument type is invalid.')
 
-        node_paths = Util.filter_items(
-            lambda x: x.node_name == node_name,
-            self.node_paths
-        )
+        node_paths = self._node_paths_by_node.get(node_name, [])
         if (len(node_paths) == 0):
             Util.find_similar_one(node_name,
                                   self.node_paths,
@@ -678,6 +823,10 @@ class Application(Summarizable):
         if not isinstance(node_name, str):
             raise InvalidArgumentError('Argument type is invalid.')
 
+        nodes = self._nodes_by_name.get(node_name)
+        if nodes:
+            return nodes[0]
+
         def get_name(x):
             return x.node_name
 
@@ -712,6 +861,10 @@ class Application(Summarizable):
         if not isinstance(callback_name, str):
             raise InvalidArgumentError('Argument type is invalid.')
 
+        callbacks = self._callbacks_by_name.get(callback_name)
+        if callbacks:
+            return callbacks[0]
+
         def get_name(x):
             return x.callback_name
 
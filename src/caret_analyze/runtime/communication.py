@@ -287,6 +287,31 @@ class Communication(PathBase, Summarizable):
 
         return records
 
+    def _to_records_in_range(
+        self,
+        min_ns: int | None,
+        max_ns: int | None
+    ) -> RecordsInterface | None:
+        """
+        Calculate records from the events within a time range [override].
+
+        Parameters
+        ----------
+        min_ns : int | None
+            lower bound of the range (inclusive). Unbounded if None.
+        max_ns : int | None
+            upper bound of the range (inclusive). Unbounded if None.
+
+        Returns
+        -------
+        RecordsInterface | None
+            communication latency (publish-subscribe).
+
+        """
+        assert self._records_provider is not None
+        provider = self._records_provider.with_time_range(min_ns, max_ns)
+        return provider.communication_records(self._val)
+
     @property
     def subscription_construction_order(self) -> int | None:
         """
@@ -14,6 +14,10 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+
+import pandas as pd
+
 from .callback import CallbackBase
 from .callback_group import CallbackGroup
 from .node_path import NodePath
@@ -22,7 +26,8 @@ from .subscription import Subscription
 from .timer import Timer
 from .variable_passing import VariablePassing
 from ..common import Summarizable, Summary, Util
-from ..exceptions import InvalidArgumentError, ItemNotFoundError
+from ..exceptions import InvalidArgumentError, ItemNotFoundError, UnsupportedTypeError
+from ..infra.interface import RecordsProvider, RuntimeDataProvider
 from ..value_objects import NodeStructValue
 
 
@@ -38,6 +43,7 @@ class Node(Summarizable):
         node_paths: list[NodePath],
         callback_groups: list[CallbackGroup] | None,
         variable_passings: list[VariablePassing] | None,
+        records_provider: RecordsProvider | None = None,
     ) -> None:
         """
         Construct an instance.
@@ -58,6 +64,8 @@ class Node(Summarizable):
             callback groups in the node.
         variable_passings : list[VariablePassing] | None
             variable passings in the node.
+        records_provider : RecordsProvider | None
+            provider to be evaluated.
 
         """
         self._val = node
@@ -67,6 +75,7 @@ class Node(Summarizable):
         self._paths = node_paths
         self._callback_groups = callback_groups
         self._variable_passings = variable_passings
+        self._provider = records_provider
 
     @property
     def callback_groups(self) -> list[CallbackGroup] | None:
@@ -112,6 +121,36 @@ class Node(Summarizable):
         cbs = Util.flatten([cbg.callbacks for cbg in self.callback_groups])
         return sorted(cbs, key=lambda x: x.callback_name)
 
+    def callback_latency_summary(
+        self,
+        percentiles: Sequence[float] = (50, 90, 99),
+    ) -> pd.DataFrame:
+        """
+        Summarize execution times of all callbacks in the node.
+
+        Parameters
+        ----------
+        percentiles : Sequence[float]
+            percentiles of execution time to be calculated. [%]
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per callback, sorted by callback name.
+            See RuntimeDataProvider.callback_latency_summary for columns.
+
+        Raises
+        ------
+        UnsupportedTypeError
+            Occurs when the provider does not support runtime data.
+
+        """
+        if not isinstance(self._provider, RuntimeDataProvider):
+            raise UnsupportedTypeError('Callback latency summary requires runtime data.')
+
+        callbacks = [callback.value for callback in self.callbacks or []]
+        return self._provider.callback_latency_summary(callbacks, percentiles)
+
     @property
     def callback_names(self) -> list[str] | None:
         """
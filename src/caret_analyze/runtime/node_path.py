@@ -159,6 +159,33 @@ class NodePath(PathBase, Summarizable):
         records = self._provider.node_records(self._val)
         return records
 
+    def _to_records_in_range(
+        self,
+        min_ns: int | None,
+        max_ns: int | None
+    ) -> RecordsInterface | None:
+        """
+        Calculate records from the events within a time range [override].
+
+        Parameters
+        ----------
+        min_ns : int | None
+            lower bound of the range (inclusive). Unbounded if None.
+        max_ns : int | None
+            upper bound of the range (inclusive). Unbounded if None.
+
+        Returns
+        -------
+        RecordsInterface | None
+            node latency latency (subscribe-publish).
+
+        """
+        if self.message_context is None:
+            return RecordsFactory.create_instance()
+
+        provider = self._provider.with_time_range(min_ns, max_ns)
+        return provider.node_records(self._val)
+
     @property
     def publisher(self) -> Publisher | None:
         """
@@ -343,3 +370,65 @@ class NodePath(PathBase, Summarizable):
 
         records = self._provider.path_end_records(self._val.subscription_callback)
         return records
+
+    def _to_path_beginning_records_in_range(
+        self,
+        min_ns: int | None,
+        max_ns: int | None
+    ) -> RecordsInterface:
+        """
+        Calculate records for beginning of path from the events within a time range.
+
+        Parameters
+        ----------
+        min_ns : int | None
+            lower bound of the range (inclusive). Unbounded if None.
+        max_ns : int | None
+            upper bound of the range (inclusive). Unbounded if None.
+
+        Returns
+        -------
+        RecordsInterface
+            node partial latency (callback_start-publish).
+
+        """
+        if self._val.publisher is None:
+            return RecordsFactory.create_instance()
+
+        try:
+            provider = self._provider.with_time_range(min_ns, max_ns)
+            return provider.path_beginning_records(self._val.publisher)
+        except Error as e:
+            logger.warning(e)
+            return RecordsFactory.create_instance()
+
+    def _to_path_end_records_in_range(
+        self,
+        min_ns: int | None,
+        max_ns: int | None
+    ) -> RecordsInterface:
+        """
+        Calculate records for end of path from the events within a time range.
+
+        Parameters
+        ----------
+        min_ns : int | None
+            lower bound of the range (inclusive). Unbounded if None.
+        max_ns : int | None
+            upper bound of the range (inclusive). Unbounded if None.
+
+        Returns
+        -------
+        RecordsInterface
+            node partial latency (callback_start-callback_end).
+
+        """
+        if self._val.subscription_callback is None:
+            return RecordsFactory.create_instance()
+
+        try:
+            provider = self._provider.with_time_range(min_ns, max_ns)
+            return provider.path_end_records(self._val.subscription_callback)
+        except Error as e:
+            logger.warning(e)
+            return RecordsFactory.create_instance()
@@ -14,16 +14,18 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Callable, Hashable, Iterator, Sequence
 from logging import getLogger
 
+import pandas as pd
+
 from .callback import CallbackBase
 from .communication import Communication
 from .node_path import NodePath
 from .path_base import PathBase
 from ..common import Summarizable, Summary, Util
 from ..exceptions import Error, InvalidArgumentError, InvalidRecordsError
-from ..record import Columns, RecordsFactory
+from ..record import Clip, Columns, DataFrameShaper, RecordsFactory, RecordsSlicer, Strip
 from ..record.record import merge, merge_sequential, RecordsInterface
 from ..value_objects import CallbackChain, PathStructValue
 
@@ -119,17 +121,82 @@ class RecordsMerged:
         include_first_callback: bool = False,
         include_last_callback: bool = False
     ) -> RecordsInterface:
-        logger.info('Started merging path records.')
+        targets, first_element = RecordsMerged._to_first_records(targets, include_first_callback)
+
+        def to_end_records() -> RecordsInterface:
+            last_target = targets[-1]
+            assert isinstance(last_target, NodePath)
+            return last_target.to_path_end_records()
+
+        return RecordsMerged._merge_records_core(
+            targets,
+            first_element,
+            lambda i: targets[i].to_records(),
+            to_end_records,
+            include_last_callback)
+
+    @staticmethod
+    def _merge_records_in_range(
+        targets: list[NodePath | Communication],
+        min_ns: int | None,
+        max_ns: int | None,
+        include_first_callback: bool = False,
+        include_last_callback: bool = False
+    ) -> RecordsInterface:
+        if len(targets) == 0:
+            raise InvalidArgumentError('There are no records to be merged.')
+
+        def to_records(target: NodePath | Communication) -> RecordsInterface:
+            records = target._records_in_range(min_ns, max_ns)
+            if records is None:
+                return target.to_records()
+            return records
 
-        column_merger = ColumnMerger()
         if include_first_callback and isinstance(targets[0], NodePath):
-            first_element = targets[0].to_path_beginning_records()
+            first_element = targets[0]._to_path_beginning_records_in_range(min_ns, max_ns)
         else:
-            if len(targets[0].to_records().data) == 0:
+            first_element = to_records(targets[0])
+            # Whether the first element is skipped must not depend on the range.
+            if len(first_element.data) == 0 and len(targets[0].to_records().data) == 0:
                 targets = targets[1:]
+                first_element = to_records(targets[0])
+
+        def to_end_records() -> RecordsInterface:
+            last_target = targets[-1]
+            assert isinstance(last_target, NodePath)
+            return last_target._to_path_end_records_in_range(min_ns, max_ns)
+
+        return RecordsMerged._merge_records_core(
+            targets,
+            first_element,
+            lambda i: to_records(targets[i]),
+            to_end_records,
+            include_last_callback)
+
+    @staticmethod
+    def _to_first_records(
+        targets: list[NodePath | Communication],
+        include_first_callback: bool = False,
+    ) -> tuple[list[NodePath | Communication], RecordsInterface]:
+        if include_first_callback and isinstance(targets[0], NodePath):
+            return targets, targets[0].to_path_beginning_records()
 
-            first_element = targets[0].to_records()
+        if len(targets[0].to_records().data) == 0:
+            targets = targets[1:]
 
+        return targets, targets[0].to_records()
+
+    @staticmethod
+    def _merge_records_core(
+        targets: list[NodePath | Communication],
+        first_element: RecordsInterface,
+        to_records: Callable[[int], RecordsInterface],
+        to_end_records: Callable[[], RecordsInterface],
+        include_last_callback: bool = False
+    ) -> RecordsInterface:
+        logger.info('Started merging path records.')
+
+        column_merger = ColumnMerger()
         left_records = first_element
 
         rename_rule = column_merger.append_columns_and_return_rename_rule(
@@ -138,8 +205,8 @@ class RecordsMerged:
         left_records.rename_columns(rename_rule)
         first_column = first_element.columns[0]
 
-        for target_, target in zip(targets[:-1], targets[1:]):
-            right_records: RecordsInterface = target.to_records()
+        for i, (target_, target) in enumerate(zip(targets[:-1], targets[1:]), 1):
+            right_records: RecordsInterface = to_records(i)
 
             is_dummy_records = len(right_records.columns) == 0
 
@@ -199,7 +266,7 @@ class RecordsMerged:
                 )
 
         if include_last_callback and isinstance(targets[-1], NodePath):
-            right_records = targets[-1].to_path_end_records()
+            right_records = to_end_records()
 
             rename_rule = column_merger.append_columns_and_return_rename_rule(right_records)
             right_records.rename_columns(rename_rule)
@@ -222,6 +289,117 @@ class RecordsMerged:
         return left_records
 
 
+class RecordsMergedWindows:
+    """
+    Merge path records window by window.
+
+    Each window only merges the rows of the path elements that fall within it,
+    so the size of the merged table is bounded by the window length
+    instead of the trace length.
+    Downstream elements are taken with an extra margin after the window
+    so that messages which started in the window can still reach the end of the path.
+    """
+
+    def __init__(
+        self,
+        merge_targets: list[NodePath | Communication],
+        include_first_callback: bool = False,
+        include_last_callback: bool = False,
+        margin_ns: int = 0,
+    ) -> None:
+        if len(merge_targets) == 0:
+            raise InvalidArgumentError('There are no records to be merged.')
+        if margin_ns < 0:
+            raise InvalidArgumentError('margin_ns must be non-negative.')
+
+        targets, first_element = RecordsMerged._to_first_records(
+            merge_targets, include_first_callback)
+        self._targets = targets
+        self._include_last_callback = include_last_callback
+        self._margin_ns = margin_ns
+        self._first_slicer = RecordsSlicer(first_element)
+        self._slicers: dict[int, RecordsSlicer] = {}
+        self._end_slicer: RecordsSlicer | None = None
+
+    @property
+    def time_range(self) -> tuple[int, int] | None:
+        """
+        Get the range of the path input timestamps.
+
+        Returns
+        -------
+        tuple[int, int] | None
+            Minimum and maximum timestamps of the first column.
+            None if there are no records.
+
+        """
+        return self._first_slicer.time_range
+
+    def iter_records(
+        self,
+        window_ns: int,
+        min_ns: int | None = None,
+        max_ns: int | None = None,
+    ) -> Iterator[RecordsInterface]:
+        """
+        Merge records for each window.
+
+        Parameters
+        ----------
+        window_ns : int
+            window length [ns].
+        min_ns : int | None
+            Lower bound of the path input timestamp. Unbounded if None.
+        max_ns : int | None
+            Upper bound of the path input timestamp. Unbounded if None.
+
+        Yields
+        ------
+        RecordsInterface
+            Merged records whose first column is within the window.
+            Windows without any input are skipped.
+
+        """
+        if window_ns <= 0:
+            raise InvalidArgumentError('window_ns must be positive.')
+
+        time_range = self.time_range
+        if time_range is None:
+            return
+
+        start_ns = time_range[0] if min_ns is None else max(min_ns, time_range[0])
+        end_ns = time_range[1] if max_ns is None else min(max_ns, time_range[1])
+
+        while start_ns <= end_ns:
+            window_end_ns = min(start_ns + window_ns - 1, end_ns)
+            if self._first_slicer.count(start_ns, window_end_ns) > 0:
+                yield self._merge_window(start_ns, window_end_ns)
+            start_ns += window_ns
+
+    def _merge_window(self, min_ns: int, max_ns: int) -> RecordsInterface:
+        first_element = self._first_slicer.slice(min_ns, max_ns)
+        margin_max_ns = max_ns + self._margin_ns
+
+        def to_records(i: int) -> RecordsInterface:
+            if i not in self._slicers:
+                self._slicers[i] = RecordsSlicer(self._targets[i].to_records())
+            return self._slicers[i].slice(min_ns, margin_max_ns)
+
+        def to_end_records() -> RecordsInterface:
+            if self._end_slicer is None:
+                last_target = self._targets[-1]
+                assert isinstance(last_target, NodePath)
+                self._end_slicer = RecordsSlicer(last_target.to_path_end_records())
+            return self._end_slicer.slice(min_ns, margin_max_ns)
+
+        return RecordsMerged._merge_records_core(
+            self._targets,
+            first_element,
+            to_records,
+            to_end_records,
+            self._include_last_callback)
+
+
 class Path(PathBase, Summarizable):
     """
     A class that represents a path.
@@ -304,6 +482,144 @@ class Path(PathBase, Summarizable):
         return RecordsMerged(self.child,
                              self._include_first_callback, self._include_last_callback).data
 
+    def _to_records_in_range(
+        self,
+        min_ns: int | None,
+        max_ns: int | None
+    ) -> RecordsInterface | None:
+        self._verify_path(self.node_paths)
+        return RecordsMerged._merge_records_in_range(
+            self.child, min_ns, max_ns,
+            self._include_first_callback, self._include_last_callback)
+
+    def _input_time_range(self) -> tuple[int, int] | None:
+        if len(self.child) == 0:
+            return None
+        _, first_records = RecordsMerged._to_first_records(
+            self.child, self._include_first_callback)
+        return RecordsSlicer(first_records).time_range
+
+    def iter_records(
+        self,
+        window_s: float,
+        max_latency_s: float = 1.0,
+        lstrip_s: float = 0,
+        rstrip_s: float = 0,
+        *,
+        shaper: Clip | Strip | None = None,
+    ) -> Iterator[RecordsInterface]:
+        """
+        Calculate records chunk by chunk.
+
+        The path is merged over consecutive time windows of the input timestamp,
+        so that the merged table never spans the whole trace.
+
+        Parameters
+        ----------
+        window_s : float
+            Window length of the input timestamp. [s]
+        max_latency_s : float
+            Maximum latency to be tracked. [s]
+            Messages taking longer than this to reach the end of the path
+            are treated as dropped at the window boundary.
+        lstrip_s : float
+            Remove from beginning. [s]
+        rstrip_s : float
+            Remove from end. [s]
+        shaper : Clip | Strip | None
+            Time range applied to the input timestamp before merging.
+
+        Yields
+        ------
+        RecordsInterface
+            Records whose input timestamps are within each window.
+
+        """
+        if window_s <= 0:
+            raise InvalidArgumentError('window_s must be positive.')
+        if max_latency_s < 0:
+            raise InvalidArgumentError('max_latency_s must be non-negative.')
+
+        merged = RecordsMergedWindows(
+            self.child,
+            self._include_first_callback,
+            self._include_last_callback,
+            margin_ns=round(max_latency_s * 1.0e9))
+
+        time_range = merged.time_range
+        if time_range is None:
+            return
+
+        min_ns, max_ns = time_range
+        if lstrip_s > 0 or rstrip_s > 0:
+            clip = Strip(lstrip_s, rstrip_s).to_clip_with_range(min_ns, max_ns)
+            min_ns, max_ns = clip.min_ns, clip.max_ns
+        if isinstance(shaper, Strip):
+            clip = shaper.to_clip_with_range(min_ns, max_ns)
+            min_ns, max_ns = clip.min_ns, clip.max_ns
+        elif isinstance(shaper, Clip):
+            min_ns, max_ns = max(min_ns, shaper.min_ns), min(max_ns, shaper.max_ns)
+
+        yield from merged.iter_records(round(window_s * 1.0e9), int(min_ns), int(max_ns))
+
+    def iter_dataframe(
+        self,
+        window_s: float,
+        max_latency_s: float = 1.0,
+        remove_dropped: bool = False,
+        treat_drop_as_delay: bool = False,
+        lstrip_s: float = 0,
+        rstrip_s: float = 0,
+        *,
+        shaper: DataFrameShaper | None = None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Calculate dataframe chunk by chunk.
+
+        Parameters
+        ----------
+        window_s : float
+            Window length of the input timestamp. [s]
+        max_latency_s : float
+            Maximum latency to be tracked. [s]
+        remove_dropped : bool
+            If true, eliminate the records that caused the drop.
+        treat_drop_as_delay : bool
+            Convert dropped records as a delay.
+            Valid only when remove_dropped=false.
+            Drops are bound within each chunk.
+        lstrip_s : float
+            Remove from beginning. [s]
+        rstrip_s : float
+            Remove from end. [s]
+        shaper : DataFrameShaper | None
+            shaper. Clip and Strip are applied before merging,
+            other shapers are applied to each chunk.
+
+        Yields
+        ------
+        pandas.DataFrame
+            Execution time of each operation within each window.
+
+        """
+        range_shaper = shaper if isinstance(shaper, (Clip, Strip)) else None
+        chunk_shaper = None if range_shaper is not None else shaper
+
+        for records in self.iter_records(
+            window_s, max_latency_s, lstrip_s, rstrip_s, shaper=range_shaper
+        ):
+            if remove_dropped is False and treat_drop_as_delay:
+                records.bind_drop_as_delay()
+
+            df = records.to_dataframe()
+            if chunk_shaper:
+                df = chunk_shaper.execute(df)
+
+            if remove_dropped:
+                df.dropna(inplace=True)
+
+            yield df
+
     @staticmethod
     def _verify_path(
         path_children: list[NodePath]
@@ -451,6 +767,11 @@ class Path(PathBase, Summarizable):
         self.__records_cache = {}
         return super().clear_cache()
 
+    @property
+    def _records_version(self) -> Hashable:
+        return (super()._records_version,
+                self._include_first_callback, self._include_last_callback)
+
     def __str__(self) -> str:
         node_names = [n.node_name for n in self.node_paths]
         return '\n'.join(node_names)
@@ -15,15 +15,17 @@
 from __future__ import annotations
 
 from abc import ABCMeta, abstractmethod
+from collections.abc import Hashable
 from copy import deepcopy
 from logging import getLogger
+import math
 
 import numpy as np
 import pandas as pd
 
 from ..exceptions import Error, InvalidRecordsError
 from ..record import RecordsFactory, RecordsInterface
-from ..record.data_frame_shaper import DataFrameShaper, Strip
+from ..record.data_frame_shaper import Clip, DataFrameShaper, Strip
 
 logger = getLogger(__name__)
 
@@ -33,6 +35,7 @@ class PathBase(metaclass=ABCMeta):
 
     def __init__(self) -> None:
         self.__records_cache: RecordsInterface | None = None
+        self.__records_generation = 0
 
     def to_records(self) -> RecordsInterface:
         """
@@ -58,8 +61,104 @@ class PathBase(metaclass=ABCMeta):
 
         """
 
+    def _to_records_in_range(
+        self,
+        min_ns: int | None,
+        max_ns: int | None
+    ) -> RecordsInterface | None:
+        """
+        Calculate records from the events within a time range.
+
+        Events out of the range are excluded before the records are merged,
+        so rows close to the range boundaries may differ from to_records().
+
+        Parameters
+        ----------
+        min_ns : int | None
+            lower bound of the range (inclusive). Unbounded if None.
+        max_ns : int | None
+            upper bound of the range (inclusive). Unbounded if None.
+
+        Returns
+        -------
+        RecordsInterface | None
+            Execution time of each operation.
+            None if the time range can not be pushed down.
+
+        """
+        return None
+
+    def _input_time_range(self) -> tuple[int, int] | None:
+        """
+        Get the first and the last timestamps of the first column of to_records().
+
+        Returns
+        -------
+        tuple[int, int] | None
+            The first and the last timestamps.
+            None if they can not be obtained without calculating all records.
+
+        """
+        return None
+
+    def __to_pushdown_range(
+        self,
+        lstrip_s: float,
+        rstrip_s: float,
+        shaper: DataFrameShaper | None,
+    ) -> tuple[Clip | None, int, int] | None:
+        if shaper is not None and not isinstance(shaper, Clip):
+            return None
+
+        strip_clip: Clip | None = None
+        clips: list[Clip] = []
+        if lstrip_s > 0 or rstrip_s > 0:
+            try:
+                time_range = self._input_time_range()
+            except Error as e:
+                logger.warning(e)
+                return None
+            if time_range is None:
+                return None
+            strip_clip = Strip(lstrip_s, rstrip_s).to_clip_with_range(*time_range)
+            clips.append(strip_clip)
+        if isinstance(shaper, Clip):
+            clips.append(shaper)
+
+        if len(clips) == 0:
+            return None
+        # Bounds are widened to whole nanoseconds, so no event in the clips is excluded.
+        min_ns = math.floor(max(clip.min_ns for clip in clips))
+        max_ns = math.ceil(min(clip.max_ns for clip in clips))
+        return strip_clip, min_ns, max_ns
+
+    def _records_in_range(
+        self,
+        min_ns: int | None,
+        max_ns: int | None
+    ) -> RecordsInterface | None:
+        try:
+            return self._to_records_in_range(min_ns, max_ns)
+        except Error as e:
+            logger.warning(e)
+            return RecordsFactory.create_instance()
+
     def clear_cache(self) -> None:
         self.__records_cache = None
+        self.__records_generation += 1
+
+    @property
+    def _records_version(self) -> Hashable:
+        """
+        Get a token which changes whenever to_records() may return different records.
+
+        Returns
+        -------
+        Hashable
+            token to be compared with the previous one.
+
+        """
+        return self.__records_generation
 
     @property
     def __records(self) -> RecordsInterface:
@@ -94,6 +193,7 @@ class PathBase(metaclass=ABCMeta):
         rstrip_s: float = 0,
         *,
         shaper: DataFrameShaper | None = None,
+        max_latency_s: float | None = None,
     ) -> pd.DataFrame:
         """
         Calculate dataframe.
@@ -111,6 +211,11 @@ class PathBase(metaclass=ABCMeta):
             Remove from end [s]
         shaper: DataFrameShaper | None
             shaper
+        max_latency_s: float | None
+            Upper bound of the latency [s].
+            When given, only the events within the range kept by strip and
+            a Clip shaper, extended by this value, are merged.
+            The result is the same as without it as long as no latency exceeds it.
 
         Returns
         -------
@@ -118,8 +223,29 @@ class PathBase(metaclass=ABCMeta):
             Execution time of each operation.
 
         """
-        records = self.to_records()
-        column_names = self.column_names
+        records: RecordsInterface | None = None
+        strip: DataFrameShaper | None = None
+        if lstrip_s > 0 or rstrip_s > 0:
+            strip = Strip(lstrip_s, rstrip_s)
+
+        if max_latency_s is not None:
+            pushdown = self.__to_pushdown_range(lstrip_s, rstrip_s, shaper)
+            if pushdown is not None:
+                strip_clip, min_ns, max_ns = pushdown
+                margin_ns = round(max_latency_s * 1.0e9)
+                records_max_ns: int | None = max_ns + margin_ns
+                if remove_dropped is False and treat_drop_as_delay:
+                    # Dropped values are filled with the following records.
+                    records_max_ns = None
+                records = self._records_in_range(min_ns - margin_ns, records_max_ns)
+                if records is not None:
+                    strip = strip_clip
+
+        if records is None:
+            records = self.to_records()
+            column_names = self.column_names
+        else:
+            column_names = deepcopy(records.columns)
 
         if remove_dropped is False and treat_drop_as_delay:
             records.bind_drop_as_delay()
@@ -132,8 +258,7 @@ class PathBase(metaclass=ABCMeta):
             df[column] = np.nan
         df = df[column_names]
 
-        if lstrip_s > 0 or rstrip_s > 0:
-            strip = Strip(lstrip_s, rstrip_s)
+        if strip:
             df = strip.execute(df)
         if shaper:
             df = shaper.execute(df)
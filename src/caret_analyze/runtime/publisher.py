@@ -156,3 +156,27 @@ class Publisher(PathBase, Summarizable):
         """
         records = self._provider.publish_records(self._val)
         return records
+
+    def _to_records_in_range(
+        self,
+        min_ns: int | None,
+        max_ns: int | None
+    ) -> RecordsInterface | None:
+        """
+        Calculate records from the events within a time range [override].
+
+        Parameters
+        ----------
+        min_ns : int | None
+            lower bound of the range (inclusive). Unbounded if None.
+        max_ns : int | None
+            upper bound of the range (inclusive). Unbounded if None.
+
+        Returns
+        -------
+        RecordsInterface | None
+            Publish records.
+
+        """
+        provider = self._provider.with_time_range(min_ns, max_ns)
+        return provider.publish_records(self._val)
@@ -14,6 +14,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+from functools import cached_property
 from logging import getLogger
 
 from .callback import CallbackBase, SubscriptionCallback, TimerCallback
@@ -49,9 +51,20 @@ class RuntimeLoaded():
     def __init__(
         self,
         architecture: Architecture,
-        provider: RecordsProvider | RuntimeDataProvider
+        provider: RecordsProvider | RuntimeDataProvider,
+        previous: RuntimeLoaded | None = None
     ) -> None:
-        nodes_loaded = NodesLoaded(architecture.nodes, provider)
+        # Runtime objects of the previous load whose values are unchanged are kept,
+        # so that edits to the architecture only rebuild the affected objects.
+        prev_nodes: Sequence[Node] = ()
+        prev_comms: Sequence[Communication] = ()
+        prev_paths: Sequence[Path] = ()
+        if previous is not None:
+            prev_nodes = previous.nodes
+            prev_comms = previous.communications
+            prev_paths = previous.paths
+
+        nodes_loaded = NodesLoaded(architecture.nodes, provider, prev_nodes)
         self._nodes = nodes_loaded.data
 
         execs_loaded = ExecutorsLoaded(
@@ -59,11 +72,11 @@ class RuntimeLoaded():
         self._executors = execs_loaded.data
 
         comms_loaded = CommunicationsLoaded(
-            architecture.communications, provider, nodes_loaded)
+            architecture.communications, provider, nodes_loaded, prev_comms)
         self._comms = comms_loaded.data
 
         paths_loaded = PathsLoaded(
-            architecture.paths, nodes_loaded, comms_loaded)
+            architecture.paths, nodes_loaded, comms_loaded, prev_paths)
         self._paths = paths_loaded.data
 
     @property
@@ -121,12 +134,21 @@ class NodesLoaded:
     def __init__(
         self,
         node_values: tuple[NodeStructValue, ...],
-        provider: RecordsProvider | RuntimeDataProvider
+        provider: RecordsProvider | RuntimeDataProvider,
+        previous: Sequence[Node] = ()
     ) -> None:
+        reused_nodes = {node.value: node for node in previous}
+        reused_node_paths = {
+            node_path.value: node_path for node in previous for node_path in node.paths}
+
         self._nodes: list[Node] = []
         for node_value in node_values:
+            if node_value in reused_nodes:
+                self._nodes.append(reused_nodes[node_value])
+                continue
             try:
-                self._nodes.append(self._to_runtime(node_value, provider))
+                self._nodes.append(
+                    self._to_runtime(node_value, provider, reused_node_paths))
             except Error as e:
                 logger.warning(e)
 
@@ -134,6 +156,7 @@ class NodesLoaded:
     def _to_runtime(
         node_value: NodeStructValue,
         provider: RecordsProvider | RuntimeDataProvider,
+        reused_node_paths: dict[NodePathStructValue, NodePath] | None = None
     ) -> Node:
         publishers_loaded = PublishersLoaded(
             node_value.publishers, provider)
@@ -161,7 +184,8 @@ class NodesLoaded:
         callbacks = Util.flatten([_.callbacks for _ in callback_groups])
         node_paths: list[NodePath]
         node_paths = NodePathsLoaded(
-            node_value.paths, provider, publishers_loaded, subscriptions_loaded, callbacks
+            node_value.paths, provider, publishers_loaded, subscriptions_loaded, callbacks,
+            reused_node_paths
         ).data
 
         variable_passings: list[VariablePassing] = []
@@ -176,9 +200,29 @@ class NodesLoaded:
             timers,
             node_paths,
             callback_groups,
-            variable_passings
+            variable_passings,
+            provider
         )
 
+    # Indices are built once on first use, so that each find_* is a dictionary lookup.
+    @cached_property
+    def _nodes_by_name(self) -> dict[str, list[Node]]:
+        return Util.group_items(lambda x: x.node_name, self._nodes)
+
+    @cached_property
+    def _callback_groups_by_name(self) -> dict[str, list[CallbackGroup]]:
+        return Util.group_items(lambda x: x.callback_group_name, self.callback_groups)
+
+    @cached_property
+    def _callbacks_by_name(self) -> dict[str, list[CallbackBase]]:
+        return Util.group_items(lambda x: x.callback_name, self.callbacks)
+
+    @cached_property
+    def _node_paths_by_topics(self) -> dict[tuple, list[NodePath]]:
+        return Util.group_items(
+            lambda x: (x.node_name, x.publish_topic_name, x.subscribe_topic_name),
+            Util.flatten([n.paths for n in self._nodes]))
+
     @property
     def callback_groups(self) -> list[CallbackGroup]:
         callback_groups: list[CallbackGroup] = []
@@ -204,13 +248,9 @@ class NodesLoaded:
         callback_group_name: str
     ) -> CallbackGroup:
         try:
-            callback_groups = self.callback_groups
-            if callback_groups is None:
-                raise ItemNotFoundError('')
-
             return Util.find_one(
                 lambda x: x.callback_group_name == callback_group_name,
-                callback_groups
+                self._callback_groups_by_name.get(callback_group_name)
             )
         except ItemNotFoundError:
             raise ItemNotFoundError(
@@ -221,13 +261,9 @@ class NodesLoaded:
         callback_name: str
     ) -> CallbackBase:
         try:
-            cbs = self.callbacks
-            if cbs is None:
-                raise ItemNotFoundError('')
-
             return Util.find_one(
                 lambda x: x.callback_name == callback_name,
-                cbs
+                self._callbacks_by_name.get(callback_name)
             )
         except ItemNotFoundError:
             raise ItemNotFoundError(
@@ -240,7 +276,7 @@ class NodesLoaded:
         try:
             return Util.find_one(
                 lambda x: x.node_name == node_name,
-                self._nodes
+                self._nodes_by_name.get(node_name)
             )
         except ItemNotFoundError:
             raise ItemNotFoundError(
@@ -258,7 +294,8 @@ class NodesLoaded:
             is_target = NodesLoaded.IsTarget(
                 node_name, publish_topic_name, subscribe_topic_name,
                 publisher_construction_order, subscription_construction_order)
-            node_paths = Util.flatten([n.paths for n in self._nodes])
+            node_paths = self._node_paths_by_topics.get(
+                (node_name, publish_topic_name, subscribe_topic_name))
             return Util.find_one(is_target, node_paths)
         except ItemNotFoundError:
             msg = 'Failed to find node path. '
@@ -571,9 +608,14 @@ class NodePathsLoaded:
         publisher_loaded: PublishersLoaded,
         subscription_loaded: SubscriptionsLoaded,
         callbacks: list[CallbackBase],
+        reused: dict[NodePathStructValue, NodePath] | None = None
     ) -> None:
         self._data = []
         for node_path_value in node_path_values:
+            if reused is not None and node_path_value in reused:
+                # Keep the record caches of node paths whose value is unchanged.
+                self._data.append(reused[node_path_value])
+                continue
             try:
                 self._data.append(self._to_runtime(
                     node_path_value, provider, publisher_loaded, subscription_loaded, callbacks))
@@ -656,9 +698,14 @@ class PathsLoaded:
         paths_info: tuple[PathStructValue, ...],
         nodes_loaded: NodesLoaded,
         comms_loaded: CommunicationsLoaded,
+        previous: Sequence[Path] = ()
     ) -> None:
+        reused = {path.value: path for path in previous}
         self._data = []
         for path_info in paths_info:
+            if path_info in reused:
+                self._data.append(reused[path_info])
+                continue
             try:
                 self._data.append(self._to_runtime(path_info, nodes_loaded, comms_loaded))
             except Error as e:
@@ -722,15 +769,26 @@ class CommunicationsLoaded:
         communication_values: tuple[CommunicationStructValue, ...],
         provider: RecordsProvider,
         nodes_loaded: NodesLoaded,
+        previous: Sequence[Communication] = ()
     ) -> None:
+        reused = {comm.value: comm for comm in previous}
         self._data: list[Communication] = []
         for comm_value in communication_values:
+            if comm_value in reused:
+                self._data.append(reused[comm_value])
+                continue
             try:
                 comm = self._to_runtime(comm_value, provider, nodes_loaded)
                 self._data.append(comm)
             except (ItemNotFoundError, MultipleItemFoundError):
                 pass
 
+        self._data_by_key = Util.group_items(
+            lambda x: (
+                x.topic_name, x.publish_node_name, x.subscribe_node_name,
+                x.publisher_construction_order, x.subscription_construction_order),
+            self._data)
+
     @property
     def data(self) -> list[Communication]:
         return self._data
@@ -785,7 +843,10 @@ class CommunicationsLoaded:
                 comm.subscription_construction_order == subscription_construction_order
 
         try:
-            return Util.find_one(is_target, self._data)
+            comms = self._data_by_key.get(
+                (topic_name, publish_node_name, subscribe_node_name,
+                 publisher_construction_order, subscription_construction_order))
+            return Util.find_one(is_target, comms)
         except ItemNotFoundError:
             msg = 'Failed to find communication. '
             msg += f'topic_name: {topic_name}. '
@@ -525,9 +525,19 @@ class ServiceCallbackValue(CallbackValue):
         return self.__service_name
 
 
-class CallbackStructValue(Summarizable, metaclass=ABCMeta):
+class CallbackStructValue(ValueObject, Summarizable, metaclass=ABCMeta):
     """Callback value base class."""
 
+    __slots__ = (
+        '_node_name',
+        '_callback_name',
+        '_symbol',
+        '_subscribe_topic_name',
+        '_service_name',
+        '_publish_topic_names',
+        '_construction_order',
+    )
+
     def __init__(
         self,
         node_name: str,
@@ -703,6 +713,8 @@ class CallbackStructValue(Summarizable, metaclass=ABCMeta):
 class TimerCallbackStructValue(CallbackStructValue, ValueObject):
     """Structured timer callback value."""
 
+    __slots__ = ('_period_ns',)
+
     def __init__(
         self,
         node_name: str,
@@ -788,6 +800,8 @@ class TimerCallbackStructValue(CallbackStructValue, ValueObject):
 class SubscriptionCallbackStructValue(CallbackStructValue, ValueObject):
     """Structured subscription callback value."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         node_name: str,
@@ -875,6 +889,8 @@ class SubscriptionCallbackStructValue(CallbackStructValue, ValueObject):
 class ServiceCallbackStructValue(CallbackStructValue, ValueObject):
     """Structured service callback value."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         node_name: str,
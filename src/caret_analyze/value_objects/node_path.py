@@ -142,6 +142,8 @@ class NodePathStructValue(ValueObject, Summarizable):
     In CARET, the node path is defined as from subscribe to publish.
     """
 
+    __slots__ = ('_node_name', '_child', '_subscription', '_publisher', '_context')
+
     def __init__(
         self,
         node_name: str,
@@ -137,6 +137,8 @@ class PublisherValue(ValueObject):
 class PublisherStructValue(ValueObject, Summarizable):
     """Structured publisher value."""
 
+    __slots__ = ('_node_name', '_topic_name', '_callbacks', '_construction_order')
+
     def __init__(
         self,
         node_name: str,
@@ -16,7 +16,10 @@ from __future__ import annotations
 
 import inspect
 
-from typing import Any
+from typing import Any, TypeVar
+from weakref import WeakValueDictionary
+
+ValueObjectT = TypeVar('ValueObjectT', bound='ValueObject')
 
 
 class ValueObject():
@@ -30,9 +33,16 @@ class ValueObject():
     ----
     Since the hash value is immutable, inherited classes can be used as a dictionary type key.
     It is also suitable for cache use and does not unintentionally change properties.
+    The hash value is calculated once and cached in the instance.
 
     """
 
+    __slots__ = ('_hash_cache', '__weakref__')
+    _hash_cache: int
+
+    _public_attrs_cache: dict[type, tuple[str, ...]] = {}
+    _interned: WeakValueDictionary[tuple[Any, ...], ValueObject] = WeakValueDictionary()
+
     def __eq__(self, right: Any) -> bool:
         """
         Check whether self object equals to given instance [override].
@@ -49,13 +59,23 @@ class ValueObject():
             returns True only if they all match. False otherwise.
 
         """
+        if self is right:
+            return True
+
         if type(self) != type(right):
             return False
 
-        for attr in self.__generate_public_attrs():
+        # Hash values are compared only when both are cached,
+        # because objects having unhashable properties can still be compared.
+        self_hash = getattr(self, '_hash_cache', None)
+        right_hash = getattr(right, '_hash_cache', None)
+        if self_hash is not None and right_hash is not None and self_hash != right_hash:
+            return False
+
+        for attr, value in self.__generate_public_attrs():
             # Uncomment this when investigating why equals is false during test execution.
-            # assert getattr(self,  attr) == getattr(right, attr)
-            if getattr(self,  attr) != getattr(right, attr):
+            # assert value == getattr(right, attr)
+            if value != getattr(right, attr):
                 return False
         return True
 
@@ -74,16 +94,57 @@ class ValueObject():
             https://www.baeldung.com/java-hashcode
 
         """
+        try:
+            return self._hash_cache
+        except AttributeError:
+            pass
+
         hash_value = 17
 
         hash_value += hash_value * 31 + hash(self.__class__)
-
-        for attr in self.__generate_public_attrs():
-            v = getattr(self,  attr)
+        for _, v in self.__generate_public_attrs():
             hash_value += hash_value * 31 + hash(v)
 
+        self._hash_cache = hash_value
         return hash_value
 
+    def __getstate__(self) -> tuple[dict[str, Any] | None, dict[str, Any]]:
+        # The cached hash depends on the process, so it is not serialized.
+        slots: dict[str, Any] = {}
+        for cls in self.__class__.__mro__:
+            for name in cls.__dict__.get('__slots__', ()):
+                if name in ('_hash_cache', '__weakref__') or name in slots:
+                    continue
+                if hasattr(self, name):
+                    slots[name] = getattr(self, name)
+        return getattr(self, '__dict__', None), slots
+
+    def intern(self: ValueObjectT) -> ValueObjectT:
+        """
+        Get the canonical instance which equals to this object.
+
+        Equal objects created from the same architecture share one instance,
+        which reduces memory usage and makes equality checks an identity check.
+        Canonical instances are held weakly and released when no longer referenced.
+
+        Returns
+        -------
+        ValueObjectT
+            The canonical instance. This object if no equal object is interned.
+
+        """
+        key = (self.__class__,) + tuple(self.__generate_public_attrs())
+        try:
+            canonical = ValueObject._interned.get(key)
+        except TypeError:
+            # Objects having unhashable properties can not be interned.
+            return self
+        if canonical is None:
+            ValueObject._interned[key] = self
+            return self
+        assert isinstance(canonical, self.__class__)
+        return canonical
+
     def __str__(self) -> str:
         """
         Convert to string.
@@ -109,8 +170,7 @@ class ValueObject():
 
         """
         d: dict[Any, Any] = {}
-        for attr in self.__generate_public_attrs():
-            value = getattr(self, attr)
+        for attr, value in self.__generate_public_attrs():
             if isinstance(value, ValueObject):
                 d[attr] = value._to_dict()
             else:
@@ -121,15 +181,31 @@ class ValueObject():
         return d
 
     def __generate_public_attrs(self):
-        attrs = inspect.getmembers(self)
-
-        # ignore private variables and Constant variables
-        attrs = list(filter(
-            lambda x: x[0][0] != '_' and x[0][0].islower(), attrs
-        ))
-        for attr in attrs:
-            key, value = attr[0], attr[1]
+        cls = self.__class__
+        attrs = ValueObject._public_attrs_cache.get(cls)
+        if attrs is None:
+            # ignore private variables, Constant variables and methods
+            attrs = tuple(
+                key for key, value in inspect.getmembers(cls)
+                if key[0] != '_' and key[0].islower() and
+                (isinstance(value, property) or not callable(value))
+            )
+            ValueObject._public_attrs_cache[cls] = attrs
+
+        instance_attrs = getattr(self, '__dict__', None)
+        if instance_attrs:
+            extra_attrs = tuple(
+                key for key in instance_attrs
+                if key[0] != '_' and key[0].islower() and key not in attrs)
+            if len(extra_attrs) > 0:
+                attrs = tuple(sorted(attrs + extra_attrs))
+
+        for key in attrs:
+            try:
+                value = getattr(self, key)
+            except AttributeError:
+                continue
             # ignore callable
             if callable(value):
                 continue
-            yield key
+            yield key, value
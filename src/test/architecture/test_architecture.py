@@ -207,6 +207,26 @@ class TestArchitecture:
         assert len(arch.paths) == 0
         assert len(arch.communications) == 0
 
+    def test_use_cache(self, mocker):
+        reader_mock = mocker.Mock(spec=ArchitectureReader)
+        create_mock = mocker.patch.object(ArchitectureReaderFactory,
+                                          'create_instance', return_value=reader_mock)
+
+        loaded_mock = mocker.Mock(spec=ArchitectureLoaded)
+        mocker.patch('caret_analyze.architecture.architecture_loaded.ArchitectureLoaded',
+                     return_value=loaded_mock)
+
+        mocker.patch.object(loaded_mock, 'nodes', [])
+        mocker.patch.object(loaded_mock, 'communications', [])
+        mocker.patch.object(loaded_mock, 'executors', [])
+        mocker.patch.object(loaded_mock, 'paths', [])
+
+        Architecture('yaml', 'file_path')
+        create_mock.assert_called_with('yaml', 'file_path', False)
+
+        Architecture('yaml', 'file_path', use_cache=True)
+        create_mock.assert_called_with('yaml', 'file_path', True)
+
     def test_get_node(self, mocker):
         reader_mock = mocker.Mock(spec=ArchitectureReader)
         mocker.patch.object(ArchitectureReaderFactory,
@@ -359,6 +379,111 @@ class TestArchitecture:
         path = arch.search_paths('start_node', 'end_node')
         assert path == [path_mock.to_value()]
 
+    def test_search_paths_reuse_searcher(self, mocker):
+        reader_mock = mocker.Mock(spec=ArchitectureReader)
+        loaded_mock = mocker.Mock(spec=ArchitectureLoaded)
+
+        start_node_mock = mocker.Mock(spec=NodeStruct)
+        end_node_mock = mocker.Mock(spec=NodeStruct)
+
+        mocker.patch.object(start_node_mock, 'node_name', 'start_node')
+        mocker.patch.object(end_node_mock, 'node_name', 'end_node')
+
+        mocker.patch.object(start_node_mock, 'callbacks', [])
+        mocker.patch.object(end_node_mock, 'callbacks', [])
+        mocker.patch.object(loaded_mock, 'nodes', [start_node_mock, end_node_mock])
+        mocker.patch.object(loaded_mock, 'paths', [])
+        mocker.patch.object(loaded_mock, 'communications', [])
+        mocker.patch.object(loaded_mock, 'executors', [])
+
+        mocker.patch('caret_analyze.architecture.architecture_loaded.ArchitectureLoaded',
+                     return_value=loaded_mock)
+        mocker.patch.object(ArchitectureReaderFactory,
+                            'create_instance', return_value=reader_mock)
+
+        searcher_mock = mocker.Mock(spec=NodePathSearcher)
+        searcher_cls_mock = mocker.patch(
+            'caret_analyze.architecture.graph_search.NodePathSearcher',
+            return_value=searcher_mock)
+        mocker.patch.object(searcher_mock, 'search', return_value=[])
+
+        arch = Architecture('file_type', 'file_path')
+
+        arch.search_paths('start_node', 'end_node')
+        arch.search_paths('end_node', 'start_node')
+        assert searcher_cls_mock.call_count == 1
+
+        def node_filter(node_name: str) -> bool:
+            return True
+
+        arch.search_paths('start_node', 'end_node', node_filter=node_filter)
+        arch.search_paths('start_node', 'end_node', node_filter=node_filter)
+        assert searcher_cls_mock.call_count == 2
+
+        mocker.patch.object(start_node_mock, 'rename_node')
+        mocker.patch.object(end_node_mock, 'rename_node')
+        arch.rename_node('end_node', 'end_node')
+        arch.search_paths('start_node', 'end_node')
+        assert searcher_cls_mock.call_count == 3
+
+    def test_iter_search_paths(self, mocker):
+        reader_mock = mocker.Mock(spec=ArchitectureReader)
+        loaded_mock = mocker.Mock(spec=ArchitectureLoaded)
+
+        start_node_mock = mocker.Mock(spec=NodeStruct)
+        end_node_mock = mocker.Mock(spec=NodeStruct)
+
+        mocker.patch.object(start_node_mock, 'node_name', 'start_node')
+        mocker.patch.object(end_node_mock, 'node_name', 'end_node')
+
+        mocker.patch.object(start_node_mock, 'callbacks', [])
+        mocker.patch.object(end_node_mock, 'callbacks', [])
+        mocker.patch.object(loaded_mock, 'nodes', [start_node_mock, end_node_mock])
+        mocker.patch.object(loaded_mock, 'paths', [])
+        mocker.patch.object(loaded_mock, 'communications', [])
+        mocker.patch.object(loaded_mock, 'executors', [])
+
+        mocker.patch('caret_analyze.architecture.architecture_loaded.ArchitectureLoaded',
+                     return_value=loaded_mock)
+        mocker.patch.object(ArchitectureReaderFactory,
+                            'create_instance', return_value=reader_mock)
+
+        searcher_mock = mocker.Mock(spec=NodePathSearcher)
+        mocker.patch('caret_analyze.architecture.graph_search.NodePathSearcher',
+                     return_value=searcher_mock)
+        path_values = [mocker.Mock(spec=PathStructValue) for _ in range(3)]
+        path_mocks = []
+        for path_value in path_values:
+            path_mock = mocker.Mock(spec=PathStruct)
+            mocker.patch.object(path_mock, 'to_value', return_value=path_value)
+            path_mocks.append(path_mock)
+        mocker.patch.object(searcher_mock, 'iter_search',
+                            side_effect=lambda *args, **kwargs: iter(path_mocks))
+        mocker.patch.object(searcher_mock, 'count', return_value=3)
+
+        arch = Architecture('file_type', 'file_path')
+
+        with pytest.raises(ItemNotFoundError):
+            arch.iter_search_paths('not_exist', 'end_node')
+        with pytest.raises(InvalidArgumentError):
+            arch.iter_search_paths('start_node', 'end_node', limit=-1)
+
+        paths = arch.iter_search_paths('start_node', 'end_node')
+        assert next(paths) == path_values[0]
+        assert path_mocks[1].to_value.call_count == 0
+
+        assert list(arch.iter_search_paths('start_node', 'end_node', limit=2)) == \
+            path_values[:2]
+        assert list(arch.iter_search_paths(
+            'start_node', 'end_node', predicate=lambda x: x is not path_values[1])) == \
+            [path_values[0], path_values[2]]
+
+        assert arch.iter_search_paths('start_node', 'end_node', count_only=True) == 3
+        assert searcher_mock.count.call_args.kwargs['limit'] is None
+        assert arch.iter_search_paths(
+            'start_node', 'end_node', count_only=True,
+            predicate=lambda x: x is path_values[2]) == 1
+
     def test_search_paths_three_nodes(self, mocker):
         reader_mock = mocker.Mock(spec=ArchitectureReader)
         loaded_mock = mocker.Mock(spec=ArchitectureLoaded)
@@ -510,6 +635,73 @@ class TestArchitecture:
         assert len(caplog.record_tuples) == 1
 
 
+class TestArchitectureSearchPathsMany:
+    architecture_text = """
+named_paths: []
+executors: []
+nodes:
+- node_name: /ping_node
+  callback_groups: []
+  callbacks:
+    - callback_name: timer_callback_0
+      callback_type: timer_callback
+      period_ns: 1
+      symbol: timer_symbol
+    - callback_name: subscription_callback_0
+      callback_type: subscription_callback
+      topic_name: /pong
+      symbol: sub_symbol
+  subscribes:
+    - topic_name: /pong
+      callback_name: subscription_callback_0
+  publishes:
+    - topic_name: /ping
+      callback_names:
+        - timer_callback_0
+- node_name: /pong_node
+  callback_groups: []
+  callbacks:
+    - callback_name: subscription_callback_1
+      callback_type: subscription_callback
+      topic_name: /ping
+      symbol: sub_symbol
+  subscribes:
+    - topic_name: /ping
+      callback_name: subscription_callback_1
+  publishes:
+    - topic_name: /pong
+      callback_names:
+        - subscription_callback_1
+"""
+
+    @pytest.mark.parametrize('max_workers', [1, 2])
+    def test_search_paths_many(self, mocker, max_workers):
+        mocker.patch('builtins.open', mocker.mock_open(read_data=self.architecture_text))
+        arch = Architecture('yaml', 'architecture.yaml')
+
+        queries = [
+            ('/ping_node', '/pong_node'),
+            ['/pong_node', '/ping_node'],
+            ('/ping_node', '/pong_node'),
+        ]
+        results = arch.search_paths_many(queries, max_workers=max_workers)
+
+        assert list(results.keys()) == [
+            ('/ping_node', '/pong_node'), ('/pong_node', '/ping_node')]
+        for key, paths in results.items():
+            assert len(paths) == 1
+            assert paths == arch.search_paths(*key)
+
+    def test_search_paths_many_invalid_query(self, mocker):
+        mocker.patch('builtins.open', mocker.mock_open(read_data=self.architecture_text))
+        arch = Architecture('yaml', 'architecture.yaml')
+
+        with pytest.raises(InvalidArgumentError):
+            arch.search_paths_many([('/ping_node',)])
+        with pytest.raises(ItemNotFoundError):
+            arch.search_paths_many([('/ping_node', '/not_exist')])
+
+
 class TestArchitectureInsertAndUpdate:
     template_architecture = Template("""
 named_paths: []
@@ -731,7 +731,7 @@ class TestNodePathLoaded:
         searcher_mock = mocker.Mock(spec=CallbackPathSearcher)
         mocker.patch('caret_analyze.architecture.graph_search.CallbackPathSearcher',
                      return_value=searcher_mock)
-        mocker.patch.object(searcher_mock, 'search', return_value=[])
+        mocker.patch.object(searcher_mock, 'search_from', return_value=[])
         node_mock = mocker.Mock(spec=NodeStruct)
         mocker.patch.object(node_mock, 'callbacks', [])
         searched = CallbackPathSearched(node_mock,
@@ -747,8 +747,8 @@ class TestNodePathLoaded:
         callback_mock.construction_order = \
             DEFAULT_MAX_CALLBACK_CONSTRUCTION_ORDER_ON_PATH_SEARCHING - 1
         node_path_mock = mocker.Mock(NodePathStruct)
-        mocker.patch.object(searcher_mock, 'search',
-                            return_value=[node_path_mock])
+        mocker.patch.object(searcher_mock, 'search_from',
+                            side_effect=lambda _, ends, __: [[node_path_mock] for _ in ends])
         mocker.patch.object(node_path_mock, 'publish_topic_name', 'pub')
         mocker.patch.object(node_path_mock, 'subscribe_topic_name', 'sub')
 
@@ -0,0 +1,102 @@
+# Copyright 2021 TIER IV, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import pickle
+
+from caret_analyze.architecture import Architecture
+from caret_analyze.architecture.architecture_snapshot import ArchitectureSnapshot
+from caret_analyze.exceptions import InvalidArgumentError
+
+import pytest
+
+
+architecture_text = """
+named_paths: []
+executors: []
+nodes:
+- node_name: /ping_node
+  callback_groups: []
+  callbacks:
+    - callback_name: timer_callback_0
+      callback_type: timer_callback
+      period_ns: 1
+      symbol: timer_symbol
+  publishes:
+    - topic_name: /ping
+      callback_names:
+        - timer_callback_0
+- node_name: /pong_node
+  callback_groups: []
+  callbacks:
+    - callback_name: subscription_callback_0
+      callback_type: subscription_callback
+      topic_name: /ping
+      symbol: sub_symbol
+  subscribes:
+    - topic_name: /ping
+      callback_name: subscription_callback_0
+"""
+
+
+class TestArchitectureSnapshot:
+
+    def test_export_and_load(self, mocker, tmp_path):
+        yaml_path = tmp_path / 'architecture.yaml'
+        yaml_path.write_text(architecture_text)
+        snapshot_path = str(tmp_path / 'architecture.snapshot')
+
+        arch = Architecture('yaml', str(yaml_path))
+        arch.add_path('target', arch.search_paths('/ping_node', '/pong_node')[0])
+        arch.export_snapshot(snapshot_path)
+
+        with pytest.raises(FileExistsError):
+            arch.export_snapshot(snapshot_path)
+        arch.export_snapshot(snapshot_path, force=True)
+
+        loaded_mock = mocker.patch(
+            'caret_analyze.architecture.architecture_loaded.ArchitectureLoaded')
+        arch_loaded = Architecture('snapshot', snapshot_path)
+        loaded_mock.assert_not_called()
+
+        assert arch_loaded.nodes == arch.nodes
+        assert arch_loaded.communications == arch.communications
+        assert arch_loaded.executors == arch.executors
+        assert arch_loaded.paths == arch.paths
+        assert arch_loaded.get_node('/ping_node').paths == arch.get_node('/ping_node').paths
+
+        # Structs shared between nodes and communications stay shared.
+        comm = arch_loaded._communications[0]
+        node = [n for n in arch_loaded._nodes if n.node_name == '/ping_node'][0]
+        assert comm.publisher is node.publishers[0]
+
+    def test_invalid_file(self, tmp_path):
+        not_snapshot = tmp_path / 'not_snapshot'
+        not_snapshot.write_bytes(pickle.dumps({'nodes': []}))
+        with pytest.raises(InvalidArgumentError):
+            ArchitectureSnapshot.load(str(not_snapshot))
+
+        broken = tmp_path / 'broken'
+        broken.write_bytes(b'')
+        with pytest.raises(InvalidArgumentError):
+            ArchitectureSnapshot.load(str(broken))
+
+        old_version = tmp_path / 'old_version'
+        old_version.write_bytes(pickle.dumps({
+            'format': ArchitectureSnapshot.FORMAT,
+            'schema_version': ArchitectureSnapshot.SCHEMA_VERSION - 1,
+        }))
+        with pytest.raises(InvalidArgumentError):
+            ArchitectureSnapshot.load(str(old_version))
@@ -24,7 +24,7 @@ from caret_analyze.architecture.struct import (CallbackStruct,
                                                PathStruct,
                                                PublisherStruct, SubscriptionStruct,
                                                VariablePassingStruct)
-from caret_analyze.exceptions import ItemNotFoundError
+from caret_analyze.exceptions import InvalidArgumentError, ItemNotFoundError
 from caret_analyze.value_objects import (CommunicationStructValue,
                                          NodePathStructValue)
 
@@ -187,6 +187,81 @@ class TestGraphCore:
             ] in r
         assert [GraphEdgeCore(0, 1), GraphEdgeCore(1, 3)] in r
 
+    def test_search_max_depth(self):
+        g = GraphCore()
+
+        g.add_edge(0, 1)
+        g.add_edge(1, 2)
+        g.add_edge(2, 3)
+        g.add_edge(0, 3)
+
+        assert g.search_paths(0, 3, 1) == [[GraphEdgeCore(0, 3)]]
+        assert len(g.search_paths(0, 3, 2)) == 2
+        assert len(g.search_paths(0, 3)) == 2
+
+    def test_search_unreachable(self):
+        g = GraphCore()
+
+        g.add_edge(0, 1)
+        g.add_edge(2, 1)
+
+        assert g.search_paths(0, 2) == []
+        assert g.search_paths(0, 5) == []
+        assert g.search_paths(5, 0) == []
+
+    def test_search_after_add_edge(self):
+        g = GraphCore()
+
+        g.add_edge(0, 1)
+        assert g.search_paths(0, 2) == []
+
+        g.add_edge(1, 2)
+        assert g.search_paths(0, 2) == [[GraphEdgeCore(0, 1), GraphEdgeCore(1, 2)]]
+
+    def test_distance(self):
+        g = GraphCore()
+
+        g.add_edge(0, 1)
+        g.add_edge(1, 2)
+        g.add_edge(0, 2)
+        g.add_edge(3, 0)
+        g.add_edge(4, 3)
+
+        assert g.distance(0, 2) == 1
+        assert g.distance(3, 2) == 2
+        assert g.distance(4, 2) == 3
+        assert g.distance(2, 0) is None
+        assert g.distance(0, 5) is None
+
+        assert g.search_paths(4, 2, 1) == []
+        assert len(g.search_paths(4, 2, 2)) == 1
+        assert len(g.search_paths(4, 2)) == 2
+        assert g.search_paths(2, 0) == []
+
+    def test_iter_search_paths(self):
+        g = GraphCore()
+
+        g.add_edge(0, 1)
+        g.add_edge(0, 2)
+        g.add_edge(1, 3)
+        g.add_edge(2, 3)
+
+        it = g.iter_search_paths(0, 3)
+        assert next(it) == [GraphEdgeCore(0, 2), GraphEdgeCore(2, 3)]
+        assert next(it) == [GraphEdgeCore(0, 1), GraphEdgeCore(1, 3)]
+        with pytest.raises(StopIteration):
+            next(it)
+
+    def test_search_long_chain(self):
+        num = 5000
+        g = GraphCore()
+        for i in range(num-1):
+            g.add_edge(i, i+1)
+
+        r = g.search_paths(0, num-1)
+        assert len(r) == 1
+        assert len(r[0]) == num - 1
+
     # def test_measure_performance(self):
     #     num = 5000
     #     g = GraphCore()
@@ -352,6 +427,53 @@ class TestGraph:
         assert [
             GraphEdge(node_0, node_1), GraphEdge(node_1, node_3)] in r
 
+    def test_iter_search_paths_and_count(self):
+        g = Graph()
+        node_0 = GraphNode('0')
+        node_1 = GraphNode('1')
+        node_2 = GraphNode('2')
+        node_3 = GraphNode('3')
+
+        g.add_edge(node_0, node_1, 'a')
+        g.add_edge(node_0, node_1, 'b')
+        g.add_edge(node_1, node_2)
+        g.add_edge(node_1, node_3)
+        g.add_edge(node_3, node_2)
+
+        paths = g.search_paths(node_0, node_1, node_2)
+        assert len(paths) == 4
+        assert list(g.iter_search_paths(node_0, node_1, node_2)) == paths
+
+        assert g.count_paths(node_0, node_1, node_2) == 4
+        assert g.count_paths(node_0, node_1, node_2, limit=3) == 3
+        assert g.count_paths(node_2, node_0) == 0
+
+        with pytest.raises(ItemNotFoundError):
+            g.iter_search_paths(node_0, GraphNode('not_exist'))
+        with pytest.raises(InvalidArgumentError):
+            g.count_paths(node_0)
+
+    def test_search_paths_from(self):
+        g = Graph()
+        nodes = [GraphNode(str(i)) for i in range(5)]
+
+        g.add_edge(nodes[0], nodes[1])
+        g.add_edge(nodes[0], nodes[2])
+        g.add_edge(nodes[1], nodes[3])
+        g.add_edge(nodes[3], nodes[4])
+        g.add_edge(nodes[3], nodes[2])
+        g.add_edge(nodes[2], nodes[1])
+        g.add_edge(nodes[2], nodes[4])
+        g.add_edge(nodes[4], nodes[0])
+
+        r = g.search_paths_from(nodes[0], nodes)
+        assert list(r.keys()) == nodes
+        for goal in nodes:
+            assert r[goal] == g.search_paths(nodes[0], goal)
+
+        with pytest.raises(ItemNotFoundError):
+            g.search_paths_from(nodes[0], [GraphNode('not_exist')])
+
 
 class TestCallbackPathSearcher:
 
@@ -33,6 +33,13 @@ class TestClockConverter:
         assert converter.convert(0) == 1
         assert converter.convert(1) == 2
 
+    def test_convert_many(self):
+        converter = ClockConverter(1.5, 3)
+        times = [0, 1, 1700000000123456789]
+        assert converter.convert_many(times).tolist() == \
+            [converter.convert(time) for time in times]
+        assert converter.convert_many([]).tolist() == []
+
     def test_create_from_series(self):
         converter = ClockConverter.create_from_series([0, 1], [1, 1])
         e = 1.0e-10
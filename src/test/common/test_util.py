@@ -23,6 +23,10 @@ import pytest
 
 class TestUtil:
 
+    def test_group_items(self):
+        assert Util.group_items(lambda x: x, None) == {}
+        assert Util.group_items(lambda x: x % 2, [1, 2, 3, 4]) == {1: [1, 3], 0: [2, 4]}
+
     def test_find_similar_one(self, mocker):
         app_mock = mocker.Mock(spec=Application)
         node = mocker.Mock(spec=Node)
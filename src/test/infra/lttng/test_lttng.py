@@ -14,10 +14,13 @@
 
 
 from datetime import datetime
+import os
+import pickle
 
 from caret_analyze.infra.lttng import Lttng
 from caret_analyze.infra.lttng.event_counter import EventCounter
-from caret_analyze.infra.lttng.lttng import EventCollection, IterableEvents
+from caret_analyze.infra.lttng.lttng import (EventCollection, InitEventCollection,
+                                             IterableEvents)
 from caret_analyze.infra.lttng.lttng_info import LttngInfo
 from caret_analyze.infra.lttng.records_source import RecordsSource
 from caret_analyze.infra.lttng.ros2_tracing.data_model import Ros2DataModel
@@ -2561,3 +2564,77 @@ class TestEventCollection:
 
         EventCollection('', False, store_cache=False)
         assert 'Converted to' in caplog.messages[0]
+
+
+class TestInitEventCollection:
+
+    @staticmethod
+    def _converted(signature, events):
+        return {
+            'version': InitEventCollection.CACHE_VERSION,
+            'signature': signature,
+            'begin': 0,
+            'end': 1,
+            'events': events,
+        }
+
+    def test_convert_and_reuse_cache(self, mocker, tmp_path):
+        (tmp_path / 'metadata').write_bytes(b'trace')
+        events = [{'_name': 'ros2:rcl_node_init'}]
+        convert_mock = mocker.patch.object(
+            InitEventCollection, '_convert',
+            side_effect=lambda _, signature: self._converted(signature, events))
+
+        collection = InitEventCollection(str(tmp_path))
+        assert collection.events == events
+        assert collection.time_range() == (0, 1)
+        assert (tmp_path / 'caret_converted_init').exists()
+        assert convert_mock.call_count == 1
+
+        collection = InitEventCollection(str(tmp_path))
+        assert collection.events == events
+        assert convert_mock.call_count == 1
+
+        InitEventCollection(str(tmp_path), force_conversion=True)
+        assert convert_mock.call_count == 2
+
+    def test_cache_invalidated_by_trace_change(self, mocker, tmp_path):
+        (tmp_path / 'metadata').write_bytes(b'trace')
+        convert_mock = mocker.patch.object(
+            InitEventCollection, '_convert',
+            side_effect=lambda _, signature: self._converted(signature, []))
+
+        InitEventCollection(str(tmp_path))
+        (tmp_path / 'metadata').write_bytes(b'updated trace')
+        InitEventCollection(str(tmp_path))
+        assert convert_mock.call_count == 2
+
+    def test_reuse_full_cache(self, mocker, tmp_path):
+        (tmp_path / 'metadata').write_bytes(b'trace')
+        full_events = [
+            {'_name': 'ros2:rcl_init', '_timestamp': 0},
+            {'_name': 'ros2:callback_start', '_timestamp': 1},
+            {'_name': 'ros2:rcl_node_init', '_timestamp': 2},
+        ]
+        with open(tmp_path / 'caret_converted', mode='wb') as f:
+            pickle.dump(full_events, f)
+        convert_mock = mocker.patch.object(
+            InitEventCollection, '_convert',
+            side_effect=lambda _, signature: self._converted(signature, []))
+
+        collection = InitEventCollection(str(tmp_path))
+        assert collection.events == [full_events[0], full_events[2]]
+        assert collection.time_range() == (0, 2)
+        assert (tmp_path / 'caret_converted_init').exists()
+        assert convert_mock.call_count == 0
+
+        # The full cache older than the trace files is not used.
+        (tmp_path / 'caret_converted_init').unlink()
+        mtime_ns = (tmp_path / 'metadata').stat().st_mtime_ns
+        os.utime(tmp_path / 'caret_converted', ns=(mtime_ns - 1, mtime_ns - 1))
+        InitEventCollection(str(tmp_path))
+        assert convert_mock.call_count == 1
+
+    def test_file_not_found_error(self):
+        with pytest.raises(FileNotFoundError):
+            InitEventCollection('/not/exist/trace_dir')
@@ -217,16 +217,130 @@ class TestRecordsProviderLttng:
 
     def test_is_intra_process_communication(self, mocker):
         lttng_mock = mocker.Mock(spec=Lttng)
+
+        helper_mock = mocker.Mock(spec=RecordsProviderLttngHelper)
+        mocker.patch(
+            'caret_analyze.infra.lttng.records_provider_lttng.RecordsProviderLttngHelper',
+            return_value=helper_mock)
+        mocker.patch.object(helper_mock, 'get_subscription_callback_object_intra',
+                            return_value=5)
+        mocker.patch.object(helper_mock, 'get_publisher_handles', return_value=[6])
+
+        source_mock = mocker.Mock(spec=FilteredRecordsSource)
+        mocker.patch(
+            'caret_analyze.infra.lttng.records_provider_lttng.FilteredRecordsSource',
+            return_value=source_mock)
+
         provider = RecordsProviderLttng(lttng_mock)
-        comm_info_mock = mocker.Mock(spec=Lttng)
+        comm_info_mock = mocker.Mock(spec=CommunicationStructValue)
+        sub_cb_mock = mocker.Mock(spec=SubscriptionCallbackStructValue)
+        mocker.patch.object(comm_info_mock, 'subscribe_callback', sub_cb_mock)
 
-        records = Records()
-        mocker.patch.object(
-            provider, '_compose_intra_proc_comm_records', return_value=records)
+        mocker.patch.object(source_mock, 'has_intra_comm_records', return_value=False)
         assert provider.is_intra_process_communication(comm_info_mock) is False
-        records.concat(Records([Record()]))
 
+        mocker.patch.object(source_mock, 'has_intra_comm_records', return_value=True)
         assert provider.is_intra_process_communication(comm_info_mock) is True
+        source_mock.has_intra_comm_records.assert_called_with([6], 5)
+
+    def test_with_time_range(self, mocker):
+        records_mock = mocker.Mock(spec=RecordsInterface)
+
+        def _rename_column(records, callback_name, topic_name, node_name):
+            return records
+        mocker.patch.object(
+            RecordsProviderLttng, '_rename_column', side_effect=_rename_column)
+
+        def _format(records, columns):
+            return records
+        mocker.patch.object(
+            RecordsProviderLttng, '_format', side_effect=_format)
+
+        lttng_mock = mocker.Mock(spec=Lttng)
+
+        helper_mock = mocker.Mock(spec=RecordsProviderLttngHelper)
+        mocker.patch('caret_analyze.infra.lttng.records_provider_lttng.RecordsProviderLttngHelper',
+                     return_value=helper_mock)
+        source_mock = mocker.Mock(spec=FilteredRecordsSource)
+        mocker.patch('caret_analyze.infra.lttng.records_provider_lttng.FilteredRecordsSource',
+                     return_value=source_mock)
+        mocker.patch.object(helper_mock, 'get_callback_objects', return_value=(1, None))
+        mocker.patch.object(source_mock, 'callback_records', return_value=records_mock)
+
+        provider = RecordsProviderLttng(lttng_mock)
+        provider_ranged = provider.with_time_range(10, None)
+        assert provider_ranged is not provider
+
+        callback_mock = mocker.Mock(spec=CallbackStructValue)
+        provider_ranged.callback_records(callback_mock)
+        source_mock.callback_records.assert_called_with(1, None, time_range=(10, None))
+
+        provider.callback_records(callback_mock)
+        source_mock.callback_records.assert_called_with(1, None, time_range=None)
+
+    def test_callback_latency_summary(self, mocker):
+        lttng_mock = mocker.Mock(spec=Lttng)
+        records = Records(
+            [
+                Record({'callback_start_timestamp': 0, 'callback_end_timestamp': 2,
+                        'callback_object': 5}),
+                Record({'callback_start_timestamp': 1, 'callback_end_timestamp': 2,
+                        'callback_object': 7}),
+                Record({'callback_start_timestamp': 10, 'callback_end_timestamp': 14,
+                        'callback_object': 5}),
+                Record({'callback_start_timestamp': 30, 'callback_end_timestamp': 36,
+                        'callback_object': 5}),
+                Record({'callback_start_timestamp': 40, 'callback_end_timestamp': 41,
+                        'callback_object': 8}),
+            ],
+            [
+                ColumnValue('callback_start_timestamp'),
+                ColumnValue('callback_end_timestamp'),
+                ColumnValue('callback_object'),
+            ]
+        )
+        mocker.patch.object(lttng_mock, 'compose_callback_records', return_value=records)
+
+        helper_mock = mocker.Mock(spec=RecordsProviderLttngHelper)
+        mocker.patch('caret_analyze.infra.lttng.records_provider_lttng.RecordsProviderLttngHelper',
+                     return_value=helper_mock)
+
+        timer_cb = mocker.Mock(spec=TimerCallbackStructValue)
+        mocker.patch.object(timer_cb, 'period_ns', 10)
+        mocker.patch.object(timer_cb, 'callback_name', 'timer_cb')
+        mocker.patch.object(timer_cb, 'node_name', 'node')
+        sub_cb = mocker.Mock(spec=SubscriptionCallbackStructValue)
+        mocker.patch.object(sub_cb, 'callback_name', 'sub_cb')
+        mocker.patch.object(sub_cb, 'node_name', 'node')
+        idle_cb = mocker.Mock(spec=SubscriptionCallbackStructValue)
+        mocker.patch.object(idle_cb, 'callback_name', 'idle_cb')
+        mocker.patch.object(idle_cb, 'node_name', 'node')
+        callback_objects = {timer_cb: (5, None), sub_cb: (7, 8), idle_cb: (9, None)}
+        mocker.patch.object(helper_mock, 'get_callback_objects',
+                            side_effect=lambda cb: callback_objects[cb])
+
+        provider = RecordsProviderLttng(lttng_mock)
+        summary = provider.callback_latency_summary([timer_cb, sub_cb, idle_cb], [50])
+
+        assert list(summary.columns) == [
+            'node_name', 'callback_name', 'count', 'mean [ns]', 'p50 [ns]', 'max [ns]',
+            'drop_rate'
+        ]
+        assert list(summary['callback_name']) == ['timer_cb', 'sub_cb', 'idle_cb']
+        assert list(summary['count']) == [3, 2, 0]
+        assert list(summary['mean [ns]'][:2]) == [4.0, 1.0]
+        assert list(summary['p50 [ns]'][:2]) == [4.0, 1.0]
+        assert list(summary['max [ns]'][:2]) == [6.0, 1.0]
+        assert summary['drop_rate'][0] == 0.25
+        assert summary['drop_rate'][1:].isna().all()
+        assert summary['mean [ns]'][2:].isna().all()
+
+        summary = provider.with_time_range(5, None).callback_latency_summary([timer_cb])
+        assert list(summary['count']) == [2]
+        assert list(summary.columns) == [
+            'node_name', 'callback_name', 'count', 'mean [ns]',
+            'p50 [ns]', 'p90 [ns]', 'p99 [ns]', 'max [ns]', 'drop_rate'
+        ]
 
     def test_path_beginning_records(self, mocker):
 
@@ -297,6 +411,61 @@ class TestRecordsProviderLttng:
         assert records == records_mock
 
 
+class TestFilteredRecordsSource:
+
+    def test_callback_records_time_range(self, mocker):
+        lttng_mock = mocker.Mock(spec=Lttng)
+        records = Records(
+            [
+                Record({'callback_start_timestamp': 1, 'callback_end_timestamp': 2,
+                        'callback_object': 5}),
+                Record({'callback_start_timestamp': 3, 'callback_end_timestamp': 4,
+                        'callback_object': 6}),
+                Record({'callback_start_timestamp': 5, 'callback_end_timestamp': 6,
+                        'callback_object': 5}),
+                Record({'callback_start_timestamp': 7, 'callback_end_timestamp': 8,
+                        'callback_object': 5}),
+            ],
+            [
+                ColumnValue('callback_start_timestamp'),
+                ColumnValue('callback_end_timestamp'),
+                ColumnValue('callback_object'),
+            ]
+        )
+        mocker.patch.object(lttng_mock, 'compose_callback_records', return_value=records)
+        source = FilteredRecordsSource(lttng_mock)
+
+        all_records = source.callback_records(5, None)
+        assert all_records.get_column_series('callback_start_timestamp') == [1, 5, 7]
+
+        ranged = source.callback_records(5, None, time_range=(2, 5))
+        assert ranged.get_column_series('callback_start_timestamp') == [5]
+
+        ranged = source.callback_records(5, None, time_range=(None, 5))
+        assert ranged.get_column_series('callback_start_timestamp') == [1, 5]
+
+    def test_has_intra_comm_records(self, mocker):
+        lttng_mock = mocker.Mock(spec=Lttng)
+        records = Records(
+            [
+                Record({'callback_object': 5, 'publisher_handle': 6,
+                        'rclcpp_intra_publish_timestamp': 1, 'callback_start_timestamp': 2}),
+            ],
+            [
+                ColumnValue('callback_object'),
+                ColumnValue('publisher_handle'),
+                ColumnValue('rclcpp_intra_publish_timestamp'),
+                ColumnValue('callback_start_timestamp'),
+            ]
+        )
+        mocker.patch.object(lttng_mock, 'compose_intra_proc_comm_records', return_value=records)
+        source = FilteredRecordsSource(lttng_mock)
+
+        assert source.has_intra_comm_records([6], 5) is True
+        assert source.has_intra_comm_records([7, 8], 5) is False
+        assert source.has_intra_comm_records([6], None) is False
+
+
 class TestRecordsProviderLttngHelper:
 
     def test_get_callback_objects_timer_callback(self, mocker):
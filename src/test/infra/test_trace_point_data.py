@@ -0,0 +1,50 @@
+# Copyright 2021 TIER IV, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from caret_analyze.infra.trace_point_data import TracePointData
+
+import pandas as pd
+
+
+class TestTracePointData:
+
+    def test_derive_column(self):
+        data = TracePointData(pd.DataFrame({'a': [1, 2], 'b': [10, 20]}, index=[5, 3]))
+        data.derive_column('c', lambda df: df['a'] + df['b'])
+        assert data.df['c'].to_list() == [11, 22]
+
+        data.derive_column('d', lambda df: [str(a) for a in df['a'].to_list()])
+        assert data.df['d'].to_list() == ['1', '2']
+
+    def test_add_id_column(self):
+        data = TracePointData(pd.DataFrame({'addr': [1, None]}, dtype='Int64'))
+        data.add_id_column('id', 'addr', 'executor_')
+        assert data.df['id'].to_list() == ['executor_1', 'executor_<NA>']
+
+    def test_add_order_column(self):
+        df = pd.DataFrame({
+            'timestamp': [3, 1, 2, 4, 5],
+            'node': [1, 1, 2, 1, None],
+            'topic': ['/a', '/a', '/a', '/b', '/a'],
+        })
+        data = TracePointData(df)
+        data.sort('timestamp')
+        data.add_order_column('order', ['node', 'topic'])
+        assert data.df['timestamp'].to_list() == [1, 2, 3, 4, 5]
+        assert data.df['order'].to_list() == [0, 0, 1, 0, 0]
+
+        empty = TracePointData(pd.DataFrame({'node': [], 'topic': []}))
+        empty.add_order_column('order', ['node', 'topic'])
+        assert 'order' in empty.columns
+        assert len(empty) == 0
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+
 from caret_analyze.exceptions import InvalidYamlFormatError
 from caret_analyze.infra.yaml.architecture_reader_yaml import \
     ArchitectureReaderYaml
@@ -23,6 +25,8 @@ from caret_analyze.value_objects.node import NodeValue
 
 import pytest
 
+import yaml
+
 
 class TestArchitectureReaderYaml:
 
@@ -443,3 +447,48 @@ nodes:
         assert var_pass_info.callback_id_read == '/listener/timer_callback_1'
 
         assert reader.get_variable_passings(NodeValue('/talker', None)) == []
+
+    def test_duplicated_node(self, mocker):
+        architecture_text = """
+nodes:
+- node_name: /talker
+- node_name: /talker
+- node_name: /listener
+        """
+        mocker.patch('builtins.open', mocker.mock_open(read_data=architecture_text))
+        reader = ArchitectureReaderYaml('file_name')
+
+        with pytest.raises(InvalidYamlFormatError):
+            reader.get_publishers(NodeValue('/talker', None))
+        with pytest.raises(InvalidYamlFormatError):
+            reader.get_publishers(NodeValue('/not_exist', None))
+        assert reader.get_publishers(NodeValue('/listener', None)) == []
+
+    def test_cache(self, mocker, tmp_path):
+        architecture_text = 'nodes:\n- node_name: /talker\n'
+        file_path = tmp_path / 'architecture.yaml'
+        file_path.write_text(architecture_text)
+        cache_path = tmp_path / 'architecture.yaml.cache'
+
+        reader = ArchitectureReaderYaml(str(file_path))
+        assert not cache_path.exists()
+
+        reader = ArchitectureReaderYaml(str(file_path), use_cache=True)
+        assert cache_path.exists()
+        assert [n.node_name for n in reader.get_nodes()] == ['/talker']
+
+        load_mock = mocker.spy(yaml, 'load')
+        reader = ArchitectureReaderYaml(str(file_path), use_cache=True)
+        assert load_mock.call_count == 0
+        assert [n.node_name for n in reader.get_nodes()] == ['/talker']
+
+        file_path.write_text(architecture_text + '- node_name: /listener\n')
+        reader = ArchitectureReaderYaml(str(file_path), use_cache=True)
+        assert load_mock.call_count == 1
+        assert [n.node_name for n in reader.get_nodes()] == ['/talker', '/listener']
+
+        cache_path.write_bytes(b'broken')
+        os.utime(file_path, ns=(0, 0))
+        reader = ArchitectureReaderYaml(str(file_path), use_cache=True)
+        assert load_mock.call_count == 2
+        assert [n.node_name for n in reader.get_nodes()] == ['/talker', '/listener']
@@ -0,0 +1,72 @@
+# Copyright 2021 TIER IV, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from caret_analyze.exceptions import InvalidArgumentError
+from caret_analyze.plot.histogram.histogram_plot import HistogramPlot
+from caret_analyze.record import ColumnValue, RecordsFactory
+
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def create_targets(mocker):
+    def _create_targets(latencies_list):
+        targets = []
+        for latencies in latencies_list:
+            data = [{'start': i * 10**9, 'end': i * 10**9 + latency}
+                    if latency is not None else {'start': i * 10**9}
+                    for i, latency in enumerate(latencies)]
+            target = mocker.Mock(_records_version=0)
+            target.to_records.return_value = RecordsFactory.create_instance(
+                data, columns=[ColumnValue('start'), ColumnValue('end')])
+            targets.append(target)
+        return targets
+    return _create_targets
+
+
+class TestHistogramPlot:
+
+    def test_default_bins(self, create_targets):
+        targets = create_targets([[1*10**6, None, 3*10**6], [5*10**6]])
+        hists, bins = HistogramPlot(None, targets, 'latency')._histogram_data(None)
+
+        assert len(bins) == 21
+        assert bins[0] == 1 and bins[-1] == 5
+        assert [sum(hist) for hist in hists] == [2, 1]
+        assert hists[0][0] == 1 and hists[0][10] == 1 and hists[1][-1] == 1
+
+    @pytest.mark.parametrize('edges', [[0, 2, 4, 6], np.array([0., 2., 4., 6.])])
+    def test_bin_edges(self, create_targets, edges):
+        targets = create_targets([[1*10**6, 2*10**6, 7*10**6], [3*10**6]])
+        plot = HistogramPlot(None, targets, 'latency', bins=edges)
+        hists, bins = plot._histogram_data(None)
+
+        assert bins == [0, 2, 4, 6]
+        assert hists == [[1, 1, 0], [0, 1, 0]]
+
+    def test_log_scale(self, create_targets):
+        targets = create_targets([[0, 1*10**6, 10*10**6], [100*10**6]])
+        plot = HistogramPlot(None, targets, 'latency', bins=2, log_scale=True)
+        hists, bins = plot._histogram_data(None)
+
+        assert bins == pytest.approx([1, 10, 100])
+        assert hists == [[1, 1], [0, 1]]
+
+    def test_invalid_argument(self, create_targets):
+        with pytest.raises(InvalidArgumentError):
+            HistogramPlot(None, [], 'latency', bins=0)
+
+        plot = HistogramPlot(None, create_targets([[0]]), 'latency', log_scale=True)
+        with pytest.raises(InvalidArgumentError):
+            plot._histogram_data(None)
@@ -0,0 +1,115 @@
+# Copyright 2021 TIER IV, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from caret_analyze.common import ClockConverter
+from caret_analyze.exceptions import InvalidArgumentError
+from caret_analyze.plot import MetricsCache
+from caret_analyze.record import ColumnValue, Latency, RecordsFactory
+
+import pytest
+
+
+def create_records():
+    return RecordsFactory.create_instance(
+        [{'start': 0, 'end': 2}, {'start': 3, 'end': 4}, {'start': 6, 'end': 9}],
+        columns=[ColumnValue('start'), ColumnValue('end')])
+
+
+class TestMetricsCache:
+
+    def test_get_records(self, mocker):
+        target = mocker.Mock(_records_version=0)
+        target.to_records.return_value = create_records()
+        cache = MetricsCache()
+
+        records = cache._get_records(target)
+        assert cache._get_records(target) is records
+        assert target.to_records.call_count == 1
+
+        # Public getters return copies of the cached records.
+        copied = cache.get_records(target)
+        assert copied is not records
+        copied.drop_columns(['end'])
+        assert cache.get_records(target).columns == ['start', 'end']
+        assert target.to_records.call_count == 1
+
+        target._records_version = 1
+        cache.get_records(target)
+        assert target.to_records.call_count == 2
+
+    def test_get_metrics(self, mocker):
+        target = mocker.Mock(_records_version=0)
+        target.to_records.return_value = create_records()
+        cache = MetricsCache()
+
+        metrics = cache.get_metrics(target, 'latency')
+        assert isinstance(metrics, Latency)
+        assert cache.get_metrics(target, 'latency') is metrics
+        cache.get_metrics(target, 'period')
+        assert target.to_records.call_count == 1
+
+        with pytest.raises(InvalidArgumentError):
+            cache.get_metrics(target, 'unknown')
+
+    def test_get_metrics_records(self, mocker):
+        target = mocker.Mock(_records_version=0)
+        target.to_records.return_value = create_records()
+        cache = MetricsCache()
+
+        latency = cache._get_metrics_records(target, 'latency')
+        assert [record.data for record in latency] == [
+            {'start': 0, 'latency': 2}, {'start': 3, 'latency': 1}, {'start': 6, 'latency': 3}]
+        assert cache._get_metrics_records(target, 'latency') is latency
+
+        converted = cache._get_metrics_records(target, 'latency', ClockConverter(1, 10))
+        assert converted is not latency
+        assert cache._get_metrics_records(target, 'latency', ClockConverter(1, 10)) is converted
+
+        frequency = cache._get_metrics_records(target, 'frequency', interval_ns=2)
+        assert cache._get_metrics_records(target, 'frequency', interval_ns=4) is not frequency
+
+        best = cache._get_metrics_records(target, 'response_time', case='best')
+        assert cache._get_metrics_records(target, 'response_time', case='all') is not best
+
+        copied = cache.get_metrics_records(target, 'latency')
+        assert copied is not latency
+        assert copied.equals(latency)
+        copied.filter_if(lambda record: record.get('latency') > 1)
+        assert len(cache.get_metrics_records(target, 'latency')) == 3
+        with pytest.raises(InvalidArgumentError):
+            cache.get_metrics_records(target, 'response_time', case='unknown')
+
+    def test_lru(self, mocker):
+        targets = [mocker.Mock(_records_version=0) for _ in range(3)]
+        for target in targets:
+            target.to_records.return_value = create_records()
+        cache = MetricsCache(maxsize=2)
+
+        cache.get_records(targets[0])
+        cache.get_records(targets[1])
+        cache.get_records(targets[0])
+        cache.get_records(targets[2])
+        assert len(cache) == 2
+
+        cache.get_records(targets[0])
+        assert targets[0].to_records.call_count == 1
+        cache.get_records(targets[1])
+        assert targets[1].to_records.call_count == 2
+
+        cache.maxsize = 0
+        assert len(cache) == 0
+        cache.get_records(targets[0])
+        assert len(cache) == 0
+
+    def test_default(self):
+        assert MetricsCache.default() is MetricsCache.default()
@@ -90,3 +90,18 @@ class TestFrequencyTimeSeries:
 
         assert min_ts == 0
         assert max_ts == 1
+
+    def test_to_timeseries_records_list_copies(self, mocker):
+        target = mocker.Mock(_records_version=0)
+        target.to_records.return_value = create_expect_records([
+                {'first': 0, 'last': 1},
+                {'first': 5, 'last': 6}
+        ])
+        frequency = FrequencyTimeSeries([target])
+
+        records = frequency.to_timeseries_records_list()[0]
+        expect = [dict(record.data) for record in records]
+        records.drop_columns(['frequency'])
+
+        records = frequency.to_timeseries_records_list()[0]
+        assert [record.data for record in records] == expect
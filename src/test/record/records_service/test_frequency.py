@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from caret_analyze.common import ClockConverter
+from caret_analyze.exceptions import InvalidArgumentError
 from caret_analyze.record import ColumnValue, Frequency, RecordInterface
 from caret_analyze.record.record_factory import RecordsFactory
 
@@ -421,3 +422,31 @@ class TestFrequencyRecords:
         result = to_dict(frequency.to_records(
             interval_ns=10, converter=create_converter.get_converter()))
         assert result == expect_raw
+
+    def test_update_case(self, create_converter):
+        columns = [ColumnValue('timestamp')]
+        records = create_records([
+            {'timestamp': 0},
+            {'timestamp': 1},
+            {'timestamp': 11},
+        ], columns)
+        new_records = create_records([
+            {'timestamp': 12},
+            {'timestamp': 25},
+        ], columns)
+
+        frequency = Frequency(records)
+        frequency.update(new_records, interval_ns=10)
+
+        # The last interval of the previous results is counted again.
+        expect_raw = [
+            {'timestamp': 10, 'frequency': 2},
+            {'timestamp': 20, 'frequency': 1}
+        ]
+        result = to_dict(frequency.to_records(interval_ns=10))
+        assert result == expect_raw
+
+        with pytest.raises(InvalidArgumentError):
+            frequency.to_records(interval_ns=5)
+        with pytest.raises(InvalidArgumentError):
+            frequency.to_records(interval_ns=10, converter=create_converter.get_converter())
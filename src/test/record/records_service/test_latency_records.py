@@ -180,3 +180,22 @@ class TestLatencyRecords:
         ]
         result = to_dict(latency.to_records(converter=create_converter.get_converter()))
         assert result == expect_raw
+
+    def test_update_case(self, create_converter):
+        columns = [ColumnValue('start'), ColumnValue('end')]
+        records = create_records([
+            {'start': 0, 'end': 2},
+        ], columns)
+        new_records = create_records([
+            {'start': 3, 'end': 4},
+            {'start': 11},
+        ], columns)
+
+        latency = Latency(records)
+        latency.update(new_records)
+
+        expect_raw = [
+            {'start': 3, 'latency': 1}
+        ]
+        result = to_dict(latency.to_records())
+        assert result == expect_raw
@@ -0,0 +1,123 @@
+# Copyright 2021 TIER IV, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from caret_analyze.common import ClockConverter
+from caret_analyze.exceptions import InvalidArgumentError
+from caret_analyze.record import ColumnValue, MultiPathResponseTime
+from caret_analyze.record.record_factory import RecordsFactory
+
+import pytest
+
+
+def create_records(records_raw, columns):
+    records = RecordsFactory.create_instance()
+    for column in columns:
+        records.append_column(ColumnValue(column), [])
+
+    for record_raw in records_raw:
+        records.append(record_raw)
+    return records
+
+
+def to_dict(records):
+    return [record.data for record in records]
+
+
+def create_paths():
+    path_a = create_records([
+        {'start': 0, 'end_a': 5},
+        {'start': 10, 'end_a': 12},
+        {'start': 20, 'end_a': 30},
+        {'start': 30, 'end_a': 38},
+    ], ['start', 'end_a'])
+    path_b = create_records([
+        {'start': 0, 'middle_b': 1, 'end_b': 3},
+        {'start': 10, 'middle_b': 11, 'end_b': 16},
+        {'start': 20, 'middle_b': 21},
+        {'start': 30, 'middle_b': 31, 'end_b': 35},
+    ], ['start', 'middle_b', 'end_b'])
+    return [path_a, path_b]
+
+
+class TestMultiPathResponseTime:
+
+    def test_empty_case(self):
+        records = [create_records([], ['start', 'end_a']),
+                   create_records([], ['start', 'end_b'])]
+        response_time = MultiPathResponseTime(records)
+
+        assert to_dict(response_time.to_records()) == []
+        assert response_time.to_critical_path_counts() == {'path0': 0, 'path1': 0}
+
+    def test_all_case(self):
+        response_time = MultiPathResponseTime(create_paths(), names=['a', 'b'])
+
+        # The input 20 of path b has the output of the input 30.
+        expect_raw = [
+            {'start': 10, 'a': 2, 'b': 6, 'critical_path': 1},
+            {'start': 20, 'a': 10, 'b': 15, 'critical_path': 1},
+            {'start': 30, 'a': 8, 'b': 5, 'critical_path': 0},
+        ]
+        assert to_dict(response_time.to_records()) == expect_raw
+        assert response_time.to_critical_path_counts() == {'a': 1, 'b': 2}
+
+    def test_best_case(self):
+        response_time = MultiPathResponseTime(create_paths(), names=['a', 'b'])
+
+        # The input 20 is not the best case of path b.
+        expect_raw = [
+            {'start': 10, 'a': 2, 'b': 6, 'critical_path': 1},
+            {'start': 30, 'a': 8, 'b': 5, 'critical_path': 0},
+        ]
+        assert to_dict(response_time.to_records(case='best')) == expect_raw
+        assert response_time.to_critical_path_counts(case='best') == {'a': 1, 'b': 1}
+
+    def test_converter(self):
+        response_time = MultiPathResponseTime(create_paths())
+        converter = ClockConverter(1.0, 100.0)
+
+        expect_raw = [
+            {'start': 110, 'path0': 2, 'path1': 6, 'critical_path': 1},
+            {'start': 120, 'path0': 10, 'path1': 15, 'critical_path': 1},
+            {'start': 130, 'path0': 8, 'path1': 5, 'critical_path': 0},
+        ]
+        assert to_dict(response_time.to_records(converter=converter)) == expect_raw
+
+    def test_tie_case(self):
+        path_a = create_records([
+            {'start': 0, 'end_a': 1},
+            {'start': 1, 'end_a': 3},
+        ], ['start', 'end_a'])
+        path_b = create_records([
+            {'start': 0, 'end_b': 1},
+            {'start': 1, 'end_b': 3},
+        ], ['start', 'end_b'])
+        response_time = MultiPathResponseTime([path_a, path_b])
+
+        assert response_time.to_critical_path_counts() == {'path0': 1, 'path1': 0}
+
+    def test_invalid_arguments(self):
+        path_a, path_b = create_paths()
+        other_input = create_records([], ['other', 'end_b'])
+
+        with pytest.raises(InvalidArgumentError):
+            MultiPathResponseTime([])
+        with pytest.raises(InvalidArgumentError):
+            MultiPathResponseTime([path_a, other_input])
+        with pytest.raises(InvalidArgumentError):
+            MultiPathResponseTime([path_a, path_b], names=['a'])
+        with pytest.raises(InvalidArgumentError):
+            MultiPathResponseTime([path_a, path_b], names=['a', 'a'])
+        with pytest.raises(InvalidArgumentError):
+            MultiPathResponseTime([path_a, path_b]).to_records(case='unknown')
@@ -245,3 +245,24 @@ class TestPeriodRecords:
         ]
         result = to_dict(period.to_records(converter=create_converter.get_converter()))
         assert result == expect_raw
+
+    def test_update_case(self, create_converter):
+        columns = [ColumnValue('timestamp')]
+        records = create_records([
+            {'timestamp': 0},
+            {'timestamp': 2},
+        ], columns)
+        new_records = create_records([
+            {'timestamp': 5},
+            {'timestamp': 11},
+        ], columns)
+
+        period = Period(records)
+        period.update(new_records)
+
+        expect_raw = [
+            {'timestamp': 2, 'period': 3},
+            {'timestamp': 5, 'period': 6}
+        ]
+        result = to_dict(period.to_records())
+        assert result == expect_raw
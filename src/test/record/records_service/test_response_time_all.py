@@ -15,6 +15,7 @@
 import warnings
 
 from caret_analyze.common import ClockConverter
+from caret_analyze.exceptions import InvalidArgumentError
 from caret_analyze.record import ColumnValue
 from caret_analyze.record import ResponseTime
 from caret_analyze.record.record_factory import RecordsFactory
@@ -1022,3 +1023,120 @@ class TestWorstInInputStackedBar:
         ]
         result = to_dict(response_time.to_worst_case_stacked_bar())
         assert result == expect_raw
+
+
+class TestResponseTimeUpdate:
+
+    def test_update_case(self):
+        columns = [ColumnValue('start'), ColumnValue('end')]
+        records = create_records([
+            {'start': 0, 'end': 2},
+            {'start': 3, 'end': 4},
+            {'start': 5, 'end': 8},
+            {'start': 6},
+        ], columns)
+        new_records = create_records([
+            {'start': 9, 'end': 11},
+            {'start': 12, 'end': 15},
+        ], columns)
+        all_records = create_records([
+            *to_dict(records),
+            *to_dict(new_records),
+        ], columns)
+
+        response_time = ResponseTime(records)
+        full_response_time = ResponseTime(all_records)
+        previous = {
+            'all': to_dict(response_time.to_all_records()),
+            'best': to_dict(response_time.to_best_case_records()),
+            'worst-with-external-latency':
+                to_dict(response_time.to_worst_with_external_latency_case_records()),
+        }
+        response_time.update(new_records)
+
+        # The input 6 without the output is carried over.
+        expect_raw = [
+            {'start': 6, 'response_time': 5},
+            {'start': 9, 'response_time': 2},
+            {'start': 12, 'response_time': 3},
+        ]
+        result = to_dict(response_time.to_all_records())
+        assert result == expect_raw
+        assert previous['all'] + result == to_dict(full_response_time.to_all_records())
+
+        result = to_dict(response_time.to_best_case_records())
+        assert previous['best'] + result == \
+            to_dict(full_response_time.to_best_case_records())
+
+        result = to_dict(response_time.to_worst_with_external_latency_case_records())
+        assert previous['worst-with-external-latency'] + result == \
+            to_dict(full_response_time.to_worst_with_external_latency_case_records())
+
+        stats = ResponseTime(records).to_stats('all')
+        stats.merge(response_time.to_stats('all'))
+        assert stats.count == full_response_time.to_stats('all').count
+
+    @pytest.mark.parametrize(
+        'records_raw, split',
+        [
+            # The input 2 is resolved before the end-less records after the last response.
+            (
+                [
+                    {'start': 2, 'middle': 2, 'end': 2},
+                    {'start': 2, 'middle': 3},
+                    {'start': 7, 'middle': 7},
+                    {'start': 12, 'middle': 12, 'end': 12},
+                ],
+                3
+            ),
+            # The input 8 appears again in the following records.
+            (
+                [
+                    {'start': 1, 'middle': 1, 'end': 3},
+                    {'start': 5, 'middle': 6, 'end': 7},
+                    {'start': 8, 'middle': 9, 'end': 9},
+                    {'start': 8, 'middle': 9, 'end': 14},
+                    {'start': 12, 'middle': 13, 'end': 16},
+                ],
+                3
+            ),
+        ]
+    )
+    def test_update_repeated_input(self, records_raw, split):
+        columns = [ColumnValue('start'), ColumnValue('middle'), ColumnValue('end')]
+        records = create_records(records_raw[:split], columns)
+        new_records = create_records(records_raw[split:], columns)
+        full_response_time = ResponseTime(create_records(records_raw, columns))
+
+        response_time = ResponseTime(records)
+        methods = [
+            'to_all_records',
+            'to_best_case_records',
+            'to_worst_case_records',
+            'to_worst_with_external_latency_case_records',
+        ]
+        previous = {method: to_dict(getattr(response_time, method)()) for method in methods}
+        response_time.update(new_records)
+
+        for method in methods:
+            result = to_dict(getattr(response_time, method)())
+            assert previous[method] + result == \
+                to_dict(getattr(full_response_time, method)())
+
+    def test_update_repeated_output(self):
+        columns = [ColumnValue('start'), ColumnValue('end')]
+        records = create_records([
+            {'start': 0, 'end': 2},
+            {'start': 1, 'end': 5},
+        ], columns)
+        response_time = ResponseTime(records)
+        expect = to_dict(response_time.to_best_case_records())
+
+        # The output 5 is already grouped with the input 1.
+        with pytest.raises(InvalidArgumentError):
+            response_time.update(create_records([{'start': 3, 'end': 5}], columns))
+        assert to_dict(response_time.to_best_case_records()) == expect
+
+        response_time.update(create_records([{'start': 3, 'end': 6}], columns))
+        assert to_dict(response_time.to_best_case_records()) == \
+            [{'start': 3, 'response_time': 3}]
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from caret_analyze.common import ClockConverter
 from caret_analyze.record import ColumnValue
 from caret_analyze.record import RecordsFactory, RecordsInterface
 from caret_analyze.record import StackedBar
@@ -85,6 +86,12 @@ class TestStackedBar:
         with pytest.raises(ValueError):
             StackedBar(records)
 
+    def test_empty_rows_case(self):
+        columns, _, _, _ = get_data_set()
+        records: RecordsInterface = create_records([], columns)
+        with pytest.raises(ValueError):
+            StackedBar(records)
+
     def test_columns(self):
         columns, data, expect_columns, _ = get_data_set()
         records: RecordsInterface = create_records(data, columns)
@@ -99,6 +106,14 @@ class TestStackedBar:
         stacked_bar = StackedBar(records)
         assert stacked_bar.to_dict() == expect_dict
 
+    def test_to_dict_with_converter(self):
+        columns, data, _, expect_dict = get_data_set()
+        records: RecordsInterface = create_records(data, columns)
+        expect_dict['start time'] = [5, 7, 9]
+
+        stacked_bar = StackedBar(records, converter=ClockConverter(2.0, 5.4))
+        assert stacked_bar.to_dict() == expect_dict
+
     def test_records(self):
         columns, data, expect_columns, pre_expect_dict = get_data_set()
         records: RecordsInterface = create_records(data, columns)
@@ -111,5 +126,6 @@ class TestStackedBar:
             expect_dict.append(d)
 
         stacked_bar = StackedBar(records)
+        assert stacked_bar.records.columns == expect_columns
         result = to_dict(stacked_bar.records)
         assert result == expect_dict
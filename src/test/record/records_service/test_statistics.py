@@ -0,0 +1,176 @@
+# Copyright 2021 TIER IV, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import math
+
+from caret_analyze.exceptions import InvalidArgumentError
+from caret_analyze.record import ColumnValue, Latency, Period, ResponseTime
+from caret_analyze.record import QuantileSketch, StreamingStatistics
+from caret_analyze.record.record_factory import RecordsFactory
+
+import numpy as np
+import pytest
+
+
+def create_records(records_raw, columns):
+    records = RecordsFactory.create_instance()
+    for column in columns:
+        records.append_column(column, [])
+
+    for record_raw in records_raw:
+        records.append(record_raw)
+    return records
+
+
+class TestQuantileSketch:
+
+    def test_empty(self):
+        sketch = QuantileSketch()
+        assert sketch.count == 0
+        assert math.isnan(sketch.quantile(0.5))
+
+    def test_relative_accuracy(self):
+        values = np.random.default_rng(0).lognormal(15, 1, 10000).astype(np.int64)
+        sketch = QuantileSketch(0.01)
+        sketch.add(values)
+
+        for q in [0, 0.5, 0.99, 0.999, 1]:
+            expect = np.quantile(values, q, method='lower')
+            assert abs(sketch.quantile(q) - expect) <= expect * 0.01
+
+    def test_zero_and_negative(self):
+        sketch = QuantileSketch(0.01)
+        sketch.add([-100, 0, 0, 100])
+
+        assert sketch.quantile(0) == pytest.approx(-100, rel=0.01)
+        assert sketch.quantile(0.5) == 0
+        assert sketch.quantile(1) == pytest.approx(100, rel=0.01)
+
+    def test_merge(self):
+        values = np.arange(1, 1001)
+        merged = QuantileSketch()
+        merged.add(values[:300])
+        other = QuantileSketch()
+        other.add(values[300:])
+        merged.merge(other)
+
+        whole = QuantileSketch()
+        whole.add(values)
+        assert merged.count == 1000
+        for q in [0.1, 0.5, 0.9]:
+            assert merged.quantile(q) == whole.quantile(q)
+
+    def test_invalid_argument(self):
+        with pytest.raises(InvalidArgumentError):
+            QuantileSketch(0)
+        with pytest.raises(InvalidArgumentError):
+            QuantileSketch(0.01).merge(QuantileSketch(0.02))
+        with pytest.raises(InvalidArgumentError):
+            QuantileSketch().quantile(1.5)
+
+
+class TestStreamingStatistics:
+
+    def test_empty(self):
+        stats = StreamingStatistics()
+        summary = stats.summary()
+
+        assert summary['count'] == 0
+        assert math.isnan(summary['mean [ns]'])
+        assert summary['max [ns]'] is None
+        assert summary['worst_timestamp'] is None
+        assert stats.worst_samples == []
+
+    def test_summary(self):
+        stats = StreamingStatistics(top_k=2)
+        stats.update([10, 40, 20], [0, 1, 2], lambda i: {'index': i})
+        stats.update([40, 30], [3, 4])
+
+        summary = stats.summary(percentiles=[50])
+        assert list(summary) == ['count', 'mean [ns]', 'std [ns]', 'min [ns]',
+                                 'p50 [ns]', 'max [ns]', 'worst_timestamp']
+        assert summary['count'] == 5
+        assert summary['mean [ns]'] == pytest.approx(28)
+        assert summary['std [ns]'] == pytest.approx(np.std([10, 40, 20, 40, 30]))
+        assert summary['min [ns]'] == 10
+        assert summary['p50 [ns]'] == pytest.approx(30, rel=0.01)
+        assert summary['max [ns]'] == 40
+        assert summary['worst_timestamp'] == 1
+        assert stats.worst_samples == [(40, 1, {'index': 1}), (40, 3, {})]
+
+    def test_merge(self):
+        rng = np.random.default_rng(1)
+        values = rng.integers(0, 10**6, 1000)
+        timestamps = np.arange(1000)
+
+        whole = StreamingStatistics(top_k=5)
+        whole.update(values, timestamps)
+        merged = StreamingStatistics(top_k=5)
+        for chunk in range(0, 1000, 300):
+            stats = StreamingStatistics(top_k=5)
+            stats.update(values[chunk:chunk+300], timestamps[chunk:chunk+300])
+            merged.merge(stats)
+
+        assert merged.summary() == pytest.approx(whole.summary())
+        assert merged.worst_samples == whole.worst_samples
+
+
+class TestServiceStats:
+
+    def test_latency(self):
+        columns = [ColumnValue('start'), ColumnValue('end')]
+        records = create_records(
+            [{'start': 0, 'end': 2}, {'start': 3}, {'start': 4, 'end': 9}], columns)
+
+        stats = Latency(records).to_stats(top_k=1)
+        assert stats.count == 2
+        assert stats.max == 5
+        assert stats.worst_samples == [(5, 4, {'start': 4, 'end': 9})]
+
+    def test_period(self):
+        columns = [ColumnValue('start')]
+        records = create_records([{'start': 0}, {'start': 2}, {'start': 7}], columns)
+
+        stats = Period(records).to_stats(top_k=1)
+        assert stats.count == 2
+        assert stats.worst_samples == [(5, 2, {'start': 7})]
+
+    def test_response_time(self):
+        columns = [ColumnValue('start'), ColumnValue('middle'), ColumnValue('end')]
+        records_raw = [
+            {'start': 0, 'middle': 1, 'end': 2},
+            {'start': 3, 'middle': 4},
+            {'start': 5, 'middle': 6, 'end': 10},
+            {'start': 11, 'middle': 12, 'end': 13},
+        ]
+        records = create_records(records_raw, columns)
+        response_time = ResponseTime(records, columns=['start', 'middle', 'end'])
+
+        to_records = {
+            'all': response_time.to_all_records,
+            'best': response_time.to_best_case_records,
+            'worst': response_time.to_worst_case_records,
+            'worst-with-external-latency':
+                response_time.to_worst_with_external_latency_case_records,
+        }
+        for case, to_records_func in to_records.items():
+            expect = [record.data['response_time'] for record in to_records_func()]
+            stats = response_time.to_stats(case, top_k=1)
+            assert stats.count == len(expect)
+            assert stats.max == max(expect)
+
+        stats = response_time.to_stats('worst', top_k=1)
+        assert stats.worst_samples == [(7, 3, {'start': 3, 'middle': 4})]
+
+        with pytest.raises(InvalidArgumentError):
+            response_time.to_stats('unknown')
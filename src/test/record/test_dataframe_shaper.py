@@ -77,6 +77,15 @@ class TestStrip:
         expect_df = pd.DataFrame([], columns=['a'])
         assert df_stripped.equals(expect_df)
 
+    def test_to_clip_with_range(self):
+        strip = Strip(lstrip_s=0.3, rstrip_s=0.1)
+        clip = strip.to_clip_with_range(1_000_000_000, 2_000_000_000)
+
+        assert clip.min_ns == 1_300_000_000
+        assert clip.max_ns == 1_900_000_000
+        assert isinstance(clip.min_ns, int)
+        assert isinstance(clip.max_ns, int)
+
 
 class TestClip:
 
@@ -22,6 +22,7 @@ from caret_analyze.record.column import Columns, ColumnValue
 from caret_analyze.record.record import (merge, Record, RecordInterface, Records,
                                          RecordsInterface)
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -554,6 +555,60 @@ class TestRecords:
             with pytest.raises(InvalidArgumentError):
                 records.get_column_series('x')
 
+    def test_get_column_array(self):
+        records_py: Records = Records(
+            [
+                Record({'a': 0, 'b': 1}),
+                Record({'b': 3}),
+                Record({'a': 5}),
+            ],
+            [ColumnValue('a'), ColumnValue('b'), ColumnValue('c')]
+        )
+        records_cpp = to_cpp_records(records_py)
+
+        for records in [records_py, records_cpp]:
+            if records is None and not CppImplEnabled:
+                continue
+
+            a = records.get_column_array('a')
+            assert a.dtype == np.float64
+            np.testing.assert_array_equal(a, [0, np.nan, 5])
+            np.testing.assert_array_equal(records.get_column_array('b'), [1, 3, np.nan])
+            assert len(records.get_column_array('c')) == 3
+
+            with pytest.raises(InvalidArgumentError):
+                records.get_column_array('x')
+
+    def test_get_column_range(self):
+        records_py: Records = Records(
+            [
+                Record({'a': 3, 'b': 1}),
+                Record({'a': 0}),
+                Record({'a': 5}),
+            ],
+            [ColumnValue('a'), ColumnValue('b'), ColumnValue('c')]
+        )
+        records_cpp = to_cpp_records(records_py)
+
+        for records in [records_py, records_cpp]:
+            if records is None and not CppImplEnabled:
+                continue
+
+            assert records.get_column_range('a') == (0, 5)
+            assert records.get_column_range('b') == (1, 1)
+            assert records.get_column_range('c') is None
+
+            with pytest.raises(InvalidArgumentError):
+                records.get_column_range('x')
+
+            # The cached range is updated by modifications.
+            records.append({'a': 10, 'b': 0})
+            assert records.get_column_range('a') == (0, 10)
+            records.filter_if(lambda record: record.get('a') < 5)
+            assert records.get_column_range('a') == (0, 3)
+            records.rename_columns({'a': 'a_'})
+            assert records.get_column_range('a_') == (0, 3)
+
     def test_get_row_series(self):
         records_py: Records = Records(
             [
@@ -0,0 +1,39 @@
+# Copyright 2021 TIER IV, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from caret_analyze.exceptions import InvalidArgumentError
+from caret_analyze.record.record_factory import RecordsFactory
+
+import numpy as np
+import pytest
+
+
+class TestRecordsFactory:
+
+    def test_create_instance_from_arrays(self):
+        records = RecordsFactory.create_instance_from_arrays(
+            {'a': np.array([0, 1]), 'b': [2, 3]})
+
+        assert records.columns == ['a', 'b']
+        assert [record.data for record in records] == [{'a': 0, 'b': 2}, {'a': 1, 'b': 3}]
+
+    def test_create_instance_from_arrays_empty(self):
+        records = RecordsFactory.create_instance_from_arrays({'a': [], 'b': []})
+
+        assert records.columns == ['a', 'b']
+        assert len(records) == 0
+
+    def test_create_instance_from_arrays_different_lengths(self):
+        with pytest.raises(InvalidArgumentError):
+            RecordsFactory.create_instance_from_arrays({'a': [0, 1], 'b': [2]})
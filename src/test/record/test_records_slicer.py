@@ -0,0 +1,82 @@
+# Copyright 2021 TIER IV, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from caret_analyze.record import ColumnValue, Record, Records, RecordsSlicer
+
+
+class TestRecordsSlicer:
+
+    def test_empty(self):
+        records = Records(None, [ColumnValue('start'), ColumnValue('end')])
+        slicer = RecordsSlicer(records)
+
+        assert slicer.time_range is None
+        assert slicer.count(0, 10) == 0
+        sliced = slicer.slice(0, 10)
+        assert len(sliced) == 0
+        assert sliced.columns == ['start', 'end']
+
+    def test_slice(self):
+        records = Records(
+            [
+                Record({'start': 5, 'end': 6}),
+                Record({'start': 1, 'end': 2}),
+                Record({'end': 3}),
+                Record({'start': 3, 'end': 4}),
+            ],
+            [ColumnValue('start'), ColumnValue('end')]
+        )
+        slicer = RecordsSlicer(records)
+
+        assert slicer.time_range == (1, 5)
+        assert slicer.count(1, 3) == 2
+
+        expected = Records(
+            [
+                Record({'start': 1, 'end': 2}),
+                Record({'start': 3, 'end': 4}),
+            ],
+            [ColumnValue('start'), ColumnValue('end')]
+        )
+        assert slicer.slice(1, 3).equals(expected)
+        assert slicer.slice(6, 10).equals(
+            Records(None, [ColumnValue('start'), ColumnValue('end')]))
+
+    def test_slice_copies_records(self):
+        records = Records(
+            [Record({'start': 1, 'end': 2})],
+            [ColumnValue('start'), ColumnValue('end')]
+        )
+        slicer = RecordsSlicer(records)
+
+        sliced = slicer.slice(0, 10)
+        sliced.rename_columns({'start': 'start_'})
+
+        assert records.columns == ['start', 'end']
+        assert records.data[0].data == {'start': 1, 'end': 2}
+
+    def test_column(self):
+        records = Records(
+            [
+                Record({'start': 1, 'end': 8}),
+                Record({'start': 3, 'end': 4}),
+            ],
+            [ColumnValue('start'), ColumnValue('end')]
+        )
+        slicer = RecordsSlicer(records, 'end')
+
+        assert slicer.time_range == (4, 8)
+        assert slicer.slice(0, 5).equals(
+            Records([Record({'start': 3, 'end': 4})],
+                    [ColumnValue('start'), ColumnValue('end')]))
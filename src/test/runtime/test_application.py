@@ -14,8 +14,10 @@
 
 
 from caret_analyze.architecture.architecture import Architecture
+from caret_analyze.common import Util
 from caret_analyze.exceptions import ItemNotFoundError
 from caret_analyze.infra.lttng import Lttng
+from caret_analyze.infra.lttng.records_provider_lttng import RecordsProviderLttng
 from caret_analyze.runtime.application import Application
 from caret_analyze.runtime.callback import CallbackBase
 from caret_analyze.runtime.communication import Communication
@@ -24,7 +26,9 @@ from caret_analyze.runtime.node import Node
 from caret_analyze.runtime.node_path import NodePath
 from caret_analyze.runtime.path import Path
 from caret_analyze.runtime.runtime_loaded import RuntimeLoaded
+from caret_analyze.value_objects import CallbackStructValue
 
+import pandas as pd
 import pytest
 
 
@@ -61,6 +65,37 @@ class TestApplication:
         with pytest.raises(ItemNotFoundError):
             app.get_communication('', '', '')
 
+    def test_callback_latency_summary(self, mocker):
+        arch_mock = mocker.Mock(spec=Architecture)
+        provider_mock = mocker.Mock(spec=RecordsProviderLttng)
+        mocker.patch('caret_analyze.runtime.application.RecordsProviderLttng',
+                     return_value=provider_mock)
+
+        node_mock = mocker.Mock(spec=Node)
+        callback_mock = mocker.Mock(spec=CallbackBase)
+        callback_value_mock = mocker.Mock(spec=CallbackStructValue)
+        mocker.patch.object(callback_mock, 'callback_name', 'callback')
+        mocker.patch.object(callback_mock, 'value', callback_value_mock)
+        mocker.patch.object(node_mock, 'node_name', 'node')
+        mocker.patch.object(node_mock, 'callbacks', [callback_mock])
+
+        assigned_mock = mocker.Mock(spec=RuntimeLoaded)
+        mocker.patch.object(assigned_mock, 'nodes', [node_mock])
+        mocker.patch.object(assigned_mock, 'executors', [])
+        mocker.patch.object(assigned_mock, 'paths', [])
+        mocker.patch.object(assigned_mock, 'communications', [])
+        mocker.patch(
+            'caret_analyze.runtime.runtime_loaded.RuntimeLoaded', return_value=assigned_mock)
+
+        summary_mock = mocker.Mock(spec=pd.DataFrame)
+        mocker.patch.object(
+            provider_mock, 'callback_latency_summary', return_value=summary_mock)
+
+        app = Application(arch_mock, mocker.Mock(spec=Lttng))
+        assert app.callback_latency_summary([50]) == summary_mock
+        provider_mock.callback_latency_summary.assert_called_once_with(
+            [callback_value_mock], [50])
+
     def test_full_architecture(self, mocker):
         # define mocks
         arch_mock = mocker.Mock(spec=Architecture)
@@ -198,3 +233,112 @@ class TestApplication:
         assert app.get_callbacks('*') == [callback_mock0, callback_mock1]
         assert app.get_callbacks('cbb*') == []
         assert app.get_callbacks('cb_?') == [callback_mock1]
+
+    def test_get_node_uses_index(self, mocker):
+        arch_mock = mocker.Mock(spec=Architecture)
+        records_provider_mock = mocker.Mock(spec=Lttng)
+
+        node_mock = mocker.Mock(spec=Node)
+        mocker.patch.object(node_mock, 'node_name', '/AAA/BBB/CCC')
+        mocker.patch.object(node_mock, 'callbacks', [])
+        records_assigned_mock = mocker.Mock(spec=RuntimeLoaded)
+        mocker.patch.object(records_assigned_mock, 'nodes', [node_mock])
+        mocker.patch.object(records_assigned_mock, 'executors', [])
+        mocker.patch.object(records_assigned_mock, 'paths', [])
+        mocker.patch.object(records_assigned_mock, 'communications', [])
+        mocker.patch('caret_analyze.runtime.runtime_loaded.RuntimeLoaded',
+                     return_value=records_assigned_mock)
+
+        app = Application(arch_mock, records_provider_mock)
+
+        find_mock = mocker.spy(Util, 'find_similar_one')
+        assert app.get_node('/AAA/BBB/CCC') == node_mock
+        assert find_mock.call_count == 0
+
+        with pytest.raises(ItemNotFoundError) as e:
+            app.get_node('/AAA/BBB/CCD')
+        assert '/AAA/BBB/CCC' in str(e.value)
+        assert find_mock.call_count == 1
+
+    def test_update_architecture(self, mocker, tmp_path):
+        architecture_text = """
+named_paths: []
+executors: []
+nodes:
+- node_name: /ping_node
+  callback_groups:
+    - callback_group_type: mutually_exclusive
+      callback_group_name: /ping_node/callback_group_0
+      callback_names:
+        - timer_callback_0
+  callbacks:
+    - callback_name: timer_callback_0
+      callback_type: timer_callback
+      period_ns: 1
+      symbol: timer_symbol
+  publishes:
+    - topic_name: /ping
+      callback_names:
+        - timer_callback_0
+- node_name: /pong_node
+  callback_groups:
+    - callback_group_type: mutually_exclusive
+      callback_group_name: /pong_node/callback_group_0
+      callback_names:
+        - subscription_callback_0
+  callbacks:
+    - callback_name: subscription_callback_0
+      callback_type: subscription_callback
+      topic_name: /ping
+      symbol: sub_symbol
+  subscribes:
+    - topic_name: /ping
+      callback_name: subscription_callback_0
+  publishes:
+    - topic_name: /pong
+      callback_names:
+        - subscription_callback_0
+"""
+        file_path = tmp_path / 'architecture.yaml'
+        file_path.write_text(architecture_text)
+        arch = Architecture('yaml', str(file_path))
+        arch.add_path('target', arch.search_paths('/ping_node', '/pong_node')[0])
+
+        mocker.patch.object(
+            RecordsProviderLttng, 'is_intra_process_communication', return_value=False)
+        app = Application(arch, mocker.Mock(spec=Lttng))
+        ping_node = app.get_node('/ping_node')
+        pong_node = app.get_node('/pong_node')
+        comm = app.get_communication('/ping_node', '/pong_node', '/ping')
+        node_path = self._find_node_path(pong_node, '/ping', None)
+
+        arch.update_message_context('/pong_node', 'use_latest_message', '/ping', '/pong')
+        app.update_architecture(arch)
+
+        assert app.get_node('/ping_node') is ping_node
+        assert app.get_node('/pong_node') is not pong_node
+        updated = self._find_node_path(app.get_node('/pong_node'), '/ping', '/pong')
+        assert updated.message_context is not None
+        assert self._find_node_path(app.get_node('/pong_node'), '/ping', None) is node_path
+        # Elements referring to the edited node are rebuilt,
+        # while unchanged node paths are kept with their record caches.
+        assert app.get_communication('/ping_node', '/pong_node', '/ping') is not comm
+        path = app.get_path('target')
+        assert path.child[0] is ping_node.paths[0]
+        assert path.child[-1] is node_path
+
+        arch.rename_path('target', 'renamed')
+        app.update_architecture(arch)
+
+        renamed = app.get_path('renamed')
+        assert renamed is not path
+        assert all(x is y for x, y in zip(renamed.child, path.child))
+        with pytest.raises(ItemNotFoundError):
+            app.get_path('target')
+
+    @staticmethod
+    def _find_node_path(node, subscribe_topic_name, publish_topic_name):
+        return Util.find_one(
+            lambda x: x.subscribe_topic_name == subscribe_topic_name and
+            x.publish_topic_name == publish_topic_name,
+            node.paths)
@@ -14,13 +14,13 @@
 
 from caret_analyze.exceptions import InvalidArgumentError
 from caret_analyze.infra import RecordsProvider
-from caret_analyze.record import Record, Records
+from caret_analyze.record import Clip, Record, Records, RecordsSlicer
 from caret_analyze.record.column import ColumnValue
 from caret_analyze.record.interface import RecordsInterface
 from caret_analyze.runtime.callback import CallbackBase
 from caret_analyze.runtime.communication import Communication
 from caret_analyze.runtime.node_path import NodePath
-from caret_analyze.runtime.path import ColumnMerger, Path, RecordsMerged
+from caret_analyze.runtime.path import ColumnMerger, Path, RecordsMerged, RecordsMergedWindows
 from caret_analyze.value_objects import NodePathStructValue, PathStructValue
 
 import pytest
@@ -573,3 +573,111 @@ class TestRecordsMerged:
             ]
         )
         assert records.equals(expected)
+
+
+class TestRecordsMergedWindows:
+
+    @staticmethod
+    def _create_targets(mocker):
+        cb_records = Records(
+            [
+                Record({'callback_start': 0, 'pub': 2}),
+                Record({'callback_start': 6, 'pub': 8}),
+                Record({'callback_start': 12, 'pub': 14}),
+            ],
+            [
+                ColumnValue('callback_start'),
+                ColumnValue('pub'),
+            ]
+        )
+        node_path_0 = mocker.Mock(spec=NodePath)
+        mocker.patch.object(
+            node_path_0, 'to_records', side_effect=lambda: cb_records.clone())
+        node_path_1 = mocker.Mock(spec=NodePath)
+        mocker.patch.object(
+            node_path_1, 'to_records', side_effect=lambda: cb_records.clone())
+
+        comm_records = Records(
+            [
+                Record({'pub': 2, 'callback_start': 6}),
+                Record({'pub': 8, 'callback_start': 12}),
+            ],
+            [
+                ColumnValue('pub'),
+                ColumnValue('callback_start'),
+            ]
+        )
+        comm_path = mocker.Mock(spec=Communication)
+        mocker.patch.object(
+            comm_path, 'to_records', side_effect=lambda: comm_records.clone())
+
+        return [node_path_0, comm_path, node_path_1]
+
+    def test_empty(self):
+        with pytest.raises(InvalidArgumentError):
+            RecordsMergedWindows([])
+
+    def test_time_range(self, mocker):
+        merged = RecordsMergedWindows(self._create_targets(mocker))
+        assert merged.time_range == (0, 12)
+
+    def test_windows_equal_to_full_merge(self, mocker):
+        targets = self._create_targets(mocker)
+        expected = RecordsMerged(targets).data
+
+        merged = RecordsMergedWindows(targets, margin_ns=10)
+        chunks = list(merged.iter_records(window_ns=6))
+        assert [len(chunk) for chunk in chunks] == [1, 1, 1]
+
+        records = chunks[0]
+        for chunk in chunks[1:]:
+            records.concat(chunk)
+        assert records.equals(expected)
+
+    def test_margin(self, mocker):
+        merged = RecordsMergedWindows(self._create_targets(mocker), margin_ns=0)
+        chunks = list(merged.iter_records(window_ns=6))
+
+        # The next node path starts after the window, so it is not merged.
+        assert chunks[0].data[0].data == {
+            'callback_start/0': 0, 'pub/0': 2, 'callback_start/1': 6,
+        }
+
+    def test_range(self, mocker):
+        merged = RecordsMergedWindows(self._create_targets(mocker), margin_ns=10)
+        chunks = list(merged.iter_records(window_ns=100, min_ns=1, max_ns=6))
+
+        assert len(chunks) == 1
+        assert chunks[0].get_column_series('callback_start/0') == [6]
+
+    def test_path_iter_dataframe(self, mocker):
+        path_info_mock = mocker.Mock(spec=PathStructValue)
+        path = Path(path_info_mock, self._create_targets(mocker), None)
+
+        dfs = list(path.iter_dataframe(window_s=100.0e-9, shaper=Clip(6, 12)))
+
+        assert len(dfs) == 1
+        assert list(dfs[0]['callback_start/0']) == [6, 12]
+        assert list(dfs[0].columns) == [
+            'callback_start/0', 'pub/0', 'callback_start/1', 'pub/1'
+        ]
+
+    def test_path_to_dataframe_time_range_pushdown(self, mocker):
+        targets = self._create_targets(mocker)
+        for target in targets:
+            mocker.patch.object(
+                target, '_records_in_range',
+                side_effect=lambda min_ns, max_ns, target=target:
+                    RecordsSlicer(target.to_records()).slice(min_ns, max_ns))
+        path_info_mock = mocker.Mock(spec=PathStructValue)
+        path = Path(path_info_mock, targets, None)
+        mocker.patch.object(path, '_verify_path', return_value=True)
+        expected = path.to_dataframe(lstrip_s=1.0e-9, shaper=Clip(0, 6))
+
+        mocker.patch.object(path, '_to_records_core', side_effect=AssertionError)
+        path.clear_cache()
+        df = path.to_dataframe(lstrip_s=1.0e-9, shaper=Clip(0, 6), max_latency_s=10.0e-9)
+
+        assert df.equals(expected)
+        assert list(df['callback_start/0']) == [6]
+        targets[0]._records_in_range.assert_called_with(-9, 16)
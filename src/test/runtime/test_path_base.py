@@ -15,7 +15,8 @@
 
 from __future__ import annotations
 
-from caret_analyze.record import Records, RecordsInterface
+from caret_analyze.record import (Clip, ColumnValue, Record, Records, RecordsInterface,
+                                  RecordsSlicer)
 from caret_analyze.runtime.path_base import PathBase
 
 
@@ -32,6 +33,33 @@ class PathSample(PathBase):
         return []
 
 
+class RangedPathSample(PathBase):
+
+    def __init__(self, records: RecordsInterface) -> None:
+        super().__init__()
+        self._records = records
+
+    def _to_records_core(self) -> RecordsInterface:
+        return self._records.clone()
+
+    def _to_records_in_range(
+        self,
+        min_ns: int | None,
+        max_ns: int | None
+    ) -> RecordsInterface | None:
+        return RecordsSlicer(self._records).slice(min_ns, max_ns)
+
+    def _input_time_range(self) -> tuple[int, int] | None:
+        return RecordsSlicer(self._records).time_range
+
+
+def create_records() -> RecordsInterface:
+    return Records(
+        [Record({'start': i * 10, 'end': i * 10 + 3}) for i in range(10)],
+        [ColumnValue('start'), ColumnValue('end')]
+    )
+
+
 class TestPathBase:
 
     def test_cache(self, mocker):
@@ -49,3 +77,38 @@ class TestPathBase:
         path.clear_cache()
         path.to_records()
         assert path._to_records_core.call_count == 2  # type: ignore
+
+    def test_to_dataframe_time_range_pushdown(self, mocker):
+        path = RangedPathSample(create_records())
+        expected = path.to_dataframe(shaper=Clip(20, 50))
+
+        path.clear_cache()
+        mocker.patch.object(path, '_to_records_core', side_effect=path._to_records_core)
+        mocker.patch.object(
+            path, '_to_records_in_range', side_effect=path._to_records_in_range)
+        df = path.to_dataframe(shaper=Clip(20, 50), max_latency_s=5e-9)
+
+        assert df.equals(expected)
+        path._to_records_core.assert_not_called()  # type: ignore
+        path._to_records_in_range.assert_called_once_with(15, 55)  # type: ignore
+
+    def test_to_dataframe_time_range_pushdown_strip(self, mocker):
+        path = RangedPathSample(create_records())
+        expected = path.to_dataframe(lstrip_s=20e-9, rstrip_s=10e-9, shaper=Clip(0, 60))
+
+        path.clear_cache()
+        mocker.patch.object(path, '_to_records_core', side_effect=path._to_records_core)
+        df = path.to_dataframe(
+            lstrip_s=20e-9, rstrip_s=10e-9, shaper=Clip(0, 60), max_latency_s=5e-9)
+
+        assert df.equals(expected)
+        path._to_records_core.assert_not_called()  # type: ignore
+
+    def test_to_dataframe_time_range_unsupported(self, mocker):
+        records = create_records()
+        path = PathSample()
+        mocker.patch.object(path, '_to_records_core', return_value=records)
+        mocker.patch.object(PathSample, 'column_names', ['start', 'end'])
+
+        df = path.to_dataframe(shaper=Clip(20, 50), max_latency_s=1.0)
+        assert list(df['start']) == [20, 30, 40, 50]
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import pickle
+
 from caret_analyze.value_objects.value_object import ValueObject
 
 import pytest
@@ -99,3 +101,31 @@ class TestValueObject:
 
         a = SampleClassC(1, '2', 3)
         assert str(a) == dump({'p': 3, 'v': {'i': 1, 's': '2'}})
+
+    def test_eq_identical(self):
+        a = SampleClassC(1, '1', 1)
+        assert a == a
+        assert a == SampleClassC(1, '1', 1)
+        assert a != SampleClassC(1, '1', 2)
+
+    def test_hash_cache(self, mocker):
+        a = SampleClassA(1, '1', 1)
+        expected = hash(a)
+
+        getmembers_mock = mocker.patch('inspect.getmembers')
+        assert hash(a) == expected
+        getmembers_mock.assert_not_called()
+
+    def test_intern(self):
+        a = SampleClassC(1, '1', 1).intern()
+        assert SampleClassC(1, '1', 1).intern() is a
+        assert SampleClassC(1, '1', 2).intern() is not a
+        assert SampleClassA(1, '1', 1).intern() is not SampleClassB(1, '1', 1).intern()
+
+    def test_pickle(self):
+        a = SampleClassC(1, '1', 1)
+        hash(a)
+        b = pickle.loads(pickle.dumps(a))
+        assert not hasattr(b, '_hash_cache')
+        assert a == b
+        assert hash(a) == hash(b)